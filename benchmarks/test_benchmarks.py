@@ -1,13 +1,35 @@
+import pickle
+import tracemalloc
 from itertools import pairwise
+from typing import TYPE_CHECKING
 
 import numpy as np
 import pytest
-from numpy.testing import assert_equal
-
-from pyjobshop import Model, solve
+from numpy.testing import assert_, assert_equal
+
+from pyjobshop import (
+    Constraints,
+    EndBeforeStart,
+    Job,
+    Machine,
+    Mode,
+    Model,
+    Objective,
+    ProblemData,
+    SetupTime,
+    Task,
+    TimingConstraints,
+    sgs,
+    solve,
+    solve_lns,
+)
 from pyjobshop.constants import MAX_VALUE
+from pyjobshop.solvers.ortools import CPModel
 from tests.utils import read
 
+if TYPE_CHECKING:
+    from pyjobshop.ProblemData import Resource
+
 
 def test_jsp_lawrence(benchmark, solver):
     """
@@ -249,3 +271,450 @@ def test_aslib(benchmark, solver):
 
     result = benchmark(solve, data, solver=solver, time_limit=10)
     assert_equal(result.objective, 100)
+
+
+def test_build_many_resources(benchmark):
+    """
+    Benchmarks building the OR-Tools model of an instance with many resources.
+    The resource constraints should be built in time linear in the number of
+    task-resource pairs, rather than in the number of resources times the
+    number of task-resource pairs.
+    """
+    num_machines, num_renewables, num_tasks = 1_000, 200, 2_000
+    rng = np.random.default_rng(1)
+
+    model = Model()
+    machines = [model.add_machine() for _ in range(num_machines)]
+    renewables = [model.add_renewable(2) for _ in range(num_renewables)]
+
+    for _ in range(num_tasks):
+        task = model.add_task()
+
+        for idx in rng.choice(num_machines, size=2, replace=False):
+            renewable = renewables[rng.integers(num_renewables)]
+            duration = int(rng.integers(1, 10))
+            model.add_mode(task, [machines[idx], renewable], duration, [0, 1])
+
+    data = model.data()
+    variables = benchmark(CPModel, data).variables
+    num_assign = sum(
+        len(variables.res2assign(idx)) for idx in range(data.num_resources)
+    )
+    assert_equal(num_assign, len(variables.assign_vars))
+
+
+def test_build_break_calendars(benchmark):
+    """
+    Benchmarks building the OR-Tools model of an instance where resources
+    have shift calendars with many breaks. Modes sharing the same breaks and
+    duration should compute the start time partitions only once.
+    """
+    num_days, num_machines, num_tasks = 600, 4, 500
+    rng = np.random.default_rng(1)
+
+    # Two shifts per day, with a break between the shifts and during the
+    # night. Each machine has a different calendar.
+    model = Model()
+    machines = []
+    for offset in range(num_machines):
+        breaks = [
+            (24 * day + offset + 12, 24 * day + offset + 13)
+            for day in range(num_days)
+        ]
+        breaks += [
+            (24 * day + offset + 20, 24 * (day + 1) + offset + 4)
+            for day in range(num_days)
+        ]
+        machines.append(model.add_machine(breaks=sorted(breaks)))
+
+    for _ in range(num_tasks):
+        task = model.add_task(allow_breaks=True)
+        duration = int(rng.choice([4, 8]))
+
+        for machine in machines:
+            model.add_mode(task, machine, duration)
+
+    data = model.data()
+    variables = benchmark(CPModel, data).variables
+    assert_equal(len(variables.break_vars), num_tasks * num_machines)
+
+
+@pytest.mark.parametrize("num_tasks", [1_000, 10_000, 100_000])
+def test_validate_problem_data(benchmark, num_tasks: int):
+    """
+    Benchmarks constructing (and thus validating) problem data instances of
+    increasing size, with three modes per task.
+    """
+    num_machines = 100
+    rng = np.random.default_rng(1)
+
+    jobs = [Job(tasks=[idx]) for idx in range(num_tasks)]
+    machines = [Machine() for _ in range(num_machines)]
+    tasks = [Task(job=idx) for idx in range(num_tasks)]
+    modes = [
+        Mode(task, [int(res)], int(duration))
+        for task in range(num_tasks)
+        for res, duration in zip(
+            rng.choice(num_machines, size=3, replace=False),
+            rng.integers(1, 10, size=3),
+        )
+    ]
+    precedences = [
+        EndBeforeStart(int(idx1), int(idx2))
+        for idx1, idx2 in rng.integers(num_tasks, size=(num_tasks, 2))
+    ]
+    constraints = Constraints(end_before_start=precedences)
+
+    data = benchmark(ProblemData, jobs, machines, tasks, modes, constraints)
+    assert_equal(data.num_modes, 3 * num_tasks)
+
+
+def test_replace_objective(benchmark):
+    """
+    Benchmarks replacing only the objective of a large problem instance,
+    which should share all unchanged data and derived indexes.
+    """
+    num_tasks = 100_000
+    num_machines = 100
+    rng = np.random.default_rng(1)
+
+    jobs = [Job(tasks=[idx]) for idx in range(num_tasks)]
+    machines = [Machine() for _ in range(num_machines)]
+    tasks = [Task(job=idx) for idx in range(num_tasks)]
+    modes = [
+        Mode(task, [int(res)], int(duration))
+        for task, (res, duration) in enumerate(
+            zip(
+                rng.integers(num_machines, size=num_tasks),
+                rng.integers(1, 10, size=num_tasks),
+            )
+        )
+    ]
+    data = ProblemData(jobs, machines, tasks, modes)
+
+    objective = Objective(weight_total_flow_time=1)
+    new = benchmark(data.replace, objective=objective)
+    assert_(new.modes is data.modes)
+
+
+@pytest.mark.parametrize(
+    ("name", "make"),
+    [
+        ("task", lambda idx: Task(job=idx)),
+        ("mode", lambda idx: Mode(idx, [0], 1)),
+        ("constraint", lambda idx: SetupTime(0, idx, idx + 1, 1)),
+    ],
+)
+def test_record_memory(benchmark, name: str, make):
+    """
+    Benchmarks creating many tasks, modes and constraint records, and reports
+    the memory used per record as measured by ``tracemalloc`` in the extra
+    info of the benchmark.
+    """
+    num_records = 100_000
+
+    tracemalloc.start()
+    records = [make(idx) for idx in range(num_records)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    benchmark.extra_info["bytes_per_record"] = size / num_records
+
+    # Records are slotted, so they do not carry an instance dictionary.
+    assert_(not hasattr(records[0], "__dict__"))
+    benchmark(lambda: [make(idx) for idx in range(num_records)])
+
+
+@pytest.mark.parametrize("storage", ["objects", "arrays"])
+def test_build_timing_constraints(benchmark, storage: str):
+    """
+    Benchmarks building a problem instance with many timing constraints,
+    either from constraint objects or in bulk from a NumPy array. Also reports
+    the memory used per timing constraint as measured by ``tracemalloc`` in
+    the extra info of the benchmark.
+    """
+    num_tasks, num_edges = 10_000, 200_000
+    rng = np.random.default_rng(1)
+    edges = rng.integers(num_tasks, size=(num_edges, 3))
+
+    machines = [Machine()]
+    tasks = [Task() for _ in range(num_tasks)]
+    modes = [Mode(idx, [0], 1) for idx in range(num_tasks)]
+
+    def make_timing():
+        if storage == "objects":
+            return [EndBeforeStart(*edge) for edge in edges.tolist()]
+
+        return TimingConstraints(EndBeforeStart, edges)
+
+    tracemalloc.start()
+    timing = make_timing()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    benchmark.extra_info["bytes_per_constraint"] = size / num_edges
+
+    assert_equal(len(timing), num_edges)
+
+    def build():
+        constraints = Constraints(end_before_start=make_timing())
+        return ProblemData([], machines, tasks, modes, constraints)
+
+    data = benchmark(build)
+    assert_equal(data.arrays.precedences["end_before_start"], edges)
+
+
+def test_build_model_in_bulk(benchmark):
+    """
+    Benchmarks building a large flexible job shop instance using the bulk
+    adders of the model, with index arrays as input.
+    """
+    num_jobs, num_machines, num_ops = 20_000, 100, 10
+    num_tasks = num_jobs * num_ops
+    rng = np.random.default_rng(1)
+
+    task_jobs = np.repeat(np.arange(num_jobs), num_ops)
+    mode_tasks = np.repeat(np.arange(num_tasks), 2)
+    mode_machines = rng.integers(num_machines, size=2 * num_tasks)
+    durations = rng.integers(1, 10, size=2 * num_tasks)
+    tasks = np.arange(num_tasks).reshape(num_jobs, num_ops)
+
+    def build():
+        model = Model()
+        model.add_jobs(num_jobs)
+        model.add_machines(num_machines)
+        model.add_tasks(num_tasks, task_jobs)
+        model.add_modes(mode_tasks, mode_machines, durations)
+        model.add_end_before_start_many(tasks[:, :-1], tasks[:, 1:])
+        return model
+
+    model = benchmark(build)
+    assert_equal(len(model.constraints.end_before_start), num_jobs * 9)
+
+
+def test_model_from_data(benchmark):
+    """
+    Benchmarks creating a model from a large problem instance and retrieving
+    its data twice, which should reuse the first data instance.
+    """
+    num_tasks, num_machines = 100_000, 100
+    rng = np.random.default_rng(1)
+
+    jobs = [Job(tasks=[idx]) for idx in range(num_tasks)]
+    machines = [Machine() for _ in range(num_machines)]
+    tasks = [Task(job=idx) for idx in range(num_tasks)]
+    modes = [
+        Mode(idx, [int(res)], 1)
+        for idx, res in enumerate(rng.integers(num_machines, size=num_tasks))
+    ]
+    edges = np.column_stack(
+        [np.arange(num_tasks - 1), np.arange(1, num_tasks)]
+    )
+    timing = TimingConstraints(EndBeforeStart, edges)
+    constraints = Constraints(end_before_start=timing)
+    data = ProblemData(jobs, machines, tasks, modes, constraints)
+
+    def from_data():
+        model = Model.from_data(data)
+        return model, model.data()
+
+    model, new = benchmark(from_data)
+    assert_(model.data() is new)
+    assert_equal(new, data)
+
+
+def make_large_instance(num_tasks: int, num_machines: int = 100):
+    """
+    Creates a large, randomly generated instance with a job and mode for each
+    task, and a random precedence constraint for each task.
+    """
+    rng = np.random.default_rng(1)
+
+    jobs = [Job(tasks=[idx]) for idx in range(num_tasks)]
+    machines: list[Resource] = [Machine() for _ in range(num_machines)]
+    tasks = [Task(job=idx) for idx in range(num_tasks)]
+    modes = [
+        Mode(idx, [int(res)], int(duration))
+        for idx, (res, duration) in enumerate(
+            zip(
+                rng.integers(num_machines, size=num_tasks),
+                rng.integers(1, 10, size=num_tasks),
+            )
+        )
+    ]
+    edges = rng.integers(num_tasks, size=(num_tasks, 2))
+    timing = TimingConstraints(EndBeforeStart, edges)
+    constraints = Constraints(end_before_start=timing)
+    return ProblemData(jobs, machines, tasks, modes, constraints)
+
+
+@pytest.mark.parametrize("instance_format", ["json", "npy"])
+def test_load_problem_data(benchmark, tmp_path, instance_format: str):
+    """
+    Benchmarks loading a large problem instance from JSON and from the binary
+    format, which memory-maps its columns.
+    """
+    data = make_large_instance(100_000)
+
+    if instance_format == "json":
+        json_str = data.to_json(indent=None)
+        new = benchmark(ProblemData.from_json, json_str)
+    else:
+        data.to_npy(tmp_path)
+        new = benchmark(ProblemData.from_npy, tmp_path)
+
+    assert_equal(new, data)
+
+
+@pytest.mark.parametrize("method", ["string", "stream"])
+def test_json_round_trip(benchmark, tmp_path, method: str):
+    """
+    Benchmarks encoding a large problem instance to JSON and decoding it
+    again, either as a string or streamed through a file.
+    """
+    data = make_large_instance(100_000)
+    loc = tmp_path / "instance.json"
+
+    def round_trip():
+        if method == "string":
+            return ProblemData.from_json(data.to_json(indent=None))
+
+        with open(loc, "w") as fh:
+            data.dump_json(fh)
+
+        with open(loc) as fh:
+            return ProblemData.load_json(fh)
+
+    new = benchmark(round_trip)
+    assert_equal(new, data)
+
+
+def test_fingerprint(benchmark):
+    """
+    Benchmarks fingerprinting a large problem instance.
+    """
+    data = make_large_instance(100_000)
+
+    def fingerprint():
+        # Replacing nothing shares the data, but resets the cached digest.
+        return data.replace(validate=False).fingerprint()
+
+    benchmark(fingerprint)
+
+
+def test_solve_cached(benchmark, tmp_path):
+    """
+    Benchmarks solving an instance whose result is already cached, which
+    should skip building and solving the model.
+    """
+    data = read("data/Mk01.fjs")
+    result = solve(data, time_limit=10, cache_dir=tmp_path)
+
+    cached = benchmark(solve, data, time_limit=10, cache_dir=tmp_path)
+    assert_equal(cached, result)
+
+
+@pytest.mark.parametrize("method", ["build", "load"])
+def test_ortools_model_cache(benchmark, tmp_path, method: str):
+    """
+    Benchmarks building the OR-Tools model of a large instance against
+    loading the saved model.
+    """
+    data = make_large_instance(10_000)
+    CPModel(data).save(tmp_path)
+
+    if method == "build":
+        benchmark(CPModel, data)
+    else:
+        benchmark(CPModel.load, data, tmp_path)
+
+
+@pytest.mark.parametrize("callback", [False, True])
+def test_solve_on_solution(benchmark, solver, callback: bool):
+    """
+    Benchmarks the overhead of converting each incumbent solution when a
+    solution callback is used.
+    """
+    data = read("data/edata-car1.fjs")
+    results: list = []
+    on_solution = results.append if callback else None
+
+    result = benchmark(
+        solve, data, solver, time_limit=10, on_solution=on_solution
+    )
+    assert_equal(result.objective, 6176)
+
+
+@pytest.mark.parametrize("method", ["pickle", "npy"])
+def test_instance_transfer(benchmark, tmp_path, method: str):
+    """
+    Benchmarks sending a large instance to a worker process by pickling it,
+    against the memory-mapped binary files that ``solve_many`` uses.
+    """
+    data = make_large_instance(100_000)
+
+    def transfer():
+        if method == "pickle":
+            return pickle.loads(pickle.dumps(data))
+
+        data.to_npy(tmp_path / "instance")
+        return ProblemData.from_npy(tmp_path / "instance", validate=False)
+
+    received = benchmark(transfer)
+    assert_equal(received.num_tasks, data.num_tasks)
+
+
+def test_solve_portfolio(benchmark, require_cpoptimizer):
+    """
+    Benchmarks racing both solvers on an instance that both solve to
+    optimality within the time limit.
+    """
+    data = read("data/edata-car1.fjs")
+    result = benchmark(solve, data, "portfolio", time_limit=10)
+    assert_equal(result.objective, 6176)
+
+
+def test_solve_lns(benchmark):
+    """
+    Benchmarks a fixed number of large neighborhood search iterations, which
+    includes fixing and releasing the tasks of each sub-problem.
+    """
+    data = read("data/Mk01.fjs")
+    initial = solve(data, num_workers=1, stop_after_first_solution=True)
+
+    result = benchmark(
+        solve_lns,
+        data,
+        initial_solution=initial.best,
+        neighborhood_size=20,
+        max_iterations=20,
+        seed=1,
+    )
+    assert_(result.objective <= initial.objective)
+
+
+def test_sgs(benchmark):
+    """
+    Benchmarks constructing a solution with the serial schedule generation
+    heuristic for a large job shop instance with 100,000 tasks.
+    """
+    num_jobs, num_machines, num_ops = 1_000, 100, 100
+    num_tasks = num_jobs * num_ops
+    rng = np.random.default_rng(1)
+
+    model = Model()
+    model.add_jobs(num_jobs)
+    model.add_machines(num_machines)
+    model.add_tasks(num_tasks, np.repeat(np.arange(num_jobs), num_ops))
+    model.add_modes(
+        np.arange(num_tasks),
+        rng.integers(num_machines, size=num_tasks),
+        rng.integers(1, 10, size=num_tasks),
+    )
+
+    tasks = np.arange(num_tasks).reshape(num_jobs, num_ops)
+    model.add_end_before_start_many(tasks[:, :-1], tasks[:, 1:])
+    data = model.data()
+
+    solution = benchmark(sgs, data)
+    assert_equal(len(solution.tasks), num_tasks)
@@ -1,4 +1,12 @@
-from typing import Literal
+from collections.abc import Callable, Sequence
+from copy import copy
+from dataclasses import fields
+from functools import wraps
+from pathlib import Path
+from typing import Any, Literal, TypeVar, cast
+
+import numpy as np
+from numpy.typing import ArrayLike
 
 from pyjobshop.constants import MAX_VALUE
 from pyjobshop.ProblemData import (
@@ -30,11 +38,30 @@ from pyjobshop.ProblemData import (
     StartBeforeEnd,
     StartBeforeStart,
     Task,
+    TimingConstraints,
 )
 from pyjobshop.Result import Result
+from pyjobshop.ResultCache import ResultCache
 from pyjobshop.Solution import Solution
 from pyjobshop.solve import solve
 
+_F = TypeVar("_F", bound=Callable[..., Any])
+_T = TypeVar("_T")
+
+
+def _modifies(method: _F) -> _F:
+    """
+    Decorator for methods that modify the model. It clears the problem data
+    instance that is cached by :meth:`Model.data`.
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._data = None
+        return method(self, *args, **kwargs)
+
+    return cast("_F", wrapper)
+
 
 class Model:
     """
@@ -54,6 +81,9 @@ class Model:
         self._id2task: dict[int, int] = {}
         self._id2mode: dict[int, int] = {}
 
+        # Problem data instance of the unmodified model, see data().
+        self._data: ProblemData | None = None
+
     @property
     def jobs(self) -> list[Job]:
         """
@@ -96,6 +126,7 @@ class Model:
         """
         return self._objective
 
+    @_modifies
     def add_job(
         self,
         weight: int = 1,
@@ -115,6 +146,33 @@ class Model:
 
         return job
 
+    @_modifies
+    def add_jobs(
+        self,
+        num_jobs: int,
+        weight: ArrayLike = 1,
+        release_date: ArrayLike = 0,
+        deadline: ArrayLike = MAX_VALUE,
+        due_date: ArrayLike | None = None,
+    ) -> list[Job]:
+        """
+        Adds multiple jobs to the model at once. Each attribute is either a
+        single value that is used for all jobs, or an array with a value for
+        each job.
+        """
+        columns = [
+            _broadcast(weight, num_jobs),
+            _broadcast(release_date, num_jobs),
+            _broadcast(deadline, num_jobs),
+            _broadcast(due_date, num_jobs),
+        ]
+        jobs = [Job(*values) for values in zip(*columns)]
+        _register(self._id2job, jobs, len(self.jobs))
+        self._jobs.extend(jobs)
+
+        return jobs
+
+    @_modifies
     def add_machine(
         self,
         breaks: list[Break] | None = None,
@@ -135,6 +193,23 @@ class Model:
 
         return machine
 
+    @_modifies
+    def add_machines(
+        self, num_machines: int, no_idle: ArrayLike = False
+    ) -> list[Machine]:
+        """
+        Adds multiple machines without breaks to the model at once.
+        """
+        machines = [
+            Machine(no_idle=value)
+            for value in _broadcast(no_idle, num_machines, dtype=bool)
+        ]
+        _register(self._id2resource, machines, len(self.resources))
+        self._resources.extend(machines)
+
+        return machines
+
+    @_modifies
     def add_renewable(
         self,
         capacity: int,
@@ -155,6 +230,20 @@ class Model:
 
         return resource
 
+    @_modifies
+    def add_renewables(self, capacities: ArrayLike) -> list[Renewable]:
+        """
+        Adds a renewable resource without breaks to the model for each of the
+        given capacities.
+        """
+        capacities = np.asarray(capacities, dtype=np.int64).ravel()
+        resources = [Renewable(value) for value in capacities.tolist()]
+        _register(self._id2resource, resources, len(self.resources))
+        self._resources.extend(resources)
+
+        return resources
+
+    @_modifies
     def add_consumable(
         self,
         capacity: int,
@@ -175,6 +264,20 @@ class Model:
 
         return resource
 
+    @_modifies
+    def add_consumables(self, capacities: ArrayLike) -> list[Consumable]:
+        """
+        Adds a consumable resource without breaks to the model for each of the
+        given capacities.
+        """
+        capacities = np.asarray(capacities, dtype=np.int64).ravel()
+        resources = [Consumable(value) for value in capacities.tolist()]
+        _register(self._id2resource, resources, len(self.resources))
+        self._resources.extend(resources)
+
+        return resources
+
+    @_modifies
     def add_task(
         self,
         job: Job | None = None,
@@ -213,6 +316,62 @@ class Model:
 
         return task
 
+    @_modifies
+    def add_tasks(
+        self,
+        num_tasks: int,
+        jobs: Sequence[Job | None] | np.ndarray | None = None,
+        earliest_start: ArrayLike = 0,
+        latest_start: ArrayLike = MAX_VALUE,
+        earliest_end: ArrayLike = 0,
+        latest_end: ArrayLike = MAX_VALUE,
+        allow_idle: ArrayLike = False,
+        allow_breaks: ArrayLike = False,
+        optional: ArrayLike = False,
+    ) -> list[Task]:
+        """
+        Adds multiple tasks to the model at once. The jobs are given as a list
+        of jobs (or ``None``), or as an array of job indices where ``-1``
+        means that the task does not belong to any job. The other attributes
+        are either a single value that is used for all tasks, or an array
+        with a value for each task.
+        """
+        if jobs is None:
+            job_idcs: list[int | None] = [None] * num_tasks
+        elif isinstance(jobs, np.ndarray):
+            job_idcs = [idx if idx >= 0 else None for idx in jobs.tolist()]
+        else:
+            id2job = self._id2job
+            job_idcs = [
+                id2job[id(job)] if job is not None else None for job in jobs
+            ]
+
+        if len(job_idcs) != num_tasks:
+            raise ValueError("Number of jobs must match number of tasks.")
+
+        columns = [
+            job_idcs,
+            _broadcast(earliest_start, num_tasks),
+            _broadcast(latest_start, num_tasks),
+            _broadcast(earliest_end, num_tasks),
+            _broadcast(latest_end, num_tasks),
+            _broadcast(allow_idle, num_tasks, dtype=bool),
+            _broadcast(allow_breaks, num_tasks, dtype=bool),
+            _broadcast(optional, num_tasks, dtype=bool),
+        ]
+        tasks = [Task(*values) for values in zip(*columns)]
+
+        start = len(self.tasks)
+        _register(self._id2task, tasks, start)
+        self._tasks.extend(tasks)
+
+        for task_idx, job_idx in enumerate(job_idcs, start):
+            if job_idx is not None:
+                self._jobs[job_idx].add_task(task_idx)
+
+        return tasks
+
+    @_modifies
     def add_mode(
         self,
         task: Task,
@@ -242,6 +401,59 @@ class Model:
 
         return mode
 
+    @_modifies
+    def add_modes(
+        self,
+        tasks: Sequence[Task] | np.ndarray,
+        resources: Sequence[Resource | Sequence[Resource]] | np.ndarray,
+        durations: ArrayLike,
+        demands: int | np.integer | list | np.ndarray | None = None,
+    ) -> list[Mode]:
+        """
+        Adds multiple processing modes to the model at once.
+
+        Tasks are given as a list of tasks or as an array of task indices.
+        Resources are given as a list with a resource or list of resources
+        for each mode, or as an array of resource indices with one row per
+        mode. Durations are a single value or an array with a value for each
+        mode. Demands are optional, and given in the same shape as the
+        resources; a single value is used for all resources of all modes.
+        """
+        task_idcs = self._task_idcs(tasks)
+        num_modes = len(task_idcs)
+
+        if isinstance(resources, np.ndarray):
+            resource_idcs = resources.reshape(num_modes, -1).tolist()
+        else:
+            id2res = self._id2resource
+            resource_idcs = [
+                [id2res[id(res)] for res in _as_list(mode_resources)]
+                for mode_resources in resources
+            ]
+
+        if demands is None:
+            mode_demands: list[list[int]] = [[] for _ in range(num_modes)]
+        elif isinstance(demands, np.ndarray) and demands.ndim > 0:
+            mode_demands = demands.reshape(num_modes, -1).tolist()
+        elif isinstance(demands, (int, np.integer, np.ndarray)):
+            demand = int(demands)  # int, NumPy scalar or 0-d array
+            mode_demands = [[demand] * len(idcs) for idcs in resource_idcs]
+        else:
+            mode_demands = [_as_list(values) for values in demands]
+
+        columns = [
+            task_idcs,
+            resource_idcs,
+            _broadcast(durations, num_modes),
+            mode_demands,
+        ]
+        modes = [Mode(*values) for values in zip(*columns, strict=True)]
+        _register(self._id2mode, modes, len(self.modes))
+        self._modes.extend(modes)
+
+        return modes
+
+    @_modifies
     def add_start_before_start(
         self, task1: Task, task2: Task, delay: int = 0
     ) -> StartBeforeStart:
@@ -255,6 +467,22 @@ class Model:
 
         return constraint
 
+    @_modifies
+    def add_start_before_start_many(
+        self,
+        tasks1: Sequence[Task] | np.ndarray,
+        tasks2: Sequence[Task] | np.ndarray,
+        delays: ArrayLike = 0,
+    ):
+        """
+        Adds constraints that the first tasks must start before the second
+        tasks start, with optional delays. Tasks are given as lists of tasks or
+        as arrays of task indices. Delays are a single value or an array with a
+        delay for each constraint.
+        """
+        self._add_timing_many("start_before_start", tasks1, tasks2, delays)
+
+    @_modifies
     def add_start_before_end(
         self, task1: Task, task2: Task, delay: int = 0
     ) -> StartBeforeEnd:
@@ -268,6 +496,22 @@ class Model:
 
         return constraint
 
+    @_modifies
+    def add_start_before_end_many(
+        self,
+        tasks1: Sequence[Task] | np.ndarray,
+        tasks2: Sequence[Task] | np.ndarray,
+        delays: ArrayLike = 0,
+    ):
+        """
+        Adds constraints that the first tasks must start before the second
+        tasks end, with optional delays. Tasks are given as lists of tasks or
+        as arrays of task indices. Delays are a single value or an array with a
+        delay for each constraint.
+        """
+        self._add_timing_many("start_before_end", tasks1, tasks2, delays)
+
+    @_modifies
     def add_end_before_start(
         self, task1: Task, task2: Task, delay: int = 0
     ) -> EndBeforeStart:
@@ -281,6 +525,22 @@ class Model:
 
         return constraint
 
+    @_modifies
+    def add_end_before_start_many(
+        self,
+        tasks1: Sequence[Task] | np.ndarray,
+        tasks2: Sequence[Task] | np.ndarray,
+        delays: ArrayLike = 0,
+    ):
+        """
+        Adds constraints that the first tasks must end before the second tasks
+        start, with optional delays. Tasks are given as lists of tasks or as
+        arrays of task indices. Delays are a single value or an array with a
+        delay for each constraint.
+        """
+        self._add_timing_many("end_before_start", tasks1, tasks2, delays)
+
+    @_modifies
     def add_end_before_end(
         self, task1: Task, task2: Task, delay: int = 0
     ) -> EndBeforeEnd:
@@ -294,6 +554,22 @@ class Model:
 
         return constraint
 
+    @_modifies
+    def add_end_before_end_many(
+        self,
+        tasks1: Sequence[Task] | np.ndarray,
+        tasks2: Sequence[Task] | np.ndarray,
+        delays: ArrayLike = 0,
+    ):
+        """
+        Adds constraints that the first tasks must end before the second tasks
+        end, with optional delays. Tasks are given as lists of tasks or as
+        arrays of task indices. Delays are a single value or an array with a
+        delay for each constraint.
+        """
+        self._add_timing_many("end_before_end", tasks1, tasks2, delays)
+
+    @_modifies
     def add_start_at_start(
         self, task1: Task, task2: Task, delay: int = 0
     ) -> StartAtStart:
@@ -307,6 +583,22 @@ class Model:
 
         return constraint
 
+    @_modifies
+    def add_start_at_start_many(
+        self,
+        tasks1: Sequence[Task] | np.ndarray,
+        tasks2: Sequence[Task] | np.ndarray,
+        delays: ArrayLike = 0,
+    ):
+        """
+        Adds constraints that the first tasks must start exactly at the start
+        of the second tasks, with optional delays. Tasks are given as lists of
+        tasks or as arrays of task indices. Delays are a single value or an
+        array with a delay for each constraint.
+        """
+        self._add_timing_many("start_at_start", tasks1, tasks2, delays)
+
+    @_modifies
     def add_start_at_end(
         self, task1: Task, task2: Task, delay: int = 0
     ) -> StartAtEnd:
@@ -320,6 +612,22 @@ class Model:
 
         return constraint
 
+    @_modifies
+    def add_start_at_end_many(
+        self,
+        tasks1: Sequence[Task] | np.ndarray,
+        tasks2: Sequence[Task] | np.ndarray,
+        delays: ArrayLike = 0,
+    ):
+        """
+        Adds constraints that the first tasks must start exactly at the end of
+        the second tasks, with optional delays. Tasks are given as lists of
+        tasks or as arrays of task indices. Delays are a single value or an
+        array with a delay for each constraint.
+        """
+        self._add_timing_many("start_at_end", tasks1, tasks2, delays)
+
+    @_modifies
     def add_end_at_start(
         self, task1: Task, task2: Task, delay: int = 0
     ) -> EndAtStart:
@@ -333,6 +641,22 @@ class Model:
 
         return constraint
 
+    @_modifies
+    def add_end_at_start_many(
+        self,
+        tasks1: Sequence[Task] | np.ndarray,
+        tasks2: Sequence[Task] | np.ndarray,
+        delays: ArrayLike = 0,
+    ):
+        """
+        Adds constraints that the first tasks must end exactly at the start of
+        the second tasks, with optional delays. Tasks are given as lists of
+        tasks or as arrays of task indices. Delays are a single value or an
+        array with a delay for each constraint.
+        """
+        self._add_timing_many("end_at_start", tasks1, tasks2, delays)
+
+    @_modifies
     def add_end_at_end(
         self, task1: Task, task2: Task, delay: int = 0
     ) -> EndAtEnd:
@@ -346,6 +670,22 @@ class Model:
 
         return constraint
 
+    @_modifies
+    def add_end_at_end_many(
+        self,
+        tasks1: Sequence[Task] | np.ndarray,
+        tasks2: Sequence[Task] | np.ndarray,
+        delays: ArrayLike = 0,
+    ):
+        """
+        Adds constraints that the first tasks must end exactly at the end of
+        the second tasks, with optional delays. Tasks are given as lists of
+        tasks or as arrays of task indices. Delays are a single value or an
+        array with a delay for each constraint.
+        """
+        self._add_timing_many("end_at_end", tasks1, tasks2, delays)
+
+    @_modifies
     def add_identical_resources(
         self, task1: Task, task2: Task
     ) -> IdenticalResources:
@@ -359,6 +699,24 @@ class Model:
 
         return constraint
 
+    @_modifies
+    def add_identical_resources_many(
+        self,
+        tasks1: Sequence[Task] | np.ndarray,
+        tasks2: Sequence[Task] | np.ndarray,
+    ):
+        """
+        Adds constraints that each pair of first and second tasks require
+        identical resources. Tasks are given as lists of tasks or as arrays of
+        task indices.
+        """
+        idcs1, idcs2 = self._task_idcs(tasks1), self._task_idcs(tasks2)
+        self._constraints.identical_resources.extend(
+            IdenticalResources(idx1, idx2)
+            for idx1, idx2 in zip(idcs1, idcs2, strict=True)
+        )
+
+    @_modifies
     def add_different_resources(
         self, task1: Task, task2: Task
     ) -> DifferentResources:
@@ -372,6 +730,24 @@ class Model:
 
         return constraint
 
+    @_modifies
+    def add_different_resources_many(
+        self,
+        tasks1: Sequence[Task] | np.ndarray,
+        tasks2: Sequence[Task] | np.ndarray,
+    ):
+        """
+        Adds constraints that each pair of first and second tasks require
+        different resources. Tasks are given as lists of tasks or as arrays of
+        task indices.
+        """
+        idcs1, idcs2 = self._task_idcs(tasks1), self._task_idcs(tasks2)
+        self._constraints.different_resources.extend(
+            DifferentResources(idx1, idx2)
+            for idx1, idx2 in zip(idcs1, idcs2, strict=True)
+        )
+
+    @_modifies
     def add_consecutive(self, task1: Task, task2: Task) -> Consecutive:
         """
         Adds a constraint that the first task must be scheduled right before
@@ -384,6 +760,24 @@ class Model:
 
         return constraint
 
+    @_modifies
+    def add_consecutive_many(
+        self,
+        tasks1: Sequence[Task] | np.ndarray,
+        tasks2: Sequence[Task] | np.ndarray,
+    ):
+        """
+        Adds constraints that each pair of first and second tasks are scheduled
+        consecutively. Tasks are given as lists of tasks or as arrays of task
+        indices.
+        """
+        idcs1, idcs2 = self._task_idcs(tasks1), self._task_idcs(tasks2)
+        self._constraints.consecutive.extend(
+            Consecutive(idx1, idx2)
+            for idx1, idx2 in zip(idcs1, idcs2, strict=True)
+        )
+
+    @_modifies
     def add_same_sequence(
         self,
         machine1: Machine,
@@ -407,6 +801,7 @@ class Model:
 
         return constraint
 
+    @_modifies
     def add_setup_time(
         self, machine: Machine, task1: Task, task2: Task, duration: int
     ) -> SetupTime:
@@ -422,6 +817,35 @@ class Model:
 
         return constraint
 
+    @_modifies
+    def add_setup_time_many(
+        self,
+        machines: Sequence[Machine] | np.ndarray,
+        tasks1: Sequence[Task] | np.ndarray,
+        tasks2: Sequence[Task] | np.ndarray,
+        durations: ArrayLike,
+    ):
+        """
+        Adds setup times between pairs of tasks on machines. Machines and
+        tasks are given as lists or as arrays of indices. Durations are a
+        single value or an array with a value for each setup time.
+        """
+        if isinstance(machines, np.ndarray):
+            machine_idcs = machines.tolist()
+        else:
+            machine_idcs = [self._id2resource[id(mach)] for mach in machines]
+
+        columns = [
+            machine_idcs,
+            self._task_idcs(tasks1),
+            self._task_idcs(tasks2),
+            _broadcast(durations, len(machine_idcs)),
+        ]
+        self._constraints.setup_times.extend(
+            SetupTime(*values) for values in zip(*columns, strict=True)
+        )
+
+    @_modifies
     def add_mode_dependency(
         self, mode1: Mode, modes2: list[Mode]
     ) -> ModeDependency:
@@ -437,6 +861,7 @@ class Model:
 
         return constraint
 
+    @_modifies
     def add_select_all_or_none(
         self, tasks: list[Task], condition_task: Task | None = None
     ) -> SelectAllOrNone:
@@ -454,6 +879,7 @@ class Model:
 
         return constraint
 
+    @_modifies
     def add_select_at_least_one(
         self, tasks: list[Task], condition_task: Task | None = None
     ) -> SelectAtLeastOne:
@@ -471,6 +897,7 @@ class Model:
 
         return constraint
 
+    @_modifies
     def add_select_exactly_one(
         self, tasks: list[Task], condition_task: Task | None = None
     ) -> SelectExactlyOne:
@@ -488,6 +915,52 @@ class Model:
 
         return constraint
 
+    def _task_idcs(self, tasks: Sequence[Task] | np.ndarray) -> list[int]:
+        """
+        Returns the indices of the given tasks, which are either a list of
+        tasks or an array of task indices.
+        """
+        if isinstance(tasks, np.ndarray):
+            return tasks.ravel().tolist()
+
+        id2task = self._id2task
+        return [id2task[id(task)] for task in tasks]
+
+    def _add_timing_many(
+        self,
+        name: str,
+        tasks1: Sequence[Task] | np.ndarray,
+        tasks2: Sequence[Task] | np.ndarray,
+        delays: ArrayLike,
+    ):
+        """
+        Adds timing constraints of the given type in bulk.
+
+        Parameters
+        ----------
+        name
+            Name of the timing constraints field in :class:`Constraints`.
+        tasks1
+            The first tasks, as a list of tasks or an array of task indices.
+        tasks2
+            The second tasks, as a list of tasks or an array of task indices.
+        delays
+            A single delay that is used for all constraints, or an array with
+            the delay of each constraint.
+        """
+        idcs1 = np.asarray(self._task_idcs(tasks1), dtype=np.int64)
+        idcs2 = np.asarray(self._task_idcs(tasks2), dtype=np.int64)
+
+        if len(idcs1) != len(idcs2):
+            raise ValueError("tasks1 and tasks2 must have the same length.")
+
+        delays = np.broadcast_to(
+            np.asarray(delays, dtype=np.int64), idcs1.shape
+        )
+        timing = getattr(self._constraints, name)
+        timing.extend(np.column_stack([idcs1, idcs2, delays]))
+
+    @_modifies
     def set_objective(
         self,
         weight_makespan: int = 0,
@@ -522,159 +995,74 @@ class Model:
     @classmethod
     def from_data(cls, data: ProblemData):
         """
-        Creates a Model instance from a ProblemData instance.
+        Creates a Model instance from a ProblemData instance. The model
+        copies the data's jobs, resources, tasks, modes and constraints, so
+        modifying the model does not modify the given data instance. Until
+        the model is modified, :meth:`data` returns the given data instance.
         """
         model = cls()
-
-        for job in data.jobs:
-            model.add_job(
-                job.weight,
-                job.release_date,
-                job.deadline,
-                job.due_date,
-                name=job.name,
-            )
-
-        for resource in data.resources:
-            if isinstance(resource, Machine):
-                model.add_machine(
-                    resource.breaks,
-                    resource.no_idle,
-                    name=resource.name,
-                )
-            elif isinstance(resource, Renewable):
-                model.add_renewable(
-                    resource.capacity,
-                    resource.breaks,
-                    name=resource.name,
-                )
-            elif isinstance(resource, Consumable):
-                model.add_consumable(
-                    resource.capacity,
-                    resource.breaks,
-                    name=resource.name,
+        model._jobs = [_copy(job) for job in data.jobs]
+        model._resources = [_copy(res) for res in data.resources]
+        model._tasks = [_copy(task) for task in data.tasks]
+        model._modes = [_copy(mode) for mode in data.modes]
+        model._objective = data.objective
+
+        constraints: dict[str, Any] = {}
+        for f in fields(Constraints):
+            value = getattr(data.constraints, f.name)
+            if isinstance(value, TimingConstraints):
+                constraints[f.name] = TimingConstraints(
+                    value.constraint_cls, value
                 )
             else:
-                raise ValueError(f"Unknown resource type: {type(resource)}")
-
-        for task in data.tasks:
-            model.add_task(
-                model.jobs[task.job] if task.job is not None else None,
-                task.earliest_start,
-                task.latest_start,
-                task.earliest_end,
-                task.latest_end,
-                task.allow_idle,
-                task.allow_breaks,
-                task.optional,
-                name=task.name,
-            )
-
-        for mode in data.modes:
-            model.add_mode(
-                model.tasks[mode.task],
-                [model.resources[res] for res in mode.resources],
-                mode.duration,
-                mode.demands,
-                name=mode.name,
-            )
-
-        resources = model.resources
-        tasks = model.tasks
-
-        for idx1, idx2, delay in data.constraints.start_before_start:
-            model.add_start_before_start(tasks[idx1], tasks[idx2], delay)
-
-        for idx1, idx2, delay in data.constraints.start_before_end:
-            model.add_start_before_end(tasks[idx1], tasks[idx2], delay)
-
-        for idx1, idx2, delay in data.constraints.end_before_start:
-            model.add_end_before_start(tasks[idx1], tasks[idx2], delay)
+                constraints[f.name] = list(value)
 
-        for idx1, idx2, delay in data.constraints.end_before_end:
-            model.add_end_before_end(tasks[idx1], tasks[idx2], delay)
+        model._constraints = Constraints(**constraints)
 
-        for idx1, idx2 in data.constraints.identical_resources:
-            model.add_identical_resources(tasks[idx1], tasks[idx2])
+        _register(model._id2job, model._jobs, 0)
+        _register(model._id2resource, model._resources, 0)
+        _register(model._id2task, model._tasks, 0)
+        _register(model._id2mode, model._modes, 0)
 
-        for idx1, idx2 in data.constraints.different_resources:
-            model.add_different_resources(tasks[idx1], tasks[idx2])
-
-        for idx1, idx2 in data.constraints.consecutive:
-            model.add_consecutive(tasks[idx1], tasks[idx2])
-
-        for idcs in data.constraints.same_sequence:
-            res_idx1, res_idx2, task_idcs1, task_idcs2 = idcs
-            model.add_same_sequence(
-                resources[res_idx1],
-                resources[res_idx2],
-                [tasks[idx] for idx in task_idcs1] if task_idcs1 else None,
-                [tasks[idx] for idx in task_idcs2] if task_idcs2 else None,
-            )
-
-        for res_idx, idx1, idx2, duration in data.constraints.setup_times:
-            model.add_setup_time(
-                machine=resources[res_idx],  # type: ignore
-                task1=tasks[idx1],
-                task2=tasks[idx2],
-                duration=duration,
-            )
-
-        for mode1, modes2 in data.constraints.mode_dependencies:
-            model.add_mode_dependency(
-                model.modes[mode1], [model.modes[m] for m in modes2]
-            )
-
-        for idcs, condition_idx in data.constraints.select_all_or_none:
-            model.add_select_all_or_none(
-                [tasks[idx] for idx in idcs],
-                tasks[condition_idx] if condition_idx is not None else None,
-            )
-
-        for idcs, condition_idx in data.constraints.select_at_least_one:
-            model.add_select_at_least_one(
-                [tasks[idx] for idx in idcs],
-                tasks[condition_idx] if condition_idx is not None else None,
-            )
-
-        for idcs, condition_idx in data.constraints.select_exactly_one:
-            model.add_select_exactly_one(
-                [tasks[idx] for idx in idcs],
-                tasks[condition_idx] if condition_idx is not None else None,
-            )
-
-        model.set_objective(
-            weight_makespan=data.objective.weight_makespan,
-            weight_tardy_jobs=data.objective.weight_tardy_jobs,
-            weight_total_tardiness=data.objective.weight_total_tardiness,
-            weight_total_flow_time=data.objective.weight_total_flow_time,
-            weight_total_earliness=data.objective.weight_total_earliness,
-            weight_max_tardiness=data.objective.weight_max_tardiness,
-            weight_total_setup_time=data.objective.weight_total_setup_time,
-        )
+        # The unmodified model represents the given data instance.
+        model._data = data
 
         return model
 
     def data(self) -> ProblemData:
         """
-        Returns a ProblemData object containing the problem instance.
-        """
-        return ProblemData(
-            jobs=self.jobs,
-            resources=self.resources,
-            tasks=self.tasks,
-            modes=self.modes,
-            constraints=self.constraints,
-            objective=self.objective,
-        )
+        Returns a ProblemData object containing the problem instance. The
+        instance is cached until the model is modified through one of its
+        ``add_*`` methods or :meth:`set_objective`, so repeated calls on an
+        unmodified model return the same instance.
+
+        .. note::
+            Modifying the model's data directly, for example by appending to
+            :attr:`tasks`, does not clear the cached instance.
+        """
+        if self._data is None:
+            # The jobs are copied, since adding tasks to the model modifies
+            # them, whereas the data must not change afterwards.
+            self._data = ProblemData(
+                jobs=[_copy(job) for job in self.jobs],
+                resources=self.resources,
+                tasks=self.tasks,
+                modes=self.modes,
+                constraints=self.constraints,
+                objective=self.objective,
+            )
+
+        return self._data
 
     def solve(
         self,
-        solver: Literal["ortools", "cpoptimizer"] = "ortools",
+        solver: Literal["ortools", "cpoptimizer", "portfolio"] = "ortools",
         time_limit: float = float("inf"),
         display: bool = True,
         num_workers: int | None = None,
         initial_solution: Solution | None = None,
+        cache_dir: str | Path | ResultCache | None = None,
+        on_solution: Callable[[Result], bool | None] | None = None,
         **kwargs,
     ) -> Result:
         """
@@ -683,8 +1071,9 @@ class Model:
         Parameters
         ----------
         solver
-            The solver to use. Either ``'ortools'`` (default) or
-            ``'cpoptimizer'``.
+            The solver to use. Either ``'ortools'`` (default),
+            ``'cpoptimizer'``, or ``'portfolio'`` to race both solvers. See
+            :func:`~pyjobshop.solve.solve`.
         time_limit
             The time limit for the solver in seconds. Default ``float('inf')``.
         display
@@ -696,6 +1085,14 @@ class Model:
         initial_solution
             An initial solution to start the solver from. Default is no
             solution.
+        cache_dir
+            Optional directory to cache solver results in, or a
+            :class:`~pyjobshop.ResultCache.ResultCache`. See
+            :func:`~pyjobshop.solve.solve`. Default is no caching.
+        on_solution
+            Optional function that is called with a Result object for each
+            improving solution found during the search. If it returns
+            ``True``, the search is stopped. Default is no callback.
         kwargs
             Additional parameters passed to the solver.
 
@@ -712,5 +1109,59 @@ class Model:
             display,
             num_workers,
             initial_solution,
+            cache_dir,
+            on_solution,
             **kwargs,
         )
+
+
+def _broadcast(value: ArrayLike | None, size: int, dtype=np.int64) -> list:
+    """
+    Returns a list of the given size, with either the given (single) value
+    repeated, or the values of the given array.
+    """
+    if value is None:
+        return [None] * size
+
+    arr = np.asarray(value, dtype=dtype)
+    if arr.ndim == 0:
+        return [arr.item()] * size
+
+    if arr.shape != (size,):
+        msg = f"Expected a single value or an array of length {size}."
+        raise ValueError(msg)
+
+    return arr.tolist()
+
+
+def _register(id2idx: dict[int, int], items: list, start: int):
+    """
+    Registers the indices of the given items, starting at ``start``.
+    """
+    id2idx.update(zip(map(id, items), range(start, start + len(items))))
+
+
+def _copy(item: _T) -> _T:
+    """
+    Returns a shallow copy of the given dataclass instance, with copies of
+    its list attributes such as :attr:`Job.tasks` and :attr:`Mode.resources`.
+    """
+    new = copy(item)
+    for name in item.__dataclass_fields__:  # type: ignore[attr-defined]
+        if isinstance(value := getattr(item, name), list):
+            setattr(new, name, list(value))
+
+    return new
+
+
+def _as_list(value):
+    """
+    Wraps a single value in a list, and returns lists as they are.
+    """
+    if isinstance(value, (Machine, Renewable, Consumable, int)):
+        return [value]
+
+    if isinstance(value, np.integer):
+        return [int(value)]
+
+    return list(value)
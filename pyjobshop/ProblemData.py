@@ -1,14 +1,29 @@
+import hashlib
 import json
-from collections import Counter, defaultdict
-from copy import deepcopy
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from copy import copy
 from dataclasses import asdict, dataclass, field, fields
-from itertools import pairwise
-from typing import TypeAlias, TypeVar, get_args
+from functools import partial
+from itertools import chain, islice, pairwise, repeat
+from pathlib import Path
+from typing import (
+    Any,
+    Generic,
+    Literal,
+    NoReturn,
+    TextIO,
+    TypeAlias,
+    TypeVar,
+    get_args,
+    get_origin,
+    overload,
+)
+
+import numpy as np
 
 from pyjobshop.constants import MAX_VALUE
 
-_T = TypeVar("_T")
-
 Break: TypeAlias = tuple[int, int]
 
 
@@ -22,7 +37,7 @@ def _validate_breaks(breaks: list[Break]):
             raise ValueError("Break intervals must not overlap.")
 
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     """
     Simple dataclass for storing job-related data.
@@ -186,7 +201,7 @@ class Consumable:
 Resource = Machine | Renewable | Consumable
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """
     Simple dataclass for storing task-related data.
@@ -236,7 +251,7 @@ class Task:
             raise ValueError("earliest_end must be <= latest_end.")
 
 
-@dataclass
+@dataclass(slots=True)
 class Mode:
     """
     Simple dataclass for storing processing mode data.
@@ -291,11 +306,13 @@ class IterableMixin:
     makes the implementation of constraints more concise and readable.
     """
 
+    __slots__ = ()
+
     def __iter__(self):
         return iter(getattr(self, f.name) for f in fields(self))
 
 
-@dataclass
+@dataclass(slots=True)
 class StartBeforeStart(IterableMixin):
     """
     Start task 1 (:math:`s_1`) before task 2 starts (:math:`s_2`), with an
@@ -310,7 +327,7 @@ class StartBeforeStart(IterableMixin):
     delay: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class StartBeforeEnd(IterableMixin):
     """
     Start task 1 (:math:`s_1`) before task 2 ends (:math:`e_2`), with an
@@ -325,7 +342,7 @@ class StartBeforeEnd(IterableMixin):
     delay: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class EndBeforeStart(IterableMixin):
     """
     End task 1 (:math:`e_1`) before task 2 starts (:math:`s_2`), with an
@@ -340,7 +357,7 @@ class EndBeforeStart(IterableMixin):
     delay: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class EndBeforeEnd(IterableMixin):
     """
     End task 1 (:math:`e_1`) before task 2 ends (:math:`e_2`), with an
@@ -355,7 +372,7 @@ class EndBeforeEnd(IterableMixin):
     delay: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class StartAtStart(IterableMixin):
     """
     Start task 1 (:math:`s_1`) at the start of task 2 (:math:`s_2`), with
@@ -370,7 +387,7 @@ class StartAtStart(IterableMixin):
     delay: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class StartAtEnd(IterableMixin):
     """
     Start task 1 (:math:`s_1`) at the end of task 2 (:math:`e_2`), with an
@@ -385,7 +402,7 @@ class StartAtEnd(IterableMixin):
     delay: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class EndAtStart(IterableMixin):
     """
     End task 1 (:math:`e_1`) at the start of task 2 (:math:`s_2`), with an
@@ -400,7 +417,7 @@ class EndAtStart(IterableMixin):
     delay: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class EndAtEnd(IterableMixin):
     """
     End task 1 (:math:`e_1`) at the end of task 2 (:math:`e_2`), with an
@@ -415,7 +432,307 @@ class EndAtEnd(IterableMixin):
     delay: int = 0
 
 
-@dataclass
+TimingConstraint = TypeVar(
+    "TimingConstraint",
+    StartBeforeStart,
+    StartBeforeEnd,
+    EndBeforeStart,
+    EndBeforeEnd,
+    StartAtStart,
+    StartAtEnd,
+    EndAtStart,
+    EndAtEnd,
+)
+
+
+def _check_task_range(tasks: np.ndarray):
+    """
+    Checks that the given task indices fit the compact ``int32`` task storage
+    of :class:`TimingConstraints`, so they are not silently wrapped around.
+    """
+    info = np.iinfo(np.int32)
+    if tasks.size > 0 and (tasks.min() < info.min or tasks.max() > info.max):
+        raise ValueError("Timing constraint task index out of range.")
+
+
+class TimingConstraints(Generic[TimingConstraint]):
+    """
+    Compact, array-backed list of timing constraints of a single type, such
+    as :class:`EndBeforeStart`. The constraints are stored as ``task1``,
+    ``task2`` and ``delay`` columns instead of as individual objects, which
+    saves memory and allows building large instances from NumPy arrays.
+
+    Otherwise, this container behaves like a list of timing constraints: it
+    supports ``len()``, indexing, membership tests and comparison with lists.
+    Iterating yields constraint objects, which can be unpacked as
+    ``task1, task2, delay``.
+
+    The timing constraints of a :class:`ProblemData` instance are read-only
+    snapshots that share their storage with the container they were taken
+    from. The storage is copied when that container is modified afterwards.
+
+    Parameters
+    ----------
+    constraint_cls
+        The timing constraint class of the stored constraints.
+    constraints
+        Initial constraints. Default is no constraints.
+    """
+
+    def __init__(
+        self,
+        constraint_cls: type[TimingConstraint],
+        constraints: Iterable[TimingConstraint] | np.ndarray = (),
+    ):
+        self._cls: type[TimingConstraint] = constraint_cls
+        self._size = 0
+        self._tasks = np.empty((0, 2), dtype=np.int32)
+        self._delays = np.empty(0, dtype=np.int64)
+
+        # Read-only containers cannot be modified. Shared storage is also
+        # used by a read-only snapshot, so it is copied before modifying it.
+        self._read_only = False
+        self._shared = False
+
+        self.extend(constraints)
+
+    @classmethod
+    def from_array(
+        cls, constraint_cls: type[TimingConstraint], arr: np.ndarray
+    ) -> "TimingConstraints[TimingConstraint]":
+        """
+        Creates a container that uses the given array as its storage, without
+        copying it, for example to keep a memory-mapped array on disk. The
+        array is copied when the container is first modified, but must not
+        be modified itself.
+
+        Parameters
+        ----------
+        constraint_cls
+            The timing constraint class of the stored constraints.
+        arr
+            Integer array of shape ``(n, 3)`` whose rows are
+            ``(task1, task2, delay)``.
+
+        Returns
+        -------
+        TimingConstraints
+            The container using the given array as its storage.
+
+        Raises
+        ------
+        ValueError
+            If the array does not have the expected shape.
+        """
+        if arr.ndim != 2 or arr.shape[1] != 3:
+            msg = "Timing constraints array must have shape (n, 3)."
+            raise ValueError(msg)
+
+        timing = cls(constraint_cls)
+        timing._tasks, timing._delays = arr[:, :2], arr[:, 2]
+        timing._size = len(arr)
+        timing._shared = True
+        return timing
+
+    @property
+    def constraint_cls(self) -> type[TimingConstraint]:
+        """
+        Returns the timing constraint class of the stored constraints.
+        """
+        return self._cls
+
+    @property
+    def task1(self) -> np.ndarray:
+        """
+        Returns a read-only view of the first task of each constraint.
+        """
+        return _read_only(self._tasks[: self._size, 0])
+
+    @property
+    def task2(self) -> np.ndarray:
+        """
+        Returns a read-only view of the second task of each constraint.
+        """
+        return _read_only(self._tasks[: self._size, 1])
+
+    @property
+    def delay(self) -> np.ndarray:
+        """
+        Returns a read-only view of the delay of each constraint.
+        """
+        return _read_only(self._delays[: self._size])
+
+    def snapshot(self) -> "TimingConstraints[TimingConstraint]":
+        """
+        Returns a read-only snapshot of this container, which shares its
+        storage with this container until this container is modified.
+
+        Returns
+        -------
+        TimingConstraints
+            The read-only snapshot, or this container if it is read-only.
+        """
+        if self._read_only:
+            return self
+
+        snapshot = TimingConstraints.__new__(TimingConstraints)
+        snapshot.__dict__.update(self.__dict__, _read_only=True)
+        self._shared = True
+        return snapshot
+
+    def _before_write(self):
+        if self._read_only:
+            raise TypeError(_READ_ONLY_MSG)
+
+        if self._shared:  # copy-on-write
+            if self._tasks.dtype != np.int32:  # adopted, see from_array()
+                _check_task_range(self._tasks[: self._size])
+
+            self._tasks = self._tasks.astype(np.int32)
+            self._delays = self._delays.copy()
+            self._shared = False
+
+    def _reserve(self, size: int):
+        # Grows the storage geometrically, so appends take amortized constant
+        # time.
+        if size > len(self._delays):
+            capacity = max(size, 2 * len(self._delays), 8)
+            tasks = np.empty((capacity, 2), dtype=np.int32)
+            tasks[: self._size] = self._tasks[: self._size]
+            delays = np.empty(capacity, dtype=np.int64)
+            delays[: self._size] = self._delays[: self._size]
+            self._tasks, self._delays = tasks, delays
+
+    def append(self, constraint: TimingConstraint):
+        """
+        Appends a timing constraint.
+
+        Parameters
+        ----------
+        constraint
+            The timing constraint to append.
+        """
+        _check_task_range(np.array([constraint.task1, constraint.task2]))
+
+        self._before_write()
+        self._reserve(self._size + 1)
+        self._tasks[self._size] = constraint.task1, constraint.task2
+        self._delays[self._size] = constraint.delay
+        self._size += 1
+
+    def extend(self, constraints: Iterable[TimingConstraint] | np.ndarray):
+        """
+        Appends multiple timing constraints at once.
+
+        Parameters
+        ----------
+        constraints
+            Iterable of timing constraints, or an integer array of shape
+            ``(n, 2)`` or ``(n, 3)`` whose rows are ``(task1, task2)`` or
+            ``(task1, task2, delay)``, respectively.
+
+        Raises
+        ------
+        ValueError
+            If the array does not have the expected shape, or if a task
+            index does not fit the compact task storage.
+        """
+        self._before_write()
+
+        if isinstance(constraints, TimingConstraints):
+            tasks = np.column_stack([constraints.task1, constraints.task2])
+            delays = constraints.delay
+        else:
+            if not isinstance(constraints, np.ndarray):
+                constraints = np.array(
+                    [(c.task1, c.task2, c.delay) for c in constraints],
+                    dtype=np.int64,
+                ).reshape(-1, 3)
+
+            if constraints.ndim != 2 or constraints.shape[1] not in (2, 3):
+                msg = "Timing constraints array must have shape (n, 2|3)."
+                raise ValueError(msg)
+
+            tasks = constraints[:, :2]
+            if constraints.shape[1] == 3:
+                delays = constraints[:, 2]
+            else:
+                delays = np.zeros(len(constraints), dtype=np.int64)
+
+            _check_task_range(tasks)
+
+        start, end = self._size, self._size + len(tasks)
+        self._reserve(end)
+        self._tasks[start:end] = tasks
+        self._delays[start:end] = delays
+        self._size = end
+
+    def __len__(self) -> int:
+        return self._size
+
+    @overload
+    def __getitem__(self, idx: int) -> TimingConstraint: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> list[TimingConstraint]: ...
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[pos] for pos in range(*idx.indices(self._size))]
+
+        if not -self._size <= idx < self._size:
+            raise IndexError("Timing constraint index out of range.")
+
+        idx %= self._size
+        task1, task2 = self._tasks[idx].tolist()
+        return self._cls(task1, task2, int(self._delays[idx]))
+
+    def __iter__(self) -> Iterator[TimingConstraint]:
+        tasks = self._tasks[: self._size].tolist()
+        delays = self._delays[: self._size].tolist()
+        for (task1, task2), delay in zip(tasks, delays):
+            yield self._cls(task1, task2, delay)
+
+    def __contains__(self, constraint: object) -> bool:
+        if not isinstance(constraint, self._cls):
+            return False
+
+        task1, task2, delay = constraint
+        match = (self.task1 == task1) & (self.task2 == task2)
+        return bool(np.any(match & (self.delay == delay)))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TimingConstraints):
+            return (
+                self._cls is other.constraint_cls
+                and np.array_equal(self.task1, other.task1)
+                and np.array_equal(self.task2, other.task2)
+                and np.array_equal(self.delay, other.delay)
+            )
+
+        if isinstance(other, list):
+            return list(self) == other
+
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"TimingConstraints({self._cls.__name__}, {list(self)!r})"
+
+    def __getstate__(self) -> dict:
+        # Only pickle the used part of the storage.
+        return {
+            "_cls": self._cls,
+            "_size": self._size,
+            "_tasks": self._tasks[: self._size].copy(),
+            "_delays": self._delays[: self._size].copy(),
+            "_read_only": self._read_only,
+        }
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state, _shared=False)
+
+
+@dataclass(slots=True)
 class IdenticalResources(IterableMixin):
     """
     Select modes for task 1 and task 2 that use the same resources.
@@ -432,7 +749,7 @@ class IdenticalResources(IterableMixin):
     task2: int
 
 
-@dataclass
+@dataclass(slots=True)
 class DifferentResources(IterableMixin):
     """
     Select modes for task 1 and task 2 that use different resources.
@@ -449,7 +766,7 @@ class DifferentResources(IterableMixin):
     task2: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Consecutive(IterableMixin):
     """
     Sequence task 1 and task 2 consecutively on the machines they are both
@@ -471,7 +788,7 @@ class Consecutive(IterableMixin):
     task2: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SameSequence(IterableMixin):
     """
     Ensures that two machines process their assigned tasks in the same relative
@@ -515,7 +832,7 @@ class SameSequence(IterableMixin):
                 raise ValueError("tasks2 contains duplicate values.")
 
 
-@dataclass
+@dataclass(slots=True)
 class SetupTime(IterableMixin):
     """
     Sequence-dependent setup time between task 1 and task 2 on the given
@@ -545,7 +862,7 @@ class SetupTime(IterableMixin):
             raise ValueError("Setup time must be non-negative.")
 
 
-@dataclass
+@dataclass(slots=True)
 class ModeDependency(IterableMixin):
     """
     Represents a dependency between task modes: if mode 1 is selected,
@@ -569,7 +886,7 @@ class ModeDependency(IterableMixin):
             raise ValueError("At least one mode in modes2 must be specified.")
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectAllOrNone(IterableMixin):
     """
     Enforces that all tasks from the given list are selected, or none are.
@@ -582,7 +899,7 @@ class SelectAllOrNone(IterableMixin):
     condition_task: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectAtLeastOne(IterableMixin):
     """
     Enforces that at least one task from the given list is selected.
@@ -595,7 +912,7 @@ class SelectAtLeastOne(IterableMixin):
     condition_task: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectExactlyOne(IterableMixin):
     """
     Enforces that exactly one task from the given list is selected.
@@ -608,20 +925,41 @@ class SelectExactlyOne(IterableMixin):
     condition_task: int | None = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class Constraints:
     """
-    Simple container class for storing all constraints.
+    Simple container class for storing all constraints. Timing constraints
+    are stored in compact :class:`TimingConstraints` containers; lists of
+    timing constraints passed as arguments are converted automatically.
+
+    The constraint lists can be modified in place, but not replaced. The
+    constraints of a :class:`ProblemData` instance are read-only.
     """
 
-    start_before_start: list[StartBeforeStart] = field(default_factory=list)
-    start_before_end: list[StartBeforeEnd] = field(default_factory=list)
-    end_before_start: list[EndBeforeStart] = field(default_factory=list)
-    end_before_end: list[EndBeforeEnd] = field(default_factory=list)
-    start_at_start: list[StartAtStart] = field(default_factory=list)
-    start_at_end: list[StartAtEnd] = field(default_factory=list)
-    end_at_start: list[EndAtStart] = field(default_factory=list)
-    end_at_end: list[EndAtEnd] = field(default_factory=list)
+    start_before_start: (
+        list[StartBeforeStart] | TimingConstraints[StartBeforeStart]
+    ) = field(default_factory=partial(TimingConstraints, StartBeforeStart))
+    start_before_end: (
+        list[StartBeforeEnd] | TimingConstraints[StartBeforeEnd]
+    ) = field(default_factory=partial(TimingConstraints, StartBeforeEnd))
+    end_before_start: (
+        list[EndBeforeStart] | TimingConstraints[EndBeforeStart]
+    ) = field(default_factory=partial(TimingConstraints, EndBeforeStart))
+    end_before_end: list[EndBeforeEnd] | TimingConstraints[EndBeforeEnd] = (
+        field(default_factory=partial(TimingConstraints, EndBeforeEnd))
+    )
+    start_at_start: list[StartAtStart] | TimingConstraints[StartAtStart] = (
+        field(default_factory=partial(TimingConstraints, StartAtStart))
+    )
+    start_at_end: list[StartAtEnd] | TimingConstraints[StartAtEnd] = field(
+        default_factory=partial(TimingConstraints, StartAtEnd)
+    )
+    end_at_start: list[EndAtStart] | TimingConstraints[EndAtStart] = field(
+        default_factory=partial(TimingConstraints, EndAtStart)
+    )
+    end_at_end: list[EndAtEnd] | TimingConstraints[EndAtEnd] = field(
+        default_factory=partial(TimingConstraints, EndAtEnd)
+    )
     identical_resources: list[IdenticalResources] = field(default_factory=list)
     different_resources: list[DifferentResources] = field(default_factory=list)
     consecutive: list[Consecutive] = field(default_factory=list)
@@ -632,6 +970,14 @@ class Constraints:
     select_at_least_one: list[SelectAtLeastOne] = field(default_factory=list)
     select_exactly_one: list[SelectExactlyOne] = field(default_factory=list)
 
+    def __post_init__(self):
+        for f in fields(self):
+            value = getattr(self, f.name)
+            constraint_cls, is_timing = _constraint_type(f.name)
+            if is_timing and not isinstance(value, TimingConstraints):
+                timing = TimingConstraints(constraint_cls, value)
+                object.__setattr__(self, f.name, timing)
+
     def __len__(self) -> int:
         """
         Returns the total number of constraints across all types.
@@ -653,7 +999,28 @@ class Constraints:
         return "\n".join(lines)
 
 
-@dataclass
+def _is_timing(name: str) -> bool:
+    """
+    Returns whether the given :class:`Constraints` field stores timing
+    constraints.
+    """
+    return _constraint_type(name)[1]
+
+
+def _constraint_type(name: str) -> tuple[type, bool]:
+    """
+    Returns the constraint class of the given :class:`Constraints` field, and
+    whether that field stores timing constraints.
+    """
+    field_type = Constraints.__dataclass_fields__[name].type
+    if get_origin(field_type) is list:  # list[T]
+        return get_args(field_type)[0], False
+
+    # list[T] | TimingConstraints[T]
+    return get_args(get_args(field_type)[0])[0], True
+
+
+@dataclass(frozen=True)
 class Objective:
     r"""
     The objective class represents a weighted sum of objective functions :math:`f`, calculated as:
@@ -731,216 +1098,887 @@ class Objective:
         return "\n".join(lines)
 
 
-@dataclass
-class ProblemData:
+class SetupTimesIndex:
     """
-    Class that contains all data needed to solve the scheduling problem.
+    Sparse, read-only index of the sequence-dependent setup times. For each
+    machine, the setup times are stored in compressed sparse row (CSR) format,
+    mapping each task to its successors and the corresponding setup times.
+    Task pairs without a setup time have a setup time of zero.
 
     Parameters
     ----------
-    jobs
-        List of jobs.
-    resources
-        List of resources.
-    tasks
-        List of tasks.
-    modes
-        List of processing modes of tasks.
-    constraints
-        The constraints of this problem data instance.
-    objective
-        The objective function. Default is minimizing the makespan.
+    setup_times
+        List of setup time constraints. If the same machine and task pair
+        occurs multiple times, the last occurrence is used.
     """
 
-    jobs: list[Job]
-    resources: list[Resource]
-    tasks: list[Task]
-    modes: list[Mode]
-    constraints: Constraints = field(default_factory=lambda: Constraints())
-    objective: Objective = field(
-        default_factory=lambda: Objective(weight_makespan=1)
-    )
-
-    def __post_init__(self):
-        self._validate()
-
-        # After validation, we can safely set the helper attributes.
-        self._task2modes: list[list[int]] = [[] for _ in self.tasks]
-        self._task2resources: list[list[int]] = [[] for _ in self.tasks]
-        self._resource2modes: list[list[int]] = [[] for _ in self.resources]
+    def __init__(self, setup_times: list[SetupTime]):
+        machine2items: dict[int, list[tuple[int, int, int]]] = defaultdict(
+            list
+        )
+        for machine, task1, task2, duration in setup_times:
+            machine2items[machine].append((task1, task2, duration))
+
+        # Each machine maps to a tuple of arrays (rows, indptr, succ, dur):
+        # ``rows`` contains the sorted task indices that have successors,
+        # and the successors of ``rows[i]`` are stored in
+        # ``succ[indptr[i]:indptr[i + 1]]``, sorted by task index, with the
+        # corresponding setup times in ``dur``.
+        self._machine2csr: dict[int, tuple[np.ndarray, ...]] = {}
+
+        for machine, items in machine2items.items():
+            arr = np.array(items, dtype=np.int64)
+
+            # Sort by (task1, task2), keeping only the last occurrence of
+            # duplicate task pairs. Reversing first ensures that the stable
+            # sort puts the last occurrence of each pair first.
+            arr = arr[::-1]
+            arr = arr[np.lexsort((arr[:, 1], arr[:, 0]))]
+            is_first = np.ones(len(arr), dtype=bool)
+            is_first[1:] = np.any(arr[1:, :2] != arr[:-1, :2], axis=1)
+            arr = arr[is_first]
+
+            rows, counts = np.unique(arr[:, 0], return_counts=True)
+            indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+            np.cumsum(counts, out=indptr[1:])
+            self._machine2csr[machine] = (rows, indptr, arr[:, 1], arr[:, 2])
 
-        for mode_idx, mode in enumerate(self.modes):
-            self._task2modes[mode.task].append(mode_idx)
-            self._task2resources[mode.task].extend(mode.resources)
-            for res_idx in mode.resources:
-                self._resource2modes[res_idx].append(mode_idx)
+    def __len__(self) -> int:
+        """
+        Returns the number of unique setup time entries.
+        """
+        return sum(len(csr[2]) for csr in self._machine2csr.values())
 
-        self._task2resources = [sorted(set(v)) for v in self._task2resources]
+    def has_setup_times(self, machine: int) -> bool:
+        """
+        Returns whether the given machine has any positive setup times.
+        """
+        if machine not in self._machine2csr:
+            return False
 
-        self._machine_idcs: list[int] = []
-        self._renewable_idcs: list[int] = []
-        self._consumable_idcs: list[int] = []
+        return bool(np.any(self._machine2csr[machine][3] > 0))
 
-        for idx, resource in enumerate(self.resources):
-            if isinstance(resource, Machine):
-                self._machine_idcs.append(idx)
-            elif isinstance(resource, Renewable):
-                self._renewable_idcs.append(idx)
-            elif isinstance(resource, Consumable):
-                self._consumable_idcs.append(idx)
-            else:
-                # This can't happen now, but we'd like to know if it does
-                # in the future.
-                raise TypeError(
-                    f"Unexpected resource type: {resource.__class__.__name__}"
-                )
+    def _row(self, machine: int, task: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the successor and setup time arrays of the given task.
+        """
+        if machine not in self._machine2csr:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
 
-    def __str__(self):
-        lines = [
-            f"{len(self.jobs)} jobs",
-            f"{len(self.resources)} resources",
-        ]
+        rows, indptr, succ, dur = self._machine2csr[machine]
+        idx = np.searchsorted(rows, task)
+        if idx == len(rows) or rows[idx] != task:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
 
-        parts = []
-        if self.num_machines > 0:
-            parts.append(f"{self.num_machines} machines")
-        if self.num_renewables > 0:
-            parts.append(f"{self.num_renewables} renewables")
-        if self.num_consumables > 0:
-            parts.append(f"{self.num_consumables} consumables")
+        start, end = indptr[idx], indptr[idx + 1]
+        return succ[start:end], dur[start:end]
 
-        for idx, part in enumerate(parts):
-            symbol = "└─" if idx == len(parts) - 1 else "├─"
-            lines.append(f"{symbol} {part}")
+    def successors(self, machine: int, task: int) -> dict[int, int]:
+        """
+        Returns the setup times from the given task to its successors on the
+        given machine.
 
-        lines.extend(
-            [
-                f"{len(self.tasks)} tasks",
-                f"{len(self.modes)} modes",
-                str(self.constraints).rstrip(),
-                str(self.objective).rstrip(),
-            ]
-        )
+        Parameters
+        ----------
+        machine
+            The machine index.
+        task
+            The task index.
 
-        return "\n".join(lines)
+        Returns
+        -------
+        dict[int, int]
+            Mapping from successor task index to setup time. Successors
+            without setup times are not included.
+        """
+        succ, dur = self._row(machine, task)
+        return dict(zip(succ.tolist(), dur.tolist()))
 
-    def _validate(self):
+    def get(self, machine: int, task1: int, task2: int) -> int:
         """
-        Validates the problem data parameters.
+        Returns the setup time between task 1 and task 2 on the given machine,
+        or zero if there is no such setup time.
         """
-        for job_idx, job in enumerate(self.jobs):
-            if len(job.tasks) == 0:
-                msg = f"Job {job_idx} does not reference any task."
-                raise ValueError(msg)
+        succ, dur = self._row(machine, task1)
+        idx = np.searchsorted(succ, task2)
+        if idx == len(succ) or succ[idx] != task2:
+            return 0
 
-            for task_idx in job.tasks:
-                if not (0 <= task_idx < self.num_tasks):
-                    msg = f"Job {job_idx} references to unknown task index."
-                    raise ValueError(msg)
+        return int(dur[idx])
 
-                if job_idx != self.tasks[task_idx].job:
-                    msg = (
-                        f"Job {job_idx} contains task {task_idx}, but task "
-                        f"belongs to job {self.tasks[task_idx].job}."
-                    )
-                    raise ValueError(msg)
+    def matrix(self, machine: int, tasks: list[int]) -> np.ndarray:
+        """
+        Returns the dense setup times matrix of the given machine, restricted
+        to the given tasks.
 
-        for idx, task in enumerate(self.tasks):
-            if task.job is not None and not (0 <= task.job < self.num_jobs):
-                msg = f"Task {idx} references to unknown job index."
-                raise ValueError(msg)
+        Parameters
+        ----------
+        machine
+            The machine index.
+        tasks
+            List of unique task indices. Row and column ``i`` of the returned
+            matrix correspond to ``tasks[i]``.
 
-        for idx, mode in enumerate(self.modes):
-            if not (0 <= mode.task < self.num_tasks):
-                raise ValueError(f"Mode {idx} references unknown task index.")
+        Returns
+        -------
+        np.ndarray
+            Setup times matrix of shape ``(len(tasks), len(tasks))``.
+        """
+        num_tasks = len(tasks)
+        matrix = np.zeros((num_tasks, num_tasks), dtype=np.int64)
 
-            for res_idx in mode.resources:
-                if not (0 <= res_idx < self.num_resources):
-                    msg = f"Mode {idx} references unknown resource index."
-                    raise ValueError(msg)
+        if machine not in self._machine2csr or num_tasks == 0:
+            return matrix
 
-        task_set = set(range(self.num_tasks))
-        missing_tasks = task_set - {m.task for m in self.modes}
-        for idx in sorted(missing_tasks):
-            raise ValueError(f"Processing modes missing for task {idx}.")
+        rows, indptr, succ, dur = self._machine2csr[machine]
+        task1 = np.repeat(rows, np.diff(indptr))
 
-        infeasible_modes = Counter()
-        num_modes = Counter()
+        # Map global task indices to positions in the given list of tasks,
+        # and drop all entries that involve tasks not in the list.
+        tasks_arr = np.asarray(tasks, dtype=np.int64)
+        order = np.argsort(tasks_arr)
+        sorted_tasks = tasks_arr[order]
 
-        for mode in self.modes:
-            num_modes[mode.task] += 1
-            infeasible_modes[mode.task] += any(
-                # Assumes that machines have zero capacity.
-                demand > getattr(self.resources[res], "capacity", 0)
-                for demand, res in zip(mode.demands, mode.resources)
-            )
+        def positions(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+            idcs = np.searchsorted(sorted_tasks, values)
+            idcs = np.minimum(idcs, num_tasks - 1)
+            return order[idcs], sorted_tasks[idcs] == values
 
-        for task, count in num_modes.items():
-            if infeasible_modes[task] == count:
-                msg = f"All modes for task {task} have infeasible demands."
-                raise ValueError(msg)
+        pos1, found1 = positions(task1)
+        pos2, found2 = positions(succ)
+        found = found1 & found2
+        matrix[pos1[found], pos2[found]] = dur[found]
 
-        task_pair_constraints = [
-            (self.constraints.start_before_start, "start_before_start"),
-            (self.constraints.start_before_end, "start_before_end"),
-            (self.constraints.end_before_start, "end_before_start"),
-            (self.constraints.end_before_end, "end_before_end"),
-            (self.constraints.identical_resources, "identical_resources"),
-            (self.constraints.different_resources, "different_resources"),
-            (self.constraints.consecutive, "consecutive"),
-        ]
+        return matrix
 
-        for constraints, name in task_pair_constraints:
-            for idx1, idx2, *_ in constraints:
-                if not (0 <= idx1 < self.num_tasks):
-                    raise ValueError(f"Invalid task index {idx1} in {name}.")
 
-                if not (0 <= idx2 < self.num_tasks):
-                    raise ValueError(f"Invalid task index {idx2} in {name}.")
+class ProblemArrays:
+    """
+    Read-only columnar view of the problem data, which stores the attributes
+    of jobs, resources, tasks, modes and timing constraints in NumPy arrays.
+    This allows vectorized computations without per-object attribute access.
 
-        res2tasks = defaultdict(set)
-        for mode in self.modes:
-            for res_idx in mode.resources:
-                res2tasks[res_idx].add(mode.task)
+    Parameters
+    ----------
+    data
+        The problem data instance.
 
-        same_sequence = self.constraints.same_sequence
-        for res_idx1, res_idx2, task_idcs1, task_idcs2 in same_sequence:
-            if not (0 <= res_idx1 < self.num_resources):
-                msg = f"Invalid resource index {res_idx1} in same_sequence."
-                raise ValueError(msg)
+    Attributes
+    ----------
+    job_weight
+        Weight of each job.
+    job_release_date
+        Release date of each job.
+    job_deadline
+        Deadline of each job.
+    job_due_date
+        Due date of each job, or zero if the job has no due date.
+    job_has_due_date
+        Whether each job has a due date.
+    job_indptr
+        Index pointers of the job tasks. The tasks of job ``j`` are stored in
+        ``job_tasks[job_indptr[j]:job_indptr[j + 1]]``.
+    job_tasks
+        Task indices of all jobs, concatenated.
+    resource_capacity
+        Capacity of each resource. Machines have zero capacity.
+    task_job
+        Job index of each task, or -1 if the task does not belong to a job.
+    task_has_job
+        Whether each task belongs to a job.
+    task_earliest_start
+        Earliest start time of each task.
+    task_latest_start
+        Latest start time of each task.
+    task_earliest_end
+        Earliest end time of each task.
+    task_latest_end
+        Latest end time of each task.
+    task_allow_idle
+        Whether each task allows idle time.
+    task_allow_breaks
+        Whether each task allows breaks.
+    task_optional
+        Whether each task is optional.
+    mode_task
+        Task index of each mode.
+    mode_duration
+        Processing duration of each mode.
+    mode_indptr
+        Index pointers of the mode resources and demands. The resources of
+        mode ``m`` are stored in ``mode_resources[mode_indptr[m]:mode_indptr[m
+        + 1]]``, with the corresponding demands in ``mode_demands``.
+    mode_resources
+        Resource indices of all modes, concatenated.
+    mode_demands
+        Demands of all modes, concatenated.
+    precedences
+        Mapping from each timing constraint field name of
+        :class:`Constraints` (e.g., ``"end_before_start"``) to an array of
+        shape ``(num_constraints, 3)``, with columns task 1, task 2 and delay.
+    setup_times
+        Array of shape ``(num_setup_times, 4)`` with columns machine, task 1,
+        task 2 and duration.
+    """
 
-            if not (0 <= res_idx2 < self.num_resources):
-                msg = f"Invalid resource index {res_idx2} in same_sequence."
-                raise ValueError(msg)
+    # Names of the array attributes, excluding the timing constraints.
+    COLUMNS = (
+        "job_weight",
+        "job_release_date",
+        "job_deadline",
+        "job_due_date",
+        "job_has_due_date",
+        "job_indptr",
+        "job_tasks",
+        "resource_capacity",
+        "task_job",
+        "task_has_job",
+        "task_earliest_start",
+        "task_latest_start",
+        "task_earliest_end",
+        "task_latest_end",
+        "task_allow_idle",
+        "task_allow_breaks",
+        "task_optional",
+        "mode_task",
+        "mode_duration",
+        "mode_indptr",
+        "mode_resources",
+        "mode_demands",
+        "setup_times",
+    )
 
-            if not isinstance(self.resources[res_idx1], Machine):
-                msg = f"Resource {res_idx1} is not a machine in same_sequence."
-                raise ValueError(msg)
+    _TIMING_CONSTRAINTS = (
+        "start_before_start",
+        "start_before_end",
+        "end_before_start",
+        "end_before_end",
+        "start_at_start",
+        "start_at_end",
+        "end_at_start",
+        "end_at_end",
+    )
 
-            if not isinstance(self.resources[res_idx2], Machine):
-                msg = f"Resource {res_idx2} is not a machine in same_sequence."
-                raise ValueError(msg)
+    def __init__(self, data: "ProblemData"):
+        self._make_job_arrays(data.jobs)
+        self._make_resource_arrays(data.resources)
+        self._make_task_arrays(data.tasks)
+        self._make_mode_arrays(data.modes)
+        self._make_constraint_arrays(data.constraints)
+
+    def _make_job_arrays(self, jobs: list[Job]):
+        self.job_weight = _array([job.weight for job in jobs])
+        self.job_release_date = _array([job.release_date for job in jobs])
+        self.job_deadline = _array([job.deadline for job in jobs])
+        self.job_due_date = _array([job.due_date or 0 for job in jobs])
+        self.job_has_due_date = _array(
+            [job.due_date is not None for job in jobs], dtype=bool
+        )
+        self.job_indptr, self.job_tasks = _csr([job.tasks for job in jobs])
 
-            res_tasks1 = res2tasks[res_idx1]
-            res_tasks2 = res2tasks[res_idx2]
+    def _make_resource_arrays(self, resources: list[Resource]):
+        self.resource_capacity = _array(
+            [getattr(res, "capacity", 0) for res in resources]
+        )
 
-            if len(res_tasks1) != len(res_tasks2):
-                msg = (
-                    "Machines in same_sequence constraint must handle"
-                    " the same number of tasks."
-                )
-                raise ValueError(msg)
+    def _make_task_arrays(self, tasks: list[Task]):
+        self.task_job = _array(
+            [-1 if task.job is None else task.job for task in tasks]
+        )
+        self.task_has_job = _array(
+            [task.job is not None for task in tasks], dtype=bool
+        )
+        self.task_earliest_start = _array([t.earliest_start for t in tasks])
+        self.task_latest_start = _array([t.latest_start for t in tasks])
+        self.task_earliest_end = _array([t.earliest_end for t in tasks])
+        self.task_latest_end = _array([t.latest_end for t in tasks])
+        self.task_allow_idle = _array(
+            [task.allow_idle for task in tasks], dtype=bool
+        )
+        self.task_allow_breaks = _array(
+            [task.allow_breaks for task in tasks], dtype=bool
+        )
+        self.task_optional = _array(
+            [task.optional for task in tasks], dtype=bool
+        )
 
-            if task_idcs1 is None and task_idcs2 is None:
-                continue
+    def _make_mode_arrays(self, modes: list[Mode]):
+        self.mode_task = _array([mode.task for mode in modes])
+        self.mode_duration = _array([mode.duration for mode in modes])
+        self.mode_indptr, self.mode_resources = _csr(
+            [mode.resources for mode in modes]
+        )
+        _, self.mode_demands = _csr([mode.demands for mode in modes])
+
+    def _make_constraint_arrays(self, constraints: Constraints):
+        self.precedences: dict[str, np.ndarray] = {}
+        for name in self._TIMING_CONSTRAINTS:
+            timing = getattr(constraints, name)
+            values = np.column_stack(
+                [timing.task1, timing.task2, timing.delay]
+            )
+            self.precedences[name] = _array(values)
 
-            for task_idx in task_idcs1:
-                if not (0 <= task_idx < self.num_tasks):
-                    msg = f"Invalid task index {task_idx} in same_sequence."
-                    raise ValueError(msg)
+        self.setup_times = _array(
+            [
+                (c.machine, c.task1, c.task2, c.duration)
+                for c in constraints.setup_times
+            ]
+        ).reshape(-1, 4)
+
+    def replace(
+        self,
+        jobs: list[Job] | None = None,
+        resources: list[Resource] | None = None,
+        tasks: list[Task] | None = None,
+        modes: list[Mode] | None = None,
+        constraints: Constraints | None = None,
+    ) -> "ProblemArrays":
+        """
+        Returns a new view where the arrays of the given data are recomputed.
+        The arrays of data that is not given are shared with this view.
+        """
+        new: ProblemArrays = copy(self)
+
+        if jobs is not None:
+            new._make_job_arrays(jobs)
+
+        if resources is not None:
+            new._make_resource_arrays(resources)
+
+        if tasks is not None:
+            new._make_task_arrays(tasks)
+
+        if modes is not None:
+            new._make_mode_arrays(modes)
+
+        if constraints is not None:
+            new._make_constraint_arrays(constraints)
+
+        return new
+
+    def __setstate__(self, state: dict):
+        # Unpickled arrays are not necessarily read-only, depending on the
+        # pickle protocol.
+        self.__dict__.update(state)
+        for value in [*state.values(), *self.precedences.values()]:
+            if isinstance(value, np.ndarray):
+                value.flags.writeable = False
+
+
+def _array(values: list | np.ndarray, dtype=np.int64) -> np.ndarray:
+    """
+    Returns a read-only array of the given values.
+    """
+    arr = np.array(values, dtype=dtype)
+    arr.flags.writeable = False
+    return arr
+
+
+_READ_ONLY_MSG = "ProblemData is read-only; use ProblemData.replace()."
+
+_T = TypeVar("_T")
+
+
+class _FrozenList(list[_T]):
+    """
+    Read-only list, which raises a ``TypeError`` when it is modified.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(_READ_ONLY_MSG)
+
+    append = extend = insert = pop = remove = clear = _read_only
+    sort = reverse = __setitem__ = __delitem__ = _read_only
+    __iadd__ = __imul__ = _read_only
+
+    def __reduce__(self):
+        return _FrozenList, (list(self),)
+
+
+def _freeze(values: list[_T]) -> list[_T]:
+    """
+    Returns a read-only copy of the given list, or the list itself if it is
+    already read-only. The items themselves are not copied.
+    """
+    if isinstance(values, _FrozenList):
+        return values
+
+    return _FrozenList(values)
+
+
+def _freeze_constraints(constraints: Constraints) -> Constraints:
+    """
+    Returns read-only constraints with the same contents as the given
+    constraints, which are returned as is if they are already read-only.
+    """
+    frozen: dict[str, Any] = {}
+    for f in fields(Constraints):
+        value = getattr(constraints, f.name)
+        if isinstance(value, TimingConstraints):
+            frozen[f.name] = value.snapshot()
+        else:
+            frozen[f.name] = _freeze(value)
+
+    if all(frozen[name] is getattr(constraints, name) for name in frozen):
+        return constraints
+
+    return Constraints(**frozen)
+
+
+def _read_only(arr: np.ndarray) -> np.ndarray:
+    """
+    Returns a read-only view of the given array.
+    """
+    view = arr.view()
+    view.flags.writeable = False
+    return view
+
+
+def _out_of_range(values: np.ndarray, upper: int) -> np.ndarray:
+    """
+    Returns a mask of the values that are not in the range ``[0, upper)``.
+    """
+    return (values < 0) | (values >= upper)
+
+
+def _any_per_row(indptr: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """
+    Returns for each row of a CSR structure with the given index pointers
+    whether the mask is ``True`` for any of the row's entries.
+    """
+    num_rows = len(indptr) - 1
+    rows = np.repeat(np.arange(num_rows), np.diff(indptr))
+    return np.bincount(rows, mask, num_rows) > 0
+
+
+def _first(mask: np.ndarray) -> int | None:
+    """
+    Returns the index of the first ``True`` value in the mask, if any.
+    """
+    if not mask.any():
+        return None
+
+    return int(mask.argmax())
+
+
+def _csr(rows: list[list[int]]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the read-only index pointers and concatenated values of the given
+    rows.
+    """
+    lengths = np.fromiter(map(len, rows), np.int64, len(rows))
+    indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=indptr[1:])
+    indptr.flags.writeable = False
+
+    values = np.fromiter(chain.from_iterable(rows), np.int64, int(indptr[-1]))
+    values.flags.writeable = False
+
+    return indptr, values
+
+
+@dataclass(init=False)
+class ProblemData:
+    """
+    Class that contains all data needed to solve the scheduling problem.
+
+    Parameters
+    ----------
+    jobs
+        List of jobs.
+    resources
+        List of resources.
+    tasks
+        List of tasks.
+    modes
+        List of processing modes of tasks.
+    constraints
+        The constraints of this problem data instance.
+    objective
+        The objective function. Default is minimizing the makespan.
+    validate
+        Whether to validate the data. Default ``True``. Only set this to
+        ``False`` for data that is known to be valid, for example because it
+        was validated before. Invalid data may then result in errors later
+        on. Use :meth:`validate` to validate the data on demand.
+
+    Notes
+    -----
+    The lists of jobs, resources, tasks, modes and constraints are stored as
+    read-only copies, which raise a ``TypeError`` when they are modified.
+    The jobs, resources, tasks, modes and constraints themselves are not
+    copied, and are treated as immutable: they must not be modified in place
+    after creating the instance, including the lists stored on them such as
+    :attr:`Job.tasks`. Otherwise, cached derived data such as :attr:`arrays`
+    and :meth:`fingerprint` go stale. This lets :meth:`replace` share
+    unchanged data between instances; use :meth:`replace` to change data.
+
+    Pickling stores the derived indexes of this instance, so unpickling does
+    not validate the data again nor recompute the indexes.
+    """
+
+    resources: list[Resource]
+    constraints: Constraints = field(default_factory=lambda: Constraints())
+    objective: Objective = field(
+        default_factory=lambda: Objective(weight_makespan=1)
+    )
+
+    def __init__(
+        self,
+        jobs: list[Job],
+        resources: list[Resource],
+        tasks: list[Task],
+        modes: list[Mode],
+        constraints: Constraints | None = None,
+        objective: Objective | None = None,
+        *,
+        validate: bool = True,
+    ):
+        self._jobs: list[Job] | None = _freeze(jobs)
+        self.resources = _freeze(resources)
+        self._tasks: list[Task] | None = _freeze(tasks)
+        self._modes: list[Mode] | None = _freeze(modes)
+
+        # Names of the jobs, tasks and modes of an instance that is loaded
+        # lazily by from_npy(), whose objects are created on first access.
+        self._names: dict[str, list[str]] = {}
+        self.constraints = _freeze_constraints(
+            constraints if constraints is not None else Constraints()
+        )
+        self.objective = (
+            objective
+            if objective is not None
+            else Objective(weight_makespan=1)
+        )
+
+        # The columnar view is lazily computed, but already used during
+        # validation.
+        self._arrays: ProblemArrays | None = None
+
+        if validate:
+            self.validate()
+
+        self._make_mode_indexes()
+        self._make_resource_indexes()
+
+        # This index is lazily computed when setup times are first requested.
+        self._setup_times_index: SetupTimesIndex | None = None
+
+        # The fingerprint is lazily computed when it is first requested.
+        self._fingerprint: str | None = None
+
+    @property
+    def jobs(self) -> list[Job]:
+        """
+        Returns the read-only list of jobs.
+        """
+        if self._jobs is None:
+            jobs = _jobs_from_arrays(self.arrays, self._names)
+            self._jobs = _FrozenList(jobs)
+
+        return self._jobs
+
+    @property
+    def tasks(self) -> list[Task]:
+        """
+        Returns the read-only list of tasks.
+        """
+        if self._tasks is None:
+            tasks = _tasks_from_arrays(self.arrays, self._names)
+            self._tasks = _FrozenList(tasks)
+
+        return self._tasks
+
+    @property
+    def modes(self) -> list[Mode]:
+        """
+        Returns the read-only list of processing modes.
+        """
+        if self._modes is None:
+            modes = _modes_from_arrays(self.arrays, self._names)
+            self._modes = _FrozenList(modes)
+
+        return self._modes
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ProblemData):
+            return NotImplemented
+
+        return (
+            self.jobs == other.jobs
+            and self.resources == other.resources
+            and self.tasks == other.tasks
+            and self.modes == other.modes
+            and self.constraints == other.constraints
+            and self.objective == other.objective
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"ProblemData(jobs={self.jobs!r}, resources={self.resources!r}, "
+            f"tasks={self.tasks!r}, modes={self.modes!r}, "
+            f"constraints={self.constraints!r}, "
+            f"objective={self.objective!r})"
+        )
+
+    def _object_names(self) -> dict[str, list[str]]:
+        """
+        Returns the names of the jobs, tasks and modes, without creating these
+        objects if they are loaded lazily.
+        """
+        sections = {
+            "jobs": (self._jobs, self.num_jobs),
+            "tasks": (self._tasks, self.num_tasks),
+            "modes": (self._modes, self.num_modes),
+        }
 
-            for task_idx in task_idcs2:
-                if not (0 <= task_idx < self.num_tasks):
+        names = {}
+        for name, (items, num_items) in sections.items():
+            if items is None:
+                names[name] = self._names.get(name, [""] * num_items)
+            else:
+                names[name] = [item.name for item in items]
+
+        return names
+
+    def _make_mode_indexes(self):
+        """
+        Computes the mode and resource indexes of each task and resource.
+        These assume that the data is valid.
+        """
+        self._task2modes: list[list[int]] = [[] for _ in range(self.num_tasks)]
+        self._task2resources: list[list[int]] = [
+            [] for _ in range(self.num_tasks)
+        ]
+        self._resource2modes: list[list[int]] = [[] for _ in self.resources]
+
+        if self._modes is None:  # loaded lazily, so use the columnar view
+            arrays = self.arrays
+            mode_tasks = arrays.mode_task.tolist()
+            mode_resources = _split(arrays.mode_indptr, arrays.mode_resources)
+            modes = zip(mode_tasks, mode_resources)
+        else:
+            modes = ((mode.task, mode.resources) for mode in self._modes)
+
+        for mode_idx, (task_idx, resources) in enumerate(modes):
+            self._task2modes[task_idx].append(mode_idx)
+            self._task2resources[task_idx].extend(resources)
+            for res_idx in resources:
+                self._resource2modes[res_idx].append(mode_idx)
+
+        self._task2resources = [sorted(set(v)) for v in self._task2resources]
+
+    def _make_resource_indexes(self):
+        """
+        Computes the indices of each resource type.
+        """
+        self._machine_idcs: list[int] = []
+        self._renewable_idcs: list[int] = []
+        self._consumable_idcs: list[int] = []
+
+        for idx, resource in enumerate(self.resources):
+            if isinstance(resource, Machine):
+                self._machine_idcs.append(idx)
+            elif isinstance(resource, Renewable):
+                self._renewable_idcs.append(idx)
+            elif isinstance(resource, Consumable):
+                self._consumable_idcs.append(idx)
+            else:
+                # This can't happen now, but we'd like to know if it does
+                # in the future.
+                raise TypeError(
+                    f"Unexpected resource type: {resource.__class__.__name__}"
+                )
+
+    def __str__(self):
+        lines = [
+            f"{self.num_jobs} jobs",
+            f"{len(self.resources)} resources",
+        ]
+
+        parts = []
+        if self.num_machines > 0:
+            parts.append(f"{self.num_machines} machines")
+        if self.num_renewables > 0:
+            parts.append(f"{self.num_renewables} renewables")
+        if self.num_consumables > 0:
+            parts.append(f"{self.num_consumables} consumables")
+
+        for idx, part in enumerate(parts):
+            symbol = "└─" if idx == len(parts) - 1 else "├─"
+            lines.append(f"{symbol} {part}")
+
+        lines.extend(
+            [
+                f"{self.num_tasks} tasks",
+                f"{self.num_modes} modes",
+                str(self.constraints).rstrip(),
+                str(self.objective).rstrip(),
+            ]
+        )
+
+        return "\n".join(lines)
+
+    def validate(self):
+        """
+        Validates the problem data parameters. This is done automatically
+        when constructing the instance, unless ``validate=False`` is passed.
+        Most checks are vectorized over the columnar view of the data, see
+        :attr:`arrays`.
+
+        Raises
+        ------
+        ValueError
+            If the problem data is invalid.
+        """
+        arrays = self.arrays
+        num_jobs, num_tasks = self.num_jobs, self.num_tasks
+        num_resources, num_modes = self.num_resources, self.num_modes
+
+        job_tasks = arrays.job_tasks
+        entry_job = np.repeat(np.arange(num_jobs), np.diff(arrays.job_indptr))
+        unknown_task = _out_of_range(job_tasks, num_tasks)
+        mismatch = np.zeros_like(unknown_task)
+        known = ~unknown_task
+        mismatch[known] = arrays.task_job[job_tasks[known]] != entry_job[known]
+
+        empty_job = _first(np.diff(arrays.job_indptr) == 0)
+        invalid = _first(unknown_task | mismatch)
+
+        if invalid is not None and (
+            empty_job is None or entry_job[invalid] < empty_job
+        ):
+            job_idx, task_idx = entry_job[invalid], job_tasks[invalid]
+
+            if unknown_task[invalid]:
+                msg = f"Job {job_idx} references to unknown task index."
+                raise ValueError(msg)
+
+            msg = (
+                f"Job {job_idx} contains task {task_idx}, but task "
+                f"belongs to job {self.tasks[task_idx].job}."
+            )
+            raise ValueError(msg)
+
+        if empty_job is not None:
+            msg = f"Job {empty_job} does not reference any task."
+            raise ValueError(msg)
+
+        unknown_job = _out_of_range(arrays.task_job, num_jobs)
+        if (idx := _first(arrays.task_has_job & unknown_job)) is not None:
+            msg = f"Task {idx} references to unknown job index."
+            raise ValueError(msg)
+
+        mode_resources = arrays.mode_resources
+        unknown_task = _out_of_range(arrays.mode_task, num_tasks)
+        unknown_res = _any_per_row(
+            arrays.mode_indptr, _out_of_range(mode_resources, num_resources)
+        )
+
+        if (idx := _first(unknown_task | unknown_res)) is not None:
+            if unknown_task[idx]:
+                raise ValueError(f"Mode {idx} references unknown task index.")
+
+            msg = f"Mode {idx} references unknown resource index."
+            raise ValueError(msg)
+
+        num_task_modes = np.bincount(arrays.mode_task, minlength=num_tasks)
+        if (idx := _first(num_task_modes == 0)) is not None:
+            raise ValueError(f"Processing modes missing for task {idx}.")
+
+        # Assumes that machines have zero capacity.
+        capacity = arrays.resource_capacity[mode_resources]
+        infeasible = _any_per_row(
+            arrays.mode_indptr, arrays.mode_demands > capacity
+        )
+        num_task_infeasible = np.bincount(
+            arrays.mode_task, infeasible, num_tasks
+        )
+        all_infeasible = np.flatnonzero(num_task_infeasible == num_task_modes)
+
+        if len(all_infeasible) > 0:
+            # Report the task whose first mode comes first.
+            _, first_mode = np.unique(arrays.mode_task, return_index=True)
+            task = all_infeasible[np.argmin(first_mode[all_infeasible])]
+            msg = f"All modes for task {task} have infeasible demands."
+            raise ValueError(msg)
+
+        task_pair_constraints = [
+            "start_before_start",
+            "start_before_end",
+            "end_before_start",
+            "end_before_end",
+            "identical_resources",
+            "different_resources",
+            "consecutive",
+        ]
+
+        for name in task_pair_constraints:
+            if name in arrays.precedences:
+                pairs = arrays.precedences[name][:, :2]
+            else:
+                constraints = getattr(self.constraints, name)
+                pairs = _array([(c.task1, c.task2) for c in constraints])
+                pairs = pairs.reshape(-1, 2)
+
+            unknown = _out_of_range(pairs, num_tasks)
+            if (idx := _first(unknown.any(axis=1))) is not None:
+                task_idx = pairs[idx, 0] if unknown[idx, 0] else pairs[idx, 1]
+                raise ValueError(f"Invalid task index {task_idx} in {name}.")
+
+        is_machine = np.array(
+            [isinstance(res, Machine) for res in self.resources], dtype=bool
+        )
+
+        res_task = np.empty((0, 2), dtype=np.int64)
+        if self.constraints.same_sequence:
+            # Unique (resource, task) pairs, sorted by resource.
+            num_resources_per_mode = np.diff(arrays.mode_indptr)
+            entry_task = np.repeat(arrays.mode_task, num_resources_per_mode)
+            res_task = np.unique(
+                np.column_stack([mode_resources, entry_task]), axis=0
+            )
+
+        def res2tasks(res_idx: int) -> set[int]:
+            lo, hi = np.searchsorted(res_task[:, 0], [res_idx, res_idx + 1])
+            return set(res_task[lo:hi, 1].tolist())
+
+        same_sequence = self.constraints.same_sequence
+        for res_idx1, res_idx2, task_idcs1, task_idcs2 in same_sequence:
+            if not (0 <= res_idx1 < num_resources):
+                msg = f"Invalid resource index {res_idx1} in same_sequence."
+                raise ValueError(msg)
+
+            if not (0 <= res_idx2 < num_resources):
+                msg = f"Invalid resource index {res_idx2} in same_sequence."
+                raise ValueError(msg)
+
+            if not is_machine[res_idx1]:
+                msg = f"Resource {res_idx1} is not a machine in same_sequence."
+                raise ValueError(msg)
+
+            if not is_machine[res_idx2]:
+                msg = f"Resource {res_idx2} is not a machine in same_sequence."
+                raise ValueError(msg)
+
+            res_tasks1 = res2tasks(res_idx1)
+            res_tasks2 = res2tasks(res_idx2)
+
+            if len(res_tasks1) != len(res_tasks2):
+                msg = (
+                    "Machines in same_sequence constraint must handle"
+                    " the same number of tasks."
+                )
+                raise ValueError(msg)
+
+            if task_idcs1 is None and task_idcs2 is None:
+                continue
+
+            for task_idx in [*task_idcs1, *task_idcs2]:
+                if not (0 <= task_idx < num_tasks):
                     msg = f"Invalid task index {task_idx} in same_sequence."
                     raise ValueError(msg)
 
@@ -952,66 +1990,113 @@ class ProblemData:
                 msg = "tasks2 must exactly match tasks that require machine2."
                 raise ValueError(msg)
 
-        for res_idx, task_idx1, task_idx2, _ in self.constraints.setup_times:
-            if not (0 <= res_idx < self.num_resources):
+        res_idcs, task_idcs1, task_idcs2, _ = arrays.setup_times.T
+        unknown_res = _out_of_range(res_idcs, num_resources)
+        unknown_task1 = _out_of_range(task_idcs1, num_tasks)
+        unknown_task2 = _out_of_range(task_idcs2, num_tasks)
+        not_machine = np.zeros_like(unknown_res)
+        not_machine[~unknown_res] = ~is_machine[res_idcs[~unknown_res]]
+        invalid = _first(
+            unknown_res | unknown_task1 | unknown_task2 | not_machine
+        )
+
+        if invalid is not None:
+            if unknown_res[invalid]:
+                res_idx = res_idcs[invalid]
                 msg = f"Invalid resource index {res_idx} in setup_times."
                 raise ValueError(msg)
 
-            if not (0 <= task_idx1 < self.num_tasks):
-                msg = f"Invalid task index in setup_times: {task_idx1}."
+            if unknown_task1[invalid]:
+                task_idx = task_idcs1[invalid]
+                msg = f"Invalid task index in setup_times: {task_idx}."
                 raise ValueError(msg)
 
-            if not (0 <= task_idx2 < self.num_tasks):
-                msg = f"Invalid task index in setup_times: {task_idx2}."
+            if unknown_task2[invalid]:
+                task_idx = task_idcs2[invalid]
+                msg = f"Invalid task index in setup_times: {task_idx}."
                 raise ValueError(msg)
 
-            if not isinstance(self.resources[res_idx], Machine):
-                raise ValueError("Setup times only allowed for machines.")
+            raise ValueError("Setup times only allowed for machines.")
+
+        mode_deps = self.constraints.mode_dependencies
+        mode_idcs1 = _array([dep.mode1 for dep in mode_deps])
+        indptr, mode_idcs2 = _csr([dep.modes2 for dep in mode_deps])
+        entry_dep = np.repeat(np.arange(len(mode_deps)), np.diff(indptr))
+        unknown_mode1 = _out_of_range(mode_idcs1, num_modes)
+        unknown_entry = _out_of_range(mode_idcs2, num_modes)
+        unknown_mode2 = _any_per_row(indptr, unknown_entry)
+
+        # A dependency is invalid if all its modes refer to the same task.
+        valid = ~(unknown_mode1 | unknown_mode2)
+        entry_valid = valid[entry_dep]
+        other_task = np.zeros_like(unknown_entry)
+        other_task[entry_valid] = (
+            arrays.mode_task[mode_idcs2[entry_valid]]
+            != arrays.mode_task[mode_idcs1[entry_dep[entry_valid]]]
+        )
+        same_task = valid & ~_any_per_row(indptr, other_task)
+        invalid = _first(unknown_mode1 | unknown_mode2 | same_task)
+
+        if invalid is not None:
+            idx1, idcs2 = mode_deps[invalid]
 
-        for idx1, idcs2 in self.constraints.mode_dependencies:
-            if not (0 <= idx1 < self.num_modes):
+            if unknown_mode1[invalid]:
                 msg = f"Invalid mode index {idx1} in mode dependencies."
                 raise ValueError(msg)
 
-            for idx in idcs2:
-                if not (0 <= idx < self.num_modes):
-                    msg = f"Invalid mode index {idx} in mode dependencies."
-                    raise ValueError(msg)
+            if unknown_mode2[invalid]:
+                entries = unknown_entry[indptr[invalid] : indptr[invalid + 1]]
+                idx = idcs2[_first(entries)]
+                msg = f"Invalid mode index {idx} in mode dependencies."
+                raise ValueError(msg)
 
             modes = [idx1, *idcs2]
-            if len({self.modes[idx].task for idx in modes}) == 1:
-                msg = (
-                    f"All modes {modes} in mode dependency constraint"
-                    " refer to the same task."
-                )
-                raise ValueError(msg)
+            msg = (
+                f"All modes {modes} in mode dependency constraint"
+                " refer to the same task."
+            )
+            raise ValueError(msg)
 
         selection_constraints = [
-            (self.constraints.select_all_or_none, "select_all_or_none"),
-            (self.constraints.select_at_least_one, "select_at_least_one"),
-            (self.constraints.select_exactly_one, "select_exactly_one"),
+            "select_all_or_none",
+            "select_at_least_one",
+            "select_exactly_one",
         ]
-        for constraints, name in selection_constraints:
-            for idcs1, idx2 in constraints:
-                if not idcs1:
-                    msg = "Task list cannot be empty in select_all_or_none."
-                    raise ValueError(msg)
+        for name in selection_constraints:
+            constraints = getattr(self.constraints, name)
+            indptr, task_idcs = _csr([c.tasks for c in constraints])
+            unknown_entry = _out_of_range(task_idcs, num_tasks)
+            unknown_tasks = _any_per_row(indptr, unknown_entry)
+
+            has_cond = _array(
+                [c.condition_task is not None for c in constraints], bool
+            )
+            cond = _array([c.condition_task or 0 for c in constraints])
+            unknown_cond = has_cond & _out_of_range(cond, num_tasks)
+            empty = np.diff(indptr) == 0
+            invalid = _first(empty | unknown_tasks | unknown_cond)
 
-                for idx in idcs1:
-                    if not (0 <= idx < self.num_tasks):
-                        msg = f"Invalid task index {idx} in {name}."
-                        raise ValueError(msg)
+            if invalid is None:
+                continue
 
-                if idx2 is not None and not (0 <= idx2 < self.num_tasks):
-                    msg = f"Invalid task index {idx2} in {name}."
-                    raise ValueError(msg)
+            if empty[invalid]:
+                msg = "Task list cannot be empty in select_all_or_none."
+                raise ValueError(msg)
+
+            if unknown_tasks[invalid]:
+                entries = unknown_entry[indptr[invalid] : indptr[invalid + 1]]
+                idx = constraints[invalid].tasks[_first(entries)]
+                raise ValueError(f"Invalid task index {idx} in {name}.")
+
+            idx = cond[invalid]
+            raise ValueError(f"Invalid task index {idx} in {name}.")
 
         if (
             self.objective.weight_tardy_jobs > 0
             or self.objective.weight_total_tardiness > 0
             or self.objective.weight_total_earliness > 0
             or self.objective.weight_max_tardiness > 0
-        ) and any(job.due_date is None for job in self.jobs):
+        ) and not arrays.job_has_due_date.all():
             msg = "Job due dates required for due date-based objectives."
             raise ValueError(msg)
 
@@ -1030,10 +2115,14 @@ class ProblemData:
         modes: list[Mode] | None = None,
         constraints: Constraints | None = None,
         objective: Objective | None = None,
+        validate: bool = True,
     ) -> "ProblemData":
         """
         Returns a new ProblemData instance with possibly replaced data. If a
-        parameter is not provided, the original data is deepcopied instead.
+        parameter is not provided, the original data is shared with the new
+        instance rather than copied, which is safe because the data is
+        read-only. Derived indexes that only depend on unchanged data are
+        shared as well.
 
         Parameters
         ----------
@@ -1049,38 +2138,63 @@ class ProblemData:
             Optional constraints.
         objective
             Optional objective function.
+        validate
+            Whether to validate the new instance. Default ``True``.
 
         Returns
         -------
         ProblemData
             A new ProblemData instance with possibly replaced data.
         """
+        new: ProblemData = copy(self)  # shares all data and indexes
 
-        def _deepcopy_if_none(value: _T | None, default: _T) -> _T:
-            return value if value is not None else deepcopy(default)
+        if jobs is not None:
+            new._jobs = _freeze(jobs)
 
-        jobs = _deepcopy_if_none(jobs, self.jobs)
-        resources = _deepcopy_if_none(resources, self.resources)
-        tasks = _deepcopy_if_none(tasks, self.tasks)
-        modes = _deepcopy_if_none(modes, self.modes)
-        constraints = _deepcopy_if_none(constraints, self.constraints)
-        objective = _deepcopy_if_none(objective, self.objective)
+        if resources is not None:
+            new.resources = _freeze(resources)
 
-        return ProblemData(
-            jobs=jobs,
-            resources=resources,
-            tasks=tasks,
-            modes=modes,
-            constraints=constraints,
-            objective=objective,
-        )
+        if tasks is not None:
+            new._tasks = _freeze(tasks)
+
+        if modes is not None:
+            new._modes = _freeze(modes)
+
+        if constraints is not None:
+            new.constraints = _freeze_constraints(constraints)
+
+        if objective is not None:
+            new.objective = objective
+
+        if self._arrays is not None:
+            new._arrays = self._arrays.replace(
+                jobs, resources, tasks, modes, constraints
+            )
+
+        if validate:
+            new.validate()
+
+        if tasks is not None or resources is not None or modes is not None:
+            new._make_mode_indexes()
+
+        if resources is not None:
+            new._make_resource_indexes()
+
+        if constraints is not None:
+            new._setup_times_index = None
+
+        new._fingerprint = None
+        return new
 
     @property
     def num_jobs(self) -> int:
         """
         Returns the number of jobs in this instance.
         """
-        return len(self.jobs)
+        if self._jobs is None:
+            return len(self.arrays.job_weight)
+
+        return len(self._jobs)
 
     @property
     def num_resources(self) -> int:
@@ -1115,14 +2229,20 @@ class ProblemData:
         """
         Returns the number of tasks in this instance.
         """
-        return len(self.tasks)
+        if self._tasks is None:
+            return len(self.arrays.task_job)
+
+        return len(self._tasks)
 
     @property
     def num_modes(self) -> int:
         """
         Returns the number of modes in this instance.
         """
-        return len(self.modes)
+        if self._modes is None:
+            return len(self.arrays.mode_task)
+
+        return len(self._modes)
 
     @property
     def num_constraints(self) -> int:
@@ -1154,6 +2274,30 @@ class ProblemData:
         """
         return self._consumable_idcs
 
+    @property
+    def setup_times_index(self) -> SetupTimesIndex:
+        """
+        Returns the sparse index of the setup times constraints. The index is
+        computed once and cached on this instance.
+        """
+        if self._setup_times_index is None:
+            setup_times = self.constraints.setup_times
+            self._setup_times_index = SetupTimesIndex(setup_times)
+
+        return self._setup_times_index
+
+    @property
+    def arrays(self) -> ProblemArrays:
+        """
+        Returns the read-only columnar view of this instance. The view is
+        computed once and cached on this instance, so it does not reflect
+        later in-place modifications of the data.
+        """
+        if self._arrays is None:
+            self._arrays = ProblemArrays(self)
+
+        return self._arrays
+
     def task2modes(self, task: int) -> list[int]:
         """
         Returns the list of mode indices corresponding to the given task.
@@ -1208,6 +2352,62 @@ class ProblemData:
             raise ValueError(f"Invalid task index {task}.")
         return self._task2resources[task]
 
+    def fingerprint(self) -> str:
+        """
+        Returns a content digest of this instance, which can be used to key
+        caches or to deduplicate instances. Equal instances have the same
+        fingerprint, and the fingerprint is stable across processes, Python
+        versions and platforms.
+
+        The digest is a BLAKE2b hash over the columns of :attr:`arrays` in
+        little-endian byte order, followed by a canonical encoding of the
+        resources, objective, names and remaining constraints. It is
+        computed once and cached on this instance, so it does not reflect
+        later in-place modifications of the data.
+
+        Returns
+        -------
+        str
+            Hexadecimal digest of 64 characters.
+        """
+        if self._fingerprint is not None:
+            return self._fingerprint
+
+        digest = hashlib.blake2b(
+            f"pyjobshop-{_FINGERPRINT_VERSION}".encode(), digest_size=32
+        )
+        arrays = self.arrays
+        columns = {
+            name: value
+            for name, value in vars(arrays).items()
+            if isinstance(value, np.ndarray)
+        }
+        columns.update(arrays.precedences)
+
+        for name in _PAIR_CONSTRAINTS:
+            pairs = [tuple(c) for c in getattr(self.constraints, name)]
+            columns[name] = _array(pairs).reshape(-1, 2)
+
+        for name in sorted(columns):
+            column = np.ascontiguousarray(columns[name], dtype="<i8")
+            digest.update(f"{name}{column.shape}".encode())
+            digest.update(column.data)
+
+        meta = {
+            "resources": [_resource_to_dict(res) for res in self.resources],
+            "objective": asdict(self.objective),
+            "constraints": {
+                name: [asdict(c) for c in getattr(self.constraints, name)]
+                for name in _LIST_CONSTRAINTS
+            },
+            "names": list(self._object_names().values()),
+        }
+        encoded = json.dumps(meta, sort_keys=True, separators=(",", ":"))
+        digest.update(encoded.encode())
+
+        self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
     def to_json(self, indent: int | str | None = 2, **kwargs) -> str:
         """
         Serializes this ProblemData instance to a JSON string.
@@ -1227,23 +2427,21 @@ class ProblemData:
         str
             JSON representation of this problem data instance.
         """
-        data = asdict(self)
-
-        for idx, resource in enumerate(self.resources):
-            # Store resource type information for deserialization.
-            if isinstance(resource, Machine):
-                cls_name = "machine"
-            elif isinstance(resource, Renewable):
-                cls_name = "renewable"
+        data: dict[str, Any] = {}
+        for name, section in self._json_sections():
+            if name == "constraints":
+                data[name] = {key: list(it) for key, it in section.items()}
+            elif name == "objective":
+                data[name] = section
             else:
-                cls_name = "consumable"
-
-            data["resources"][idx]["type"] = cls_name
+                data[name] = list(section)
 
         return json.dumps(data, indent=indent, **kwargs)
 
     @classmethod
-    def from_json(cls, json_str: str, **kwargs) -> "ProblemData":
+    def from_json(
+        cls, json_str: str, validate: bool = True, **kwargs
+    ) -> "ProblemData":
         """
         Deserializes a ProblemData instance from a JSON string.
 
@@ -1251,6 +2449,8 @@ class ProblemData:
         ----------
         json_str
             The JSON string to deserialize.
+        validate
+            Whether to validate the deserialized instance. Default ``True``.
         **kwargs
             Additional keyword arguments passed to :func:`json.loads`.
 
@@ -1266,37 +2466,19 @@ class ProblemData:
         modes = [Mode(**mode) for mode in data.get("modes", [])]
         objective = Objective(**data.get("objective", {}))
 
-        resources: list[Resource] = []
-        res_name2cls = {
-            res_cls.__name__.lower(): res_cls for res_cls in get_args(Resource)
-        }
-
-        for resource in data.get("resources", []):
-            # Convert breaks to tuple format.
-            resource["breaks"] = list(map(tuple, resource.get("breaks", [])))
-
-            # The 'type' field determines which Resource class to use, but
-            # it should be removed as it's not a constructor parameter.
-            res_type = resource.pop("type")
-            if res_type not in res_name2cls:
-                raise ValueError(f"Unknown resource type: {res_type}.")
-
-            res_cls = res_name2cls[res_type]
-            resources.append(res_cls(**resource))
+        resources = [
+            _resource_from_dict(res) for res in data.get("resources", [])
+        ]
 
         constraints_data = data.get("constraints", {})
-        kwargs = {}
-
-        for f in fields(Constraints):
-            # Each field is expected to be of the form list[ConstraintClass].
-            # We derive the constraint class from the type hints.
-            constraint_cls = get_args(f.type)[0]  # extracts T from list[T]
-            kwargs[f.name] = [
-                constraint_cls(**item)
-                for item in constraints_data.get(f.name, [])
-            ]
-
-        constraints = Constraints(**kwargs)
+        constraints = Constraints(
+            **{
+                f.name: _constraints_from_dicts(
+                    f.name, constraints_data.get(f.name, [])
+                )
+                for f in fields(Constraints)
+            }
+        )
 
         return cls(
             jobs=jobs,
@@ -1305,4 +2487,562 @@ class ProblemData:
             modes=modes,
             constraints=constraints,
             objective=objective,
+            validate=validate,
         )
+
+    def _json_sections(self) -> Iterator[tuple[str, Any]]:
+        """
+        Yields the name and contents of each top-level section of the JSON
+        representation. List sections are yielded as iterables of (shallow)
+        dictionaries, which are created lazily; the constraints section is
+        a dictionary of such iterables.
+        """
+        yield "jobs", map(_as_dict, self.jobs)
+        yield "resources", map(_resource_to_dict, self.resources)
+        yield "tasks", map(_as_dict, self.tasks)
+        yield "modes", map(_as_dict, self.modes)
+
+        constraints: dict[str, Iterable[dict]] = {}
+        for f in fields(Constraints):
+            value = getattr(self.constraints, f.name)
+            if isinstance(value, TimingConstraints):
+                # Timing constraints are stored in the same format as the
+                # other constraints: as a list of objects.
+                constraints[f.name] = (
+                    {"task1": task1, "task2": task2, "delay": delay}
+                    for task1, task2, delay in zip(
+                        value.task1.tolist(),
+                        value.task2.tolist(),
+                        value.delay.tolist(),
+                    )
+                )
+            else:
+                constraints[f.name] = map(_as_dict, value)
+
+        yield "constraints", constraints
+        yield "objective", _as_dict(self.objective)
+
+    def dump_json(self, fh: TextIO):
+        """
+        Serializes this ProblemData instance as JSON to the given file
+        handle. Unlike :meth:`to_json`, the sections are written
+        incrementally, one item per line, without first building the full
+        JSON document in memory. The output can be read by both
+        :meth:`load_json` and :meth:`from_json`.
+
+        Parameters
+        ----------
+        fh
+            Text file handle to write to.
+        """
+        encode = json.JSONEncoder().encode
+
+        def write_list(items: Iterable[dict], indent: str):
+            fh.write("[")
+            items = iter(items)
+            sep = "\n" + indent
+            while chunk := list(islice(items, 1024)):
+                fh.write(sep + f",\n{indent}".join(map(encode, chunk)))
+                sep = ",\n" + indent
+
+            fh.write("]")
+
+        fh.write("{")
+        for idx, (name, section) in enumerate(self._json_sections()):
+            fh.write(f'{"," if idx else ""}\n"{name}": ')
+
+            if name == "objective":
+                fh.write(encode(section))
+            elif name == "constraints":
+                fh.write("{")
+                for pos, (key, items) in enumerate(section.items()):
+                    fh.write(f'{"," if pos else ""}\n  "{key}": ')
+                    write_list(items, "    ")
+
+                fh.write("\n}")
+            else:
+                write_list(section, "  ")
+
+        fh.write("\n}\n")
+
+    @classmethod
+    def load_json(cls, fh: TextIO, validate: bool = True) -> "ProblemData":
+        """
+        Deserializes a ProblemData instance from a JSON file handle. Unlike
+        :meth:`from_json`, the document is parsed incrementally: each job,
+        resource, task, mode and constraint is created as soon as it has been
+        read, so the full JSON document is never held in memory.
+
+        Parameters
+        ----------
+        fh
+            Text file handle to read from.
+        validate
+            Whether to validate the deserialized instance. Default ``True``.
+
+        Returns
+        -------
+        ProblemData
+            The deserialized ProblemData instance.
+
+        Raises
+        ------
+        ValueError
+            If the file does not contain a valid JSON object.
+        """
+        reader = _JsonReader(fh)
+        sections: dict[str, Any] = {}
+
+        for name in reader.iter_object():
+            if name == "jobs":
+                sections[name] = [Job(**job) for job in reader.iter_array()]
+            elif name == "resources":
+                items = reader.iter_array()
+                sections[name] = [_resource_from_dict(res) for res in items]
+            elif name == "tasks":
+                sections[name] = [Task(**task) for task in reader.iter_array()]
+            elif name == "modes":
+                sections[name] = [Mode(**mode) for mode in reader.iter_array()]
+            elif name == "constraints":
+                constraints: dict[str, Any] = {}
+                for key in reader.iter_object():
+                    if key in Constraints.__dataclass_fields__:
+                        items = reader.iter_array()
+                        constraints[key] = _constraints_from_dicts(key, items)
+                    else:
+                        reader.value()  # ignore unknown constraint types
+
+                sections[name] = Constraints(**constraints)
+            elif name == "objective":
+                sections[name] = Objective(**reader.value())
+            else:
+                reader.value()  # ignore unknown sections
+
+        return cls(
+            jobs=sections.get("jobs", []),
+            resources=sections.get("resources", []),
+            tasks=sections.get("tasks", []),
+            modes=sections.get("modes", []),
+            constraints=sections.get("constraints"),
+            objective=sections.get("objective"),
+            validate=validate,
+        )
+
+    def to_npy(self, loc: str | Path):
+        """
+        Writes this ProblemData instance to a directory in a binary format.
+        The attributes of jobs, tasks, modes and most constraints are stored
+        as NumPy ``.npy`` columns (see :class:`ProblemArrays`), so they can
+        be loaded quickly and memory-mapped by :meth:`from_npy`. Resources,
+        the objective, non-empty names and the remaining constraints are
+        stored in a small ``meta.json`` file.
+
+        Parameters
+        ----------
+        loc
+            Directory to write the instance to. Created if it does not exist.
+        """
+        loc = Path(loc)
+        loc.mkdir(parents=True, exist_ok=True)
+
+        arrays = self.arrays
+        for name in ProblemArrays.COLUMNS:
+            np.save(loc / f"{name}.npy", getattr(arrays, name))
+
+        for name, value in arrays.precedences.items():
+            np.save(loc / f"{name}.npy", value)
+
+        for name in _PAIR_CONSTRAINTS:
+            pairs = [tuple(c) for c in getattr(self.constraints, name)]
+            np.save(loc / f"{name}.npy", _array(pairs).reshape(-1, 2))
+
+        meta: dict[str, Any] = {
+            "version": _NPY_FORMAT_VERSION,
+            "resources": [_resource_to_dict(res) for res in self.resources],
+            "objective": asdict(self.objective),
+            "constraints": {
+                name: [asdict(c) for c in getattr(self.constraints, name)]
+                for name in _LIST_CONSTRAINTS
+            },
+            "names": {},
+        }
+
+        for name, values in self._object_names().items():
+            if any(values):  # only store names if there are any
+                meta["names"][name] = values
+
+        with open(loc / "meta.json", "w") as fh:
+            json.dump(meta, fh)
+
+    @classmethod
+    def from_npy(
+        cls,
+        loc: str | Path,
+        validate: bool = True,
+        mmap_mode: Literal["r", "c"] | None = "r",
+    ) -> "ProblemData":
+        """
+        Reads a ProblemData instance from a directory written by
+        :meth:`to_npy`. The columns are memory-mapped by default, so that
+        processes loading the same instance share the underlying pages. The
+        loaded columns also back the :attr:`arrays` view of the instance.
+
+        Parameters
+        ----------
+        loc
+            Directory to read the instance from.
+        validate
+            Whether to validate the instance. Default ``True``.
+        mmap_mode
+            Memory-map mode passed to :func:`numpy.load`. Default ``"r"``
+            (read-only). ``None`` loads the columns into memory.
+
+        Returns
+        -------
+        ProblemData
+            The loaded ProblemData instance.
+
+        Raises
+        ------
+        ValueError
+            If the directory was written by an unsupported format version.
+        """
+        loc = Path(loc)
+        with open(loc / "meta.json") as fh:
+            meta = json.load(fh)
+
+        if meta.get("version") != _NPY_FORMAT_VERSION:
+            msg = f"Unsupported binary format version: {meta.get('version')}."
+            raise ValueError(msg)
+
+        # Only the known columns are loaded, ignoring any other files.
+        timing = [f.name for f in fields(Constraints) if _is_timing(f.name)]
+        cols = {
+            name: np.load(loc / f"{name}.npy", mmap_mode=mmap_mode)
+            for name in [*ProblemArrays.COLUMNS, *timing, *_PAIR_CONSTRAINTS]
+        }
+
+        kwargs: dict[str, Any] = {}
+        for f in fields(Constraints):
+            constraint_cls, is_timing = _constraint_type(f.name)
+
+            if is_timing:
+                # Adopts the memory-mapped columns without copying them.
+                kwargs[f.name] = TimingConstraints.from_array(
+                    constraint_cls, cols[f.name]
+                )
+            elif f.name in _PAIR_CONSTRAINTS:
+                pairs = cols.pop(f.name).tolist()
+                kwargs[f.name] = [constraint_cls(*pair) for pair in pairs]
+            elif f.name == "setup_times":
+                rows = cols["setup_times"].tolist()
+                kwargs[f.name] = [SetupTime(*row) for row in rows]
+            else:
+                items = meta["constraints"][f.name]
+                kwargs[f.name] = [constraint_cls(**item) for item in items]
+
+        # The jobs, tasks and modes are created from the loaded columns when
+        # they are first accessed, see jobs, tasks and modes. Until then, the
+        # columns are the only copy of their data.
+        resources = [_resource_from_dict(res) for res in meta["resources"]]
+        data: ProblemData = cls(
+            [],
+            resources,
+            [],
+            [],
+            Constraints(**kwargs),
+            Objective(**meta["objective"]),
+            validate=False,
+        )
+        data._jobs = data._tasks = data._modes = None
+        data._names = meta["names"]
+
+        # The loaded columns are the columnar view of the data, so there is
+        # no need to compute them again.
+        state: dict[str, Any] = {
+            name: cols.pop(name) for name in ProblemArrays.COLUMNS
+        }
+        state["precedences"] = cols
+        data._arrays = ProblemArrays.__new__(ProblemArrays)
+        data._arrays.__setstate__(state)
+        data._make_mode_indexes()
+
+        if validate:
+            data.validate()
+
+        return data
+
+
+_NPY_FORMAT_VERSION = 1
+
+# Version of the fingerprint encoding. Bump this when the encoding changes,
+# so that fingerprints of different encodings never collide.
+_FINGERPRINT_VERSION = 1
+
+# Constraints between pairs of tasks, which are stored as (n, 2) arrays in
+# the binary format.
+_PAIR_CONSTRAINTS = (
+    "identical_resources",
+    "different_resources",
+    "consecutive",
+)
+
+# Constraints with list-valued attributes, which are stored in the metadata
+# of the binary format.
+_LIST_CONSTRAINTS = (
+    "same_sequence",
+    "mode_dependencies",
+    "select_all_or_none",
+    "select_at_least_one",
+    "select_exactly_one",
+)
+
+
+def _resource_to_dict(resource: Resource) -> dict:
+    """
+    Returns a dictionary representation of the resource, including its type.
+    """
+    return {**asdict(resource), "type": type(resource).__name__.lower()}
+
+
+def _resource_from_dict(data: dict) -> Resource:
+    """
+    Creates a resource from its dictionary representation.
+    """
+    res_name2cls = {
+        res_cls.__name__.lower(): res_cls for res_cls in get_args(Resource)
+    }
+
+    # The 'type' field determines which Resource class to use, but it should
+    # be removed as it's not a constructor parameter.
+    data = dict(data)
+    res_type = data.pop("type")
+    if res_type not in res_name2cls:
+        raise ValueError(f"Unknown resource type: {res_type}.")
+
+    # Convert breaks to tuple format.
+    data["breaks"] = list(map(tuple, data.get("breaks", [])))
+    return res_name2cls[res_type](**data)
+
+
+def _jobs_from_arrays(
+    arrays: ProblemArrays, names: dict[str, list[str]]
+) -> list[Job]:
+    """
+    Creates the jobs from the given columnar view and names.
+    """
+    due_dates = [
+        due_date if has_due_date else None
+        for due_date, has_due_date in zip(
+            arrays.job_due_date.tolist(), arrays.job_has_due_date.tolist()
+        )
+    ]
+    return [
+        Job(weight, release_date, deadline, due_date, tasks, name=name)
+        for weight, release_date, deadline, due_date, tasks, name in zip(
+            arrays.job_weight.tolist(),
+            arrays.job_release_date.tolist(),
+            arrays.job_deadline.tolist(),
+            due_dates,
+            _split(arrays.job_indptr, arrays.job_tasks),
+            names.get("jobs", repeat("")),
+        )
+    ]
+
+
+def _tasks_from_arrays(
+    arrays: ProblemArrays, names: dict[str, list[str]]
+) -> list[Task]:
+    """
+    Creates the tasks from the given columnar view and names.
+    """
+    task_jobs = [
+        job if has_job else None
+        for job, has_job in zip(
+            arrays.task_job.tolist(), arrays.task_has_job.tolist()
+        )
+    ]
+    return [
+        Task(*values[:-1], name=values[-1])
+        for values in zip(
+            task_jobs,
+            arrays.task_earliest_start.tolist(),
+            arrays.task_latest_start.tolist(),
+            arrays.task_earliest_end.tolist(),
+            arrays.task_latest_end.tolist(),
+            arrays.task_allow_idle.tolist(),
+            arrays.task_allow_breaks.tolist(),
+            arrays.task_optional.tolist(),
+            names.get("tasks", repeat("")),
+        )
+    ]
+
+
+def _modes_from_arrays(
+    arrays: ProblemArrays, names: dict[str, list[str]]
+) -> list[Mode]:
+    """
+    Creates the modes from the given columnar view and names.
+    """
+    return [
+        Mode(task, resources, duration, demands, name=name)
+        for task, resources, duration, demands, name in zip(
+            arrays.mode_task.tolist(),
+            _split(arrays.mode_indptr, arrays.mode_resources),
+            arrays.mode_duration.tolist(),
+            _split(arrays.mode_indptr, arrays.mode_demands),
+            names.get("modes", repeat("")),
+        )
+    ]
+
+
+def _split(indptr: np.ndarray, values: np.ndarray) -> list[list[int]]:
+    """
+    Splits the values of a CSR structure into a list of rows.
+    """
+    values_list = values.tolist()
+    return [values_list[start:end] for start, end in pairwise(indptr.tolist())]
+
+
+def _as_dict(obj) -> dict:
+    """
+    Returns a shallow dictionary of the fields of the given dataclass
+    instance. Unlike :func:`dataclasses.asdict`, this does not copy the
+    field values.
+    """
+    return {name: getattr(obj, name) for name in obj.__dataclass_fields__}
+
+
+def _constraints_from_dicts(name: str, items: Iterable[dict]):
+    """
+    Creates the constraints of the given :class:`Constraints` field from
+    their dictionary representations.
+    """
+    constraint_cls, is_timing = _constraint_type(name)
+
+    if is_timing:
+        # Timing constraints are loaded in bulk, without creating an object
+        # per constraint.
+        rows = [
+            (item["task1"], item["task2"], item.get("delay", 0))
+            for item in items
+        ]
+        arr = np.array(rows, dtype=np.int64).reshape(-1, 3)
+        return TimingConstraints(constraint_cls, arr)
+
+    return [constraint_cls(**item) for item in items]
+
+
+class _JsonReader:
+    """
+    Minimal incremental JSON reader, which reads the file handle in chunks
+    and decodes objects and arrays one member at a time.
+    """
+
+    _WHITESPACE = " \t\n\r"
+
+    def __init__(self, fh: TextIO, chunk_size: int = 1 << 16):
+        self._fh = fh
+        self._chunk_size = chunk_size
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self, size: int | None = None) -> bool:
+        # Reads the next chunk of the given size (default chunk size),
+        # dropping the part of the buffer that has already been consumed.
+        # Returns whether anything was read.
+        if self._eof:
+            return False
+
+        chunk = self._fh.read(size or self._chunk_size)
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        self._eof = not chunk
+        return bool(chunk)
+
+    def _peek(self) -> str:
+        # Returns the next non-whitespace character without consuming it, or
+        # an empty string at the end of the file.
+        while True:
+            while (
+                self._pos < len(self._buf)
+                and self._buf[self._pos] in self._WHITESPACE
+            ):
+                self._pos += 1
+
+            if self._pos < len(self._buf) or not self._fill():
+                return self._buf[self._pos : self._pos + 1]
+
+    def _expect(self, char: str):
+        if (found := self._peek()) != char:
+            raise ValueError(f"Expected '{char}' in JSON, found '{found}'.")
+
+        self._pos += 1
+
+    def value(self) -> Any:
+        """
+        Decodes and returns the next JSON value.
+        """
+        self._peek()
+
+        # Decoding restarts at the start of the value after each read, so the
+        # read size grows geometrically to keep large values linear to load.
+        size = self._chunk_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill(size):
+                    raise
+
+                size *= 2
+                continue
+
+            # A number that ends the buffer might continue in the next chunk.
+            if end == len(self._buf) and self._fill(size):
+                size *= 2
+                continue
+
+            self._pos = end
+            return value
+
+    def iter_object(self) -> Iterator[str]:
+        """
+        Iterates over the keys of the next JSON object. The caller must
+        consume the value of each key before requesting the next key.
+        """
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+
+        while True:
+            key = self.value()
+            self._expect(":")
+            yield key
+
+            if self._peek() == ",":
+                self._pos += 1
+            else:
+                self._expect("}")
+                return
+
+    def iter_array(self) -> Iterator[Any]:
+        """
+        Iterates over the values of the next JSON array.
+        """
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+
+        while True:
+            yield self.value()
+
+            if self._peek() == ",":
+                self._pos += 1
+            else:
+                self._expect("]")
+                return
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 from .Solution import Solution
@@ -16,6 +16,47 @@ class SolveStatus(str, Enum):
     UNKNOWN = "Unknown"
 
 
+@dataclass
+class ModelStats:
+    """
+    Statistics about building and solving the model of a solver run.
+
+    Parameters
+    ----------
+    timings
+        Wall time in seconds of each phase of the run, in order of execution.
+        Phases are, for example, ``'variables'``, one phase for each type of
+        constraint, ``'objective'``, ``'warmstart'``, ``'solve'`` and
+        ``'convert'`` (converting the solver output to a solution).
+    num_variables
+        Number of variables of the model.
+    num_constraints
+        Number of constraints of the model.
+    num_arcs
+        Number of arcs of the circuit constraints of the model.
+    num_break_vars
+        Number of break variables of the model.
+    solver
+        Name of the solver that produced the result, either ``'ortools'`` or
+        ``'cpoptimizer'``. Useful to tell which solver won a portfolio run.
+    """
+
+    timings: dict[str, float] = field(default_factory=dict)
+    num_variables: int = 0
+    num_constraints: int = 0
+    num_arcs: int = 0
+    num_break_vars: int = 0
+    solver: str = ""
+
+    @property
+    def build_time(self) -> float:
+        """
+        Returns the total wall time of all phases other than solving, such as
+        building the model, warmstarting and converting the solution.
+        """
+        return sum(t for name, t in self.timings.items() if name != "solve")
+
+
 @dataclass
 class Result:
     """
@@ -36,6 +77,8 @@ class Result:
     best
         The best found solution. If no feasible solution was found, this is
         an empty solution.
+    stats
+        Statistics about building and solving the model. Default empty.
     """
 
     objective: float
@@ -43,6 +86,7 @@ class Result:
     status: SolveStatus
     runtime: float
     best: Solution
+    stats: ModelStats = field(default_factory=ModelStats)
 
     def __str__(self):
         content = [
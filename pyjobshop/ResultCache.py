@@ -0,0 +1,213 @@
+import contextlib
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from .ProblemData import ProblemData
+from .Result import ModelStats, Result, SolveStatus
+from .show_versions import _version
+from .Solution import Solution
+
+# Version of the cache entries. Bump this when the key or the stored format
+# changes, so that stale entries are no longer found.
+_CACHE_VERSION = 3
+
+# Packages whose versions are part of the key, since upgrading them may
+# change the results.
+_PACKAGES = ("pyjobshop", "ortools", "docplex", "cplex")
+
+
+class ResultCache:
+    """
+    Persistent on-disk cache of solver results. Each result is stored in its
+    own file, keyed by the fingerprint of the instance and the solver
+    parameters (see :meth:`key`). When the total size of the cache exceeds
+    ``max_size``, the least recently used results are evicted.
+
+    Only the scheduled tasks of the best solution are stored, not the
+    instance itself. The cache can be shared by multiple processes: entries
+    are written atomically, and entries that cannot be read are treated as
+    missing.
+
+    Parameters
+    ----------
+    loc
+        Directory to store the cached results in. Created if it does not
+        exist.
+    max_size
+        Maximum total size of the cached results, in bytes. Default 1 GiB.
+    """
+
+    def __init__(self, loc: str | Path, max_size: int = 2**30):
+        if max_size < 0:
+            raise ValueError("Maximum cache size must be non-negative.")
+
+        self._loc = Path(loc)
+        self._loc.mkdir(parents=True, exist_ok=True)
+        self._max_size = max_size
+
+    @property
+    def loc(self) -> Path:
+        """
+        Returns the directory of this cache.
+        """
+        return self._loc
+
+    @property
+    def max_size(self) -> int:
+        """
+        Returns the maximum total size of the cached results, in bytes.
+        """
+        return self._max_size
+
+    @staticmethod
+    def key(
+        data: ProblemData,
+        solver: str,
+        time_limit: float,
+        num_workers: int | None = None,
+        initial_solution: Solution | None = None,
+        **kwargs,
+    ) -> str:
+        """
+        Returns the cache key of solving the given instance with the given
+        solver parameters. The parameters correspond to those of
+        :func:`~pyjobshop.solve.solve`. The key also includes the installed
+        versions of PyJobShop and the solvers, so that results computed by
+        other versions are not returned.
+
+        Returns
+        -------
+        str
+            Hexadecimal key that is stable across processes.
+
+        Raises
+        ------
+        TypeError
+            If the additional solver parameters are not JSON-serializable.
+        """
+        params: dict[str, Any] = {
+            "version": _CACHE_VERSION,
+            "packages": {name: _version(name) for name in _PACKAGES},
+            "data": data.fingerprint(),
+            "solver": solver,
+            "time_limit": time_limit,
+            "num_workers": num_workers,
+            "initial_solution": (
+                None
+                if initial_solution is None
+                else repr(initial_solution.tasks)
+            ),
+            "kwargs": kwargs,
+        }
+        try:
+            encoded = json.dumps(params, sort_keys=True)
+        except (TypeError, ValueError) as error:
+            msg = "Solver parameters must be JSON-serializable to be cached."
+            raise TypeError(msg) from error
+
+        return hashlib.blake2b(encoded.encode(), digest_size=32).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self._loc / f"{key}.pkl"
+
+    def get(self, key: str, data: ProblemData) -> Result | None:
+        """
+        Returns the cached result of the given key, or ``None`` if there is
+        no such result. A found result is marked as most recently used.
+
+        Parameters
+        ----------
+        key
+            The cache key, see :meth:`key`.
+        data
+            The instance that was solved, which the best solution of the
+            returned result refers to.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as fh:
+                entry = pickle.load(fh)
+
+            objective, lower_bound, status, runtime, tasks, stats = entry
+            best = Solution(data, tasks)
+            result = Result(
+                objective,
+                lower_bound,
+                SolveStatus(status),
+                runtime,
+                best,
+                ModelStats(**stats),
+            )
+        except FileNotFoundError:
+            return None
+        except Exception:  # corrupt or stale entry; treat it as missing
+            path.unlink(missing_ok=True)
+            return None
+
+        with contextlib.suppress(FileNotFoundError):  # evicted meanwhile
+            os.utime(path)
+
+        return result
+
+    def put(self, key: str, result: Result):
+        """
+        Stores the given result under the given key, and evicts the least
+        recently used results if the cache exceeds its maximum size.
+        """
+        # Writes to a temporary file first, so that other processes never
+        # read partially written entries.
+        fd, tmp = tempfile.mkstemp(dir=self._loc, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                entry = (
+                    result.objective,
+                    result.lower_bound,
+                    result.status.value,
+                    result.runtime,
+                    result.best.tasks,
+                    asdict(result.stats),
+                )
+                pickle.dump(entry, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        for path in self._loc.glob("*.pkl"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # evicted by another process
+                continue
+
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, path in sorted(entries):
+            if size <= self._max_size:
+                break
+
+            path.unlink(missing_ok=True)
+            size -= entry_size
+
+    def clear(self):
+        """
+        Removes all cached results.
+        """
+        for path in self._loc.glob("*.pkl"):
+            path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._loc.glob("*.pkl"))
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._path(key).exists()
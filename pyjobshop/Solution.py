@@ -3,10 +3,9 @@ from dataclasses import dataclass
 from itertools import pairwise
 
 from pyjobshop.ProblemData import ProblemData
-from pyjobshop.solvers.utils import setup_times_matrix
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduledTask:
     """
     Stores scheduling data related to a task.
@@ -52,7 +51,7 @@ class ScheduledTask:
         return self.duration - self.breaks - self.idle
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduledJob:
     """
     Stores scheduling data related to a job.
@@ -279,8 +278,8 @@ class Solution:
         """
         Returns the total setup time of all machines.
         """
-        matrix = setup_times_matrix(self._data)
-        if matrix is None:
+        setup_times = self._data.setup_times_index
+        if len(setup_times) == 0:
             return 0
 
         resource2tasks = defaultdict(list)
@@ -288,13 +287,13 @@ class Solution:
             for res in sol_task.resources:
                 resource2tasks[res].append((idx, sol_task))
 
-        setup_times = 0
+        total = 0
         for machine_idx in self._data.machine_idcs:
             tasks = resource2tasks[machine_idx]
             tasks = sorted(tasks, key=lambda item: item[1].start)
             sequence = [idx for idx, _ in tasks]
 
             for task_idx1, task_idx2 in pairwise(sequence):
-                setup_times += matrix[machine_idx, task_idx1, task_idx2]
+                total += setup_times.get(machine_idx, task_idx1, task_idx2)
 
-        return setup_times
+        return total
@@ -1,4 +1,6 @@
 from .constants import MAX_VALUE as MAX_VALUE
+from .heuristics import sgs as sgs
+from .lns import solve_lns as solve_lns
 from .Model import Model as Model
 from .ProblemData import Consecutive as Consecutive
 from .ProblemData import Constraints as Constraints
@@ -26,10 +28,16 @@ from .ProblemData import StartAtStart as StartAtStart
 from .ProblemData import StartBeforeEnd as StartBeforeEnd
 from .ProblemData import StartBeforeStart as StartBeforeStart
 from .ProblemData import Task as Task
+from .ProblemData import TimingConstraints as TimingConstraints
 from .read import read as read
+from .Result import ModelStats as ModelStats
 from .Result import Result as Result
 from .Result import SolveStatus as SolveStatus
+from .ResultCache import ResultCache as ResultCache
 from .show_versions import show_versions as show_versions
 from .Solution import ScheduledTask as ScheduledTask
 from .Solution import Solution as Solution
 from .solve import solve as solve
+from .solve import solve_async as solve_async
+from .solve import solve_iter as solve_iter
+from .solve import solve_many as solve_many
@@ -0,0 +1,47 @@
+import multiprocessing
+import os
+from dataclasses import asdict
+
+from pyjobshop.ProblemData import ProblemData
+from pyjobshop.Result import ModelStats, Result, SolveStatus
+from pyjobshop.Solution import Solution
+
+# Start method of the worker processes. Forking a process that runs threads,
+# such as those of the solvers or of stop_when_set(), can deadlock the child.
+MP_CONTEXT = multiprocessing.get_context("spawn")
+
+# Instances are transferred to worker processes through this directory, which
+# is backed by memory rather than disk on Linux.
+SHARED_MEMORY_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+def pack(result: Result) -> tuple:
+    """
+    Returns the fields of the given Result object for sending it to another
+    process, where the best solution is replaced by its scheduled tasks. This
+    avoids sending the problem data along with the solution.
+    """
+    return (
+        result.objective,
+        result.lower_bound,
+        SolveStatus(result.status),
+        result.runtime,
+        result.best.tasks,
+        asdict(result.stats),
+    )
+
+
+def unpack(packed: tuple, data: ProblemData) -> Result:
+    """
+    Returns the Result object of the given packed result (see :func:`pack`),
+    with its best solution referring to the given problem data.
+    """
+    objective, lower_bound, status, runtime, tasks, stats = packed
+    return Result(
+        objective,
+        lower_bound,
+        status,
+        runtime,
+        Solution(data, tasks),
+        ModelStats(**stats),
+    )
@@ -1,15 +1,14 @@
 import argparse
 import warnings
-from functools import partial
 from multiprocessing import cpu_count
 from pathlib import Path
 from typing import Literal
 
 import numpy as np
 import tomli
-from tqdm.contrib.concurrent import process_map
+from tqdm import tqdm
 
-from pyjobshop import Result, read, solve
+from pyjobshop import Result, read, solve_many
 from pyjobshop.read import InstanceFormat
 
 
@@ -31,12 +30,18 @@ def parse_args():
     msg = "Directory to store best-found solutions (one file per instance)."
     parser.add_argument("--sol_dir", type=Path, help=msg)
 
+    msg = """
+    Optional directory to cache solver results in. Instances that were solved
+    before with the same parameters are not solved again.
+    """
+    parser.add_argument("--cache_dir", type=Path, help=msg)
+
     msg = "Solver to use."
     parser.add_argument(
         "--solver",
         type=str,
         default="ortools",
-        choices=["ortools", "cpoptimizer"],
+        choices=["ortools", "cpoptimizer", "portfolio"],
         help=msg,
     )
 
@@ -49,8 +54,8 @@ def parse_args():
     parser.add_argument("--display", action="store_true", help=msg)
 
     msg = (
-        "Number of worker threads to use for solving a single instance."
-        "Default is the number of available CPU cores."
+        "Number of worker threads to use for solving a single instance. "
+        "Default divides the available CPU cores over the parallel instances."
     )
     parser.add_argument("--num_workers_per_instance", type=int, help=msg)
 
@@ -61,7 +66,9 @@ def parse_args():
 
     msg = """
     Optional parameter configuration file (in TOML format). These parameters
-    are passed to the solver as additional solver parameters.
+    are passed to the solver as additional solver parameters. For the
+    portfolio solver, the parameters of each solver go in an [ortools] or
+    [cpoptimizer] table.
     """
     parser.add_argument("--config_loc", type=Path, help=msg)
 
@@ -120,61 +127,19 @@ def write_solution(instance_loc: Path, sol_dir: Path, result: Result):
                 fh.write(f"{idx},-1,-1,-1\n")
 
 
-def _solve(
-    instance_loc: Path,
-    instance_format: InstanceFormat,
-    solver: Literal["ortools", "cpoptimizer"],
-    time_limit: float,
-    display: bool,
-    num_workers_per_instance: int,
-    config_loc: Path | None,
-    sol_dir: Path | None,
-) -> tuple[str, str, float, float, float]:
-    """
-    Solves a single instance.
-    """
-    if config_loc is not None:
-        with open(config_loc, "rb") as fh:
-            params = tomli.load(fh)
-    else:
-        params = {}
-
-    data = read(instance_loc, instance_format=instance_format)
-    result = solve(
-        data=data,
-        solver=solver,
-        time_limit=time_limit,
-        display=display,
-        num_workers=num_workers_per_instance,
-        **params,
-    )
-    if sol_dir:
-        sol_dir.mkdir(parents=True, exist_ok=True)  # just in case
-        write_solution(instance_loc, sol_dir, result)
-
-    return (
-        instance_loc.name,
-        result.status.value,
-        result.objective,
-        result.lower_bound,
-        round(result.runtime, 2),
-    )
-
-
 def _check_cpu_usage(
     num_parallel_instances: int, num_workers_per_instance: int | None
 ):
     """
     Warns if the number of workers per instance times the number of parallel
-    instances is greater than the number of available CPU cores
+    instances is greater than the number of available CPU cores. If the
+    number of workers per instance is not set, the available CPU cores are
+    divided over the parallel instances, so there is nothing to warn about.
     """
-    num_cpus = cpu_count()
-    num_workers_per_instance = (
-        num_workers_per_instance
-        if num_workers_per_instance is not None
-        else num_cpus  # uses all CPUs if not set
-    )
+    if num_workers_per_instance is None:
+        return
 
+    num_cpus = cpu_count()
     if num_workers_per_instance * num_parallel_instances > num_cpus:
         warnings.warn(
             f"Number of workers per instance ({num_workers_per_instance}) "
@@ -185,22 +150,64 @@ def _check_cpu_usage(
         )
 
 
-def benchmark(instances: list[Path], num_parallel_instances: int, **kwargs):
+def benchmark(
+    instances: list[Path],
+    instance_format: InstanceFormat,
+    solver: Literal["ortools", "cpoptimizer", "portfolio"],
+    time_limit: float,
+    display: bool,
+    num_workers_per_instance: int | None,
+    num_parallel_instances: int,
+    config_loc: Path | None,
+    sol_dir: Path | None,
+    cache_dir: Path | None,
+):
     """
     Solves the list of instances and prints a table of the results.
     """
-    _check_cpu_usage(
-        num_parallel_instances, kwargs.get("num_workers_per_instance")
-    )
-
-    args = sorted(instances)
-    func = partial(_solve, **kwargs)
+    _check_cpu_usage(num_parallel_instances, num_workers_per_instance)
 
-    if len(instances) == 1:
-        results = [func(args[0])]  # type: ignore
+    if config_loc is not None:
+        with open(config_loc, "rb") as fh:
+            params = tomli.load(fh)
     else:
-        results = process_map(
-            func, args, max_workers=num_parallel_instances, unit="instance"
+        params = {}
+
+    if sol_dir:
+        sol_dir.mkdir(parents=True, exist_ok=True)
+
+    locs = sorted(instances)
+    instances_data = (
+        read(loc, instance_format=instance_format) for loc in locs
+    )
+    results = solve_many(
+        instances_data,
+        num_parallel=min(num_parallel_instances, len(locs)),
+        workers_per_instance=num_workers_per_instance,
+        solver=solver,
+        time_limit=time_limit,
+        display=display,
+        cache_dir=cache_dir,
+        **params,
+    )
+
+    rows = [None] * len(locs)
+    progress = tqdm(
+        results, total=len(locs), unit="instance", disable=len(locs) == 1
+    )
+    for idx, result in progress:
+        if sol_dir:
+            write_solution(locs[idx], sol_dir, result)
+
+        rows[idx] = (
+            locs[idx].name,
+            result.status.value,
+            result.objective,
+            result.lower_bound,
+            round(result.runtime, 2),
+            round(result.stats.build_time, 2),
+            result.stats.num_variables,
+            result.stats.num_constraints,
         )
 
     dtypes = [
@@ -209,12 +216,25 @@ def benchmark(instances: list[Path], num_parallel_instances: int, **kwargs):
         ("obj", float),
         ("lb", float),
         ("time", float),
+        ("build", float),
+        ("vars", int),
+        ("cons", int),
+    ]
+    data = np.asarray(rows, dtype=dtypes)
+    headers = [
+        "Instance",
+        "Status",
+        "Obj.",
+        "LB",
+        "Time (s)",
+        "Build (s)",
+        "Vars",
+        "Cons.",
     ]
-    data = np.asarray(results, dtype=dtypes)
-    headers = ["Instance", "Status", "Obj.", "LB", "Time (s)"]
 
     avg_objective = data["obj"].mean()
     avg_runtime = data["time"].mean()
+    avg_build_time = data["build"].mean()
 
     num_instances = data["status"].size
     num_optimal = np.count_nonzero(data["status"] == "Optimal")
@@ -224,6 +244,7 @@ def benchmark(instances: list[Path], num_parallel_instances: int, **kwargs):
     print("\n", tabulate(headers, data), "\n", sep="")
     print(f"     Avg. objective: {avg_objective:.2f}")
     print(f"      Avg. run-time: {avg_runtime:.2f}s")
+    print(f"    Avg. build-time: {avg_build_time:.2f}s")
     print(f"      Total optimal: {num_optimal}")
     print(f"       Total infeas: {num_infeas}")
 
@@ -0,0 +1,903 @@
+import heapq
+from bisect import bisect_right
+from typing import Literal
+
+import numpy as np
+
+from pyjobshop.constants import MAX_VALUE
+from pyjobshop.ProblemData import (
+    Machine,
+    ProblemData,
+    SelectAtLeastOne,
+    SelectExactlyOne,
+)
+from pyjobshop.Solution import ScheduledTask, Solution
+from pyjobshop.solvers.utils import merge
+
+PriorityRule = Literal["spt", "lpt", "edd", "mwkr", "slack"]
+
+PRIORITY_RULES: tuple[PriorityRule, ...] = (
+    "spt",
+    "lpt",
+    "edd",
+    "mwkr",
+    "slack",
+)
+
+# Timing constraints as (constraint field, whether the constraint relates the
+# end of task 1, whether it relates the end of task 2, whether the constraint
+# is an equality).
+_TIMING_CONSTRAINTS = [
+    ("start_before_start", False, False, False),
+    ("start_before_end", False, True, False),
+    ("end_before_start", True, False, False),
+    ("end_before_end", True, True, False),
+    ("start_at_start", False, False, True),
+    ("start_at_end", False, True, True),
+    ("end_at_start", True, False, True),
+    ("end_at_end", True, True, True),
+]
+
+
+def sgs(
+    data: ProblemData,
+    rule: PriorityRule = "mwkr",
+    scheme: Literal["serial", "parallel"] = "serial",
+) -> Solution:
+    """
+    Constructs a solution with a schedule generation scheme (SGS), which is a
+    fast greedy heuristic that schedules the tasks one at a time. The
+    solution can be used as initial solution of the solvers, or as fallback
+    when the solvers find no solution within the time limit.
+
+    A task is eligible once all tasks that precede it in the timing
+    constraints are scheduled. The serial scheme repeatedly schedules the
+    eligible task with the highest priority at its earliest feasible start
+    time. The parallel scheme instead schedules the eligible task that can
+    start first, and uses the priorities to break ties. Each task is
+    scheduled in the mode that lets it finish first. Optional tasks are only
+    scheduled if the selection or identical resources constraints require
+    so.
+
+    Parameters
+    ----------
+    data
+        The problem data instance.
+    rule
+        The priority rule that orders the eligible tasks. One of:
+
+        * ``'spt'``: shortest processing time first.
+        * ``'lpt'``: longest processing time first.
+        * ``'edd'``: earliest due date first. The due date of a task is the
+          due date of its job, or the job's deadline if it has no due date,
+          and at most the task's latest end time.
+        * ``'mwkr'``: most work remaining first (default). The remaining
+          work of a task is the length of the longest chain of processing
+          times of the task and its successors in the timing constraints.
+        * ``'slack'``: least slack first. The slack of a task is the
+          difference between its latest and earliest start time, following
+          from the timing constraints and deadlines.
+    scheme
+        Either ``'serial'`` (default) or ``'parallel'``.
+
+    Returns
+    -------
+    Solution
+        The constructed solution.
+
+    Raises
+    ------
+    ValueError
+        If the priority rule or scheme is unknown, or the instance has
+        consecutive, same sequence or mode dependency constraints, or
+        machines without idle time, which are not supported. Also raised
+        when no feasible solution could be constructed, for example because
+        the timing constraints are cyclic or deadlines are missed.
+    """
+    if rule not in PRIORITY_RULES:
+        raise ValueError(f"Unknown priority rule: {rule}.")
+
+    if scheme not in ["serial", "parallel"]:
+        raise ValueError(f"Unknown schedule generation scheme: {scheme}.")
+
+    _check_supported(data)
+    scheduler = _Scheduler(data, _presence(data))
+    return scheduler.run(rule, scheme)
+
+
+def _check_supported(data: ProblemData):
+    """
+    Raises if the instance has constraints that the heuristic cannot handle.
+    """
+    constraints = data.constraints
+    unsupported = [
+        name.replace("_", " ")
+        for name in ["consecutive", "same_sequence", "mode_dependencies"]
+        if len(getattr(constraints, name)) > 0
+    ]
+
+    if any(isinstance(res, Machine) and res.no_idle for res in data.resources):
+        unsupported.append("machines without idle time")
+
+    if unsupported:
+        msg = f"Not supported by the heuristic: {', '.join(unsupported)}."
+        raise ValueError(msg)
+
+
+def _presence(data: ProblemData) -> list[bool]:
+    """
+    Returns which tasks are present. Optional tasks are absent unless the
+    selection or identical resources constraints require them. The selection
+    constraints then select their first tasks.
+    """
+    present = [not task.optional for task in data.tasks]
+    constraints = data.constraints
+
+    def applies(condition_task: int | None) -> bool:
+        return condition_task is None or present[condition_task]
+
+    changed = True
+    while changed:  # selecting tasks may activate other constraints
+        changed = False
+
+        for cons in constraints.select_all_or_none:
+            selected = [present[task] for task in cons.tasks]
+            if applies(cons.condition_task) and 0 < sum(selected) < len(
+                selected
+            ):
+                for task in cons.tasks:
+                    present[task] = True
+                changed = True
+
+        # Absent tasks use no resources, so optional tasks must be present
+        # if their identical resources counterparts are.
+        for task1, task2 in constraints.identical_resources:
+            if present[task1] != present[task2]:
+                present[task1] = present[task2] = True
+                changed = True
+
+        selection: list[SelectAtLeastOne | SelectExactlyOne] = [
+            *constraints.select_at_least_one,
+            *constraints.select_exactly_one,
+        ]
+        for select in selection:
+            selected = [present[task] for task in select.tasks]
+            if applies(select.condition_task) and not any(selected):
+                present[select.tasks[0]] = True
+                changed = True
+
+    for exactly_one in constraints.select_exactly_one:
+        num_selected = sum(present[task] for task in exactly_one.tasks)
+        if applies(exactly_one.condition_task) and num_selected > 1:
+            msg = "Cannot select exactly one of multiple required tasks."
+            raise ValueError(msg)
+
+    return present
+
+
+class _Breaks:
+    """
+    Merged breaks of a set of resources.
+    """
+
+    def __init__(self, breaks: list[tuple[int, int]]):
+        merged = merge(breaks)
+        self._starts = [start for start, _ in merged]
+        self._ends = [end for _, end in merged]
+
+    def earliest(
+        self, start: int, duration: int, allow_breaks: bool
+    ) -> tuple[int, int, int]:
+        """
+        Returns the earliest start time from the given start time that does
+        not fall inside a break, together with the resulting end time and
+        break time. If breaks are not allowed, the task is also not allowed
+        to overlap with any break.
+        """
+        starts, ends = self._starts, self._ends
+        idx = bisect_right(ends, start)  # first break that ends after start
+
+        while idx < len(starts):
+            if starts[idx] <= start or (
+                not allow_breaks and start + duration > starts[idx]
+            ):
+                start = ends[idx]
+                idx += 1
+            else:
+                break
+
+        # The task is interrupted by all breaks that start before the
+        # remaining processing is done.
+        end, remaining, breaks = start, duration, 0
+        while (
+            allow_breaks
+            and idx < len(starts)
+            and end + remaining > starts[idx]
+        ):
+            remaining -= starts[idx] - end
+            breaks += ends[idx] - starts[idx]
+            end = ends[idx]
+            idx += 1
+
+        return start, end + remaining, breaks
+
+
+class _MachineProfile:
+    """
+    Schedule of a machine, stored as sorted arrays of the start times, end
+    times and tasks of the scheduled intervals.
+    """
+
+    def __init__(self, data: ProblemData, idx: int):
+        self._idx = idx
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+        self._tasks: list[int] = []
+
+        setup_times = data.setup_times_index
+        self._setup_times = (
+            setup_times if setup_times.has_setup_times(idx) else None
+        )
+
+    def _setup(self, task1: int, task2: int) -> int:
+        assert self._setup_times is not None
+        return self._setup_times.get(self._idx, task1, task2)
+
+    def earliest(self, task: int, start: int, end: int, demand: int) -> int:
+        """
+        Returns the given start time if the task fits between the intervals
+        on this machine, or a later start time to try otherwise. The demand
+        is not used, since machines process one task at a time.
+        """
+        starts, ends, tasks = self._starts, self._ends, self._tasks
+        duration = end - start
+        idx = bisect_right(starts, start)  # intervals from idx start later
+
+        if self._setup_times is None:
+            if idx > 0:
+                start = max(start, ends[idx - 1])
+
+            # Skips the next intervals until there is a large enough gap.
+            while idx < len(starts) and start + duration > starts[idx]:
+                start = ends[idx]
+                idx += 1
+
+            return start
+
+        setup = self._setup
+        if idx > 0:  # previous interval, including setup time
+            start = max(start, ends[idx - 1] + setup(tasks[idx - 1], task))
+
+        while idx < len(starts) and (
+            start + duration + setup(task, tasks[idx]) > starts[idx]
+        ):
+            start = max(start, ends[idx] + setup(tasks[idx], task))
+            idx += 1
+
+        return start
+
+    def add(self, task: int, start: int, end: int, demand: int):
+        """
+        Adds the interval of the given task to this machine.
+        """
+        idx = bisect_right(self._starts, start)
+        self._starts.insert(idx, start)
+        self._ends.insert(idx, end)
+        self._tasks.insert(idx, task)
+
+
+class _RenewableProfile:
+    """
+    Usage of a renewable resource over time, stored as a step function: the
+    usage is ``usage[idx]`` from ``times[idx]`` until ``times[idx + 1]``.
+    """
+
+    def __init__(self, capacity: int):
+        self._capacity = capacity
+        self._times = [0]
+        self._usage = [0]
+
+    def earliest(self, task: int, start: int, end: int, demand: int) -> int:
+        """
+        Returns the given start time if the demand of the task fits in the
+        remaining capacity between the start and end time, or a later start
+        time to try otherwise.
+        """
+        times, usage = self._times, self._usage
+        available = self._capacity - demand
+        idx = bisect_right(times, start) - 1
+
+        while idx < len(times) and times[idx] < end:
+            if usage[idx] > available:  # the demand fits only from the next
+                return times[idx + 1]  # step, which exists since demand fits
+
+            idx += 1
+
+        return start
+
+    def _split(self, time: int) -> int:
+        """
+        Ensures that a step starts at the given time, and returns its index.
+        """
+        idx = bisect_right(self._times, time) - 1
+        if self._times[idx] == time:
+            return idx
+
+        self._times.insert(idx + 1, time)
+        self._usage.insert(idx + 1, self._usage[idx])
+        return idx + 1
+
+    def add(self, task: int, start: int, end: int, demand: int):
+        """
+        Adds the demand of the task between the start and end time to the
+        usage.
+        """
+        if demand == 0 or start >= end:
+            return
+
+        first, last = self._split(start), self._split(end)
+        for idx in range(first, last):
+            self._usage[idx] += demand
+
+
+class _Scheduler:
+    """
+    Builds a schedule by scheduling the present tasks one at a time.
+    """
+
+    def __init__(self, data: ProblemData, present: list[bool]):
+        self._data = data
+        self._present = present
+        arrays = data.arrays
+
+        # Processing times of the shortest mode of each task, used by the
+        # priority rules.
+        durations = np.full(data.num_tasks, MAX_VALUE, dtype=np.int64)
+        np.minimum.at(durations, arrays.mode_task, arrays.mode_duration)
+        self._durations = np.where(durations == MAX_VALUE, 0, durations)
+
+        # Tasks may not start before the release dates of their jobs, nor end
+        # after their deadlines.
+        release = np.zeros(data.num_tasks, dtype=np.int64)
+        deadline = np.full(data.num_tasks, MAX_VALUE, dtype=np.int64)
+        has_job = arrays.task_has_job
+        release[has_job] = arrays.job_release_date[arrays.task_job[has_job]]
+        deadline[has_job] = arrays.job_deadline[arrays.task_job[has_job]]
+        self._latest_end = np.minimum(arrays.task_latest_end, deadline)
+
+        start_lb = np.maximum(arrays.task_earliest_start, release)
+        self._start_lb: list[int] = start_lb.tolist()
+        self._end_lb: list[int] = arrays.task_earliest_end.tolist()
+
+        self._make_edges()
+        self._make_resources()
+        self._make_reservations()
+
+        self._identical: list[list[int]] = [[] for _ in range(data.num_tasks)]
+        for task1, task2 in data.constraints.identical_resources:
+            self._identical[task1].append(task2)
+            self._identical[task2].append(task1)
+
+        self._different: list[list[int]] = [[] for _ in range(data.num_tasks)]
+        for task1, task2 in data.constraints.different_resources:
+            self._different[task1].append(task2)
+            self._different[task2].append(task1)
+
+        # Absent tasks do not use any resources, which matters for the
+        # identical and different resources constraints.
+        self._tasks: list[ScheduledTask | None] = [None] * data.num_tasks
+        self._assigned: list[frozenset[int] | None] = [None] * data.num_tasks
+        for idx, is_present in enumerate(present):
+            if not is_present:
+                self._tasks[idx] = ScheduledTask(0, [], 0, 0, 0, 0, False)
+                self._assigned[idx] = frozenset()
+
+    def _make_edges(self):
+        """
+        Stores the timing constraints between present tasks as adjacency
+        lists, sorted by the first task.
+        """
+        data = self._data
+        columns = []
+
+        for name, from_end, to_end, _ in _TIMING_CONSTRAINTS:
+            timing = getattr(data.constraints, name)
+            size = len(timing.task1)
+            columns.append(
+                (
+                    timing.task1,
+                    timing.task2,
+                    timing.delay,
+                    np.full(size, from_end),
+                    np.full(size, to_end),
+                )
+            )
+
+        task1, task2, delay, from_end, to_end = (
+            np.concatenate(column) for column in zip(*columns)
+        )
+
+        # Constraints only apply when both tasks are present. Constraints of
+        # a task with itself are not edges, but are checked afterwards.
+        present = np.array(self._present, dtype=bool)
+        mask = present[task1] & present[task2] & (task1 != task2)
+        order = np.argsort(task1[mask], kind="stable")
+        task1, task2 = task1[mask][order], task2[mask][order]
+
+        counts = np.bincount(task1, minlength=data.num_tasks)
+        indptr = np.zeros(data.num_tasks + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+
+        self._indptr: list[int] = indptr.tolist()
+        self._succ: list[int] = task2.tolist()
+        self._delay: list[int] = delay[mask][order].tolist()
+        self._from_end: list[bool] = from_end[mask][order].tolist()
+        self._to_end: list[bool] = to_end[mask][order].tolist()
+
+        # Tasks are scheduled in a topological order of the constraints.
+        num_present = sum(self._present)
+        self._precedes = [True] * len(self._succ)
+        self._order = self._topological_order()
+
+        if len(self._order) < num_present:
+            # The constraints are cyclic, for example because of maximum time
+            # lags, which are modelled with negative delays. Constraints with
+            # negative delays then do not determine the order of the tasks.
+            # They still delay their second task if the first task is
+            # scheduled first, and are checked afterwards.
+            self._precedes = [delay >= 0 for delay in self._delay]
+            self._order = self._topological_order()
+
+        if len(self._order) < num_present:
+            raise ValueError("Timing constraints between tasks are cyclic.")
+
+    def _make_resources(self):
+        data = self._data
+        machines = {
+            idx: _MachineProfile(data, idx) for idx in data.machine_idcs
+        }
+        self._renewables = {
+            idx: _RenewableProfile(data.resources[idx].capacity)
+            for idx in data.renewable_idcs
+        }
+        self._consumables = {
+            idx: data.resources[idx].capacity for idx in data.consumable_idcs
+        }
+
+        # The modes that demand more than the capacity of a renewable
+        # resource, and the consumption of consumable resources by each mode.
+        arrays = data.arrays
+        num_resources = np.diff(arrays.mode_indptr)
+        mode_idcs = np.repeat(np.arange(data.num_modes), num_resources)
+        res_idcs, demands = arrays.mode_resources, arrays.mode_demands
+
+        capacity = arrays.resource_capacity[res_idcs]
+        exceeds = np.isin(res_idcs, data.renewable_idcs) & (demands > capacity)
+        infeasible = np.zeros(data.num_modes, dtype=bool)
+        infeasible[mode_idcs[exceeds]] = True
+
+        consumes = np.isin(res_idcs, data.consumable_idcs) & (demands > 0)
+        self._consumptions: list[list[tuple[int, int]]] = [
+            [] for _ in range(data.num_modes)
+        ]
+        for mode_idx, res_idx, demand in zip(
+            mode_idcs[consumes].tolist(),
+            res_idcs[consumes].tolist(),
+            demands[consumes].tolist(),
+        ):
+            self._consumptions[mode_idx].append((res_idx, demand))
+
+        # Each mode is stored as its duration, the profiles and demands of its
+        # machines and renewable resources, and its breaks, or as None if it
+        # is infeasible. Tasks are interrupted by the breaks of all resources
+        # of their mode.
+        profiles = {**machines, **self._renewables}
+        res2breaks: dict[tuple[int, ...], _Breaks | None] = {}
+        self._modes: list[tuple[int, list, _Breaks | None] | None] = []
+
+        for mode, is_infeasible in zip(data.modes, infeasible.tolist()):
+            if is_infeasible:
+                self._modes.append(None)
+                continue
+
+            resources = tuple(mode.resources)
+            if resources not in res2breaks:
+                breaks = [
+                    brk
+                    for res_idx in resources
+                    for brk in data.resources[res_idx].breaks
+                ]
+                res2breaks[resources] = _Breaks(breaks) if breaks else None
+
+            mode_profiles = [
+                (profiles[res_idx], demand)
+                for res_idx, demand in zip(mode.resources, mode.demands)
+                if res_idx in profiles
+            ]
+            self._modes.append(
+                (mode.duration, mode_profiles, res2breaks[resources])
+            )
+
+    def _make_reservations(self):
+        """
+        Reserves for each task the consumable resources that it needs in one
+        of its modes. Another mode can only be selected if that leaves enough
+        for the other reservations, so that the reserved modes always remain
+        feasible. The reserved modes initially consume the least relative to
+        the capacities, and are then changed one at a time while that reduces
+        the total demand in excess of the capacities.
+        """
+        data, capacities = self._data, self._consumables
+        self._reservations: list[dict[int, int]] = [
+            {} for _ in range(data.num_tasks)
+        ]
+        self._reserved = dict.fromkeys(capacities, 0)
+
+        if not capacities:
+            return
+
+        def usage(demands: dict[int, int]) -> float:
+            return sum(
+                dem / max(capacities[res], 1) for res, dem in demands.items()
+            )
+
+        options: dict[int, list[dict[int, int]]] = {}
+        for task_idx, is_present in enumerate(self._present):
+            modes = [data.modes[idx] for idx in data.task2modes(task_idx)]
+            demands = [
+                {
+                    res: dem
+                    for res, dem in zip(mode.resources, mode.demands)
+                    if res in capacities and dem > 0
+                }
+                for mode in modes
+            ]
+
+            if is_present and any(demands):
+                options[task_idx] = sorted(demands, key=usage)
+                self._reservations[task_idx] = options[task_idx][0]
+
+                for res, dem in options[task_idx][0].items():
+                    self._reserved[res] += dem
+
+        def excess(res: int, reserved: int) -> int:
+            return max(reserved - capacities[res], 0)
+
+        while any(excess(res, dem) for res, dem in self._reserved.items()):
+            best, best_change = None, 0
+            for task_idx, task_options in options.items():
+                current = self._reservations[task_idx]
+                for option in task_options:
+                    change = 0
+                    for res in current.keys() | option.keys():
+                        reserved = self._reserved[res]
+                        new = (
+                            reserved - current.get(res, 0) + option.get(res, 0)
+                        )
+                        change += excess(res, new) - excess(res, reserved)
+
+                    if change < best_change:
+                        best, best_change = (task_idx, option), change
+
+            if best is None:  # no change reduces the excess demand
+                break
+
+            task_idx, option = best
+            for res, dem in self._reservations[task_idx].items():
+                self._reserved[res] -= dem
+            for res, dem in option.items():
+                self._reserved[res] += dem
+            self._reservations[task_idx] = option
+
+    def _in_degrees(self) -> list[int]:
+        """
+        Returns the number of constraints that precede each task.
+        """
+        in_degrees = [0] * self._data.num_tasks
+        for succ, precedes in zip(self._succ, self._precedes):
+            in_degrees[succ] += precedes
+
+        return in_degrees
+
+    def _successors(self, task: int) -> list[int]:
+        """
+        Returns the tasks that the given task precedes.
+        """
+        edges = range(self._indptr[task], self._indptr[task + 1])
+        return [self._succ[edge] for edge in edges if self._precedes[edge]]
+
+    def _topological_order(self) -> list[int]:
+        """
+        Returns the present tasks in a topological order of the constraints
+        that determine the order of the tasks. Tasks on a cycle are left out.
+        """
+        in_degrees = self._in_degrees()
+        order = [
+            idx
+            for idx, is_present in enumerate(self._present)
+            if is_present and in_degrees[idx] == 0
+        ]
+
+        for task in order:  # order grows while iterating
+            for succ in self._successors(task):
+                in_degrees[succ] -= 1
+                if in_degrees[succ] == 0:
+                    order.append(succ)
+
+        return order
+
+    def _priorities(self, rule: PriorityRule) -> list[float]:
+        """
+        Returns the priority of each task; lower values go first.
+        """
+        arrays = self._data.arrays
+        durations = self._durations
+
+        if rule == "spt":
+            return durations.tolist()
+
+        if rule == "lpt":
+            return (-durations).tolist()
+
+        if rule == "edd":
+            due_dates = np.where(
+                arrays.job_has_due_date,
+                arrays.job_due_date,
+                arrays.job_deadline,
+            )
+            has_job = arrays.task_has_job
+            task_due_dates = self._latest_end.copy()
+            task_due_dates[has_job] = np.minimum(
+                task_due_dates[has_job], due_dates[arrays.task_job[has_job]]
+            )
+            return task_due_dates.tolist()
+
+        # The remaining rules follow from the longest paths through the
+        # timing constraints, using the shortest processing times. Each
+        # constraint is converted to a minimum time lag between the start
+        # times of both tasks.
+        order, precedes = self._order, self._precedes
+        indptr, succ, delay = self._indptr, self._succ, self._delay
+        processing = durations.tolist()
+
+        def lag(idx: int, edge: int) -> int:
+            lag = delay[edge]
+            if self._from_end[edge]:
+                lag += processing[idx]
+            if self._to_end[edge]:
+                lag -= processing[succ[edge]]
+            return lag
+
+        # Longest path from the start of each task to the end of the
+        # schedule, which is the remaining work.
+        tails = list(processing)
+        for idx in reversed(order):
+            for edge in range(indptr[idx], indptr[idx + 1]):
+                if not precedes[edge]:
+                    continue
+
+                tail = lag(idx, edge) + tails[succ[edge]]
+                tails[idx] = max(tails[idx], tail)
+
+        if rule == "mwkr":
+            return [-tail for tail in tails]
+
+        earliest = list(self._start_lb)
+        for idx in order:
+            for edge in range(indptr[idx], indptr[idx + 1]):
+                if not precedes[edge]:
+                    continue
+
+                start = earliest[idx] + lag(idx, edge)
+                earliest[succ[edge]] = max(earliest[succ[edge]], start)
+
+        latest = self._latest_end - np.array(tails)
+        return (latest - np.array(earliest)).tolist()
+
+    def _allowed(self, task: int, mode: int) -> bool:
+        """
+        Returns whether the given mode can be selected for the task, given
+        the modes selected for the other tasks so far.
+        """
+        if self._modes[mode] is None:  # exceeds renewable capacity
+            return False
+
+        for res_idx, demand in self._consumptions[mode]:
+            reserved = self._reserved[res_idx]  # except by this task
+            reserved -= self._reservations[task].get(res_idx, 0)
+            if demand > self._consumables[res_idx] - reserved:
+                return False
+
+        if not (self._identical[task] or self._different[task]):
+            return True
+
+        # The resources must match those of the other tasks of the identical
+        # and different resources constraints, or those of one of their modes
+        # if they are not yet scheduled.
+        selected = frozenset(self._data.modes[mode].resources)
+        for other in self._identical[task]:
+            assigned = self._assigned[other]
+            if assigned is not None:
+                if assigned != selected:
+                    return False
+            elif selected not in self._options(other):
+                return False
+
+        for other in self._different[task]:
+            assigned = self._assigned[other]
+            if assigned is not None:
+                if not assigned.isdisjoint(selected):
+                    return False
+            elif all(
+                not opt.isdisjoint(selected) for opt in self._options(other)
+            ):
+                return False
+
+        return True
+
+    def _options(self, task: int) -> set[frozenset[int]]:
+        """
+        Returns the resources that the task can be assigned to.
+        """
+        modes = self._data.task2modes(task)
+        return {frozenset(self._data.modes[mode].resources) for mode in modes}
+
+    def _earliest(
+        self, task: int, mode: int
+    ) -> tuple[int, int, int, int, int] | None:
+        """
+        Returns the earliest feasible schedule of the task in the given mode,
+        as a tuple of end time, start time, mode, idle time and break time,
+        or ``None`` if there is no such schedule.
+        """
+        task_data = self._data.tasks[task]
+        duration, profiles, breaks = self._modes[mode]  # type: ignore
+        start, end_lb = self._start_lb[task], self._end_lb[task]
+
+        while start <= MAX_VALUE:
+            if breaks is not None:
+                start, end, break_time = breaks.earliest(
+                    start, duration, task_data.allow_breaks
+                )
+            else:
+                end, break_time = start + duration, 0
+
+            idle = 0
+            if end < end_lb:
+                if not task_data.allow_idle:
+                    start += end_lb - end
+                    continue
+
+                idle = end_lb - end
+                end = end_lb
+
+            # Moves the start time forward until all resources can process
+            # the task at the same time.
+            earliest = start
+            for profile, demand in profiles:
+                earliest = profile.earliest(task, start, end, demand)
+                if earliest > start:
+                    break
+
+            if earliest == start:
+                return end, start, mode, idle, break_time
+
+            start = earliest
+
+        return None
+
+    def _option(self, task: int) -> tuple[int, int, int, int, int]:
+        """
+        Returns the earliest finishing schedule of the task over all modes.
+        """
+        options = [
+            option
+            for mode in self._data.task2modes(task)
+            if self._allowed(task, mode)
+            and (option := self._earliest(task, mode)) is not None
+        ]
+
+        if not options:
+            raise ValueError(f"Cannot schedule task {task} in any mode.")
+
+        return min(options)
+
+    def _schedule(self, task: int, option: tuple[int, int, int, int, int]):
+        """
+        Schedules the task, and updates the resources and the earliest start
+        and end times of its successors.
+        """
+        end, start, mode, idle, break_time = option
+        resources = self._data.modes[mode].resources
+
+        for profile, demand in self._modes[mode][1]:  # type: ignore
+            profile.add(task, start, end, demand)
+
+        for res_idx, demand in self._consumptions[mode]:
+            self._consumables[res_idx] -= demand
+
+        for res_idx, demand in self._reservations[task].items():
+            self._reserved[res_idx] -= demand
+
+        self._tasks[task] = ScheduledTask(
+            mode, resources, start, end, idle, break_time
+        )
+
+        if self._identical[task] or self._different[task]:
+            self._assigned[task] = frozenset(resources)
+
+        for edge in range(self._indptr[task], self._indptr[task + 1]):
+            succ = self._succ[edge]
+            time = (end if self._from_end[edge] else start) + self._delay[edge]
+
+            if self._to_end[edge]:
+                self._end_lb[succ] = max(self._end_lb[succ], time)
+            else:
+                self._start_lb[succ] = max(self._start_lb[succ], time)
+
+    def run(
+        self, rule: PriorityRule, scheme: Literal["serial", "parallel"]
+    ) -> Solution:
+        priorities = self._priorities(rule)
+        in_degrees = self._in_degrees()
+
+        # Serial heap entries are (priority, task), and parallel heap entries
+        # are (start time, priority, task). The start times in the parallel
+        # heap are lower bounds, which are updated when the task is popped.
+        heap: list[tuple] = []
+
+        def push(task: int):
+            if scheme == "serial":
+                heapq.heappush(heap, (priorities[task], task))
+            else:
+                start = self._start_lb[task]
+                heapq.heappush(heap, (start, priorities[task], task))
+
+        for idx, is_present in enumerate(self._present):
+            if is_present and in_degrees[idx] == 0:
+                push(idx)
+
+        while heap:
+            *key, task = heapq.heappop(heap)
+            option = self._option(task)
+
+            if scheme == "parallel" and option[1] > key[0]:
+                heapq.heappush(heap, (option[1], priorities[task], task))
+                continue
+
+            self._schedule(task, option)
+
+            for succ in self._successors(task):
+                in_degrees[succ] -= 1
+                if in_degrees[succ] == 0:
+                    push(succ)
+
+        solution = Solution(self._data, self._tasks)  # type: ignore
+        self._check(solution)
+        return solution
+
+    def _check(self, solution: Solution):
+        """
+        Raises if the solution violates the latest start and end times, the
+        deadlines, or the timing constraints.
+        """
+        data, arrays = self._data, self._data.arrays
+        present = np.array(self._present, dtype=bool)
+        starts = np.array([task.start for task in solution.tasks])
+        ends = np.array([task.end for task in solution.tasks])
+
+        late = (starts > arrays.task_latest_start) | (ends > self._latest_end)
+        if np.any(late & present):
+            raise ValueError("Cannot meet the latest start or end times.")
+
+        for name, from_end, to_end, equality in _TIMING_CONSTRAINTS:
+            timing = getattr(data.constraints, name)
+            task1, task2 = timing.task1, timing.task2
+            mask = present[task1] & present[task2]
+
+            time1 = (ends if from_end else starts)[task1] + timing.delay
+            time2 = (ends if to_end else starts)[task2]
+            violated = time1 != time2 if equality else time1 > time2
+
+            if np.any(violated & mask):
+                raise ValueError(f"Cannot satisfy {name} constraints.")
@@ -0,0 +1,539 @@
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from pyjobshop._transfer import MP_CONTEXT, SHARED_MEMORY_DIR, pack, unpack
+from pyjobshop.heuristics import sgs
+from pyjobshop.ProblemData import ProblemData
+from pyjobshop.Result import ModelStats, Result, SolveStatus
+from pyjobshop.Solution import ScheduledTask, Solution
+from pyjobshop.solve import solve
+from pyjobshop.solvers.ortools import CPModel
+from pyjobshop.solvers.utils import timed
+
+Neighborhood = Callable[
+    [ProblemData, Solution, int, np.random.Generator], list[int]
+]
+
+
+def random_jobs(
+    data: ProblemData,
+    solution: Solution,
+    size: int,
+    rng: np.random.Generator,
+) -> list[int]:
+    """
+    Returns the tasks of randomly selected jobs, until at least ``size``
+    tasks are selected. Selects random tasks if the instance has no jobs.
+
+    Parameters
+    ----------
+    data
+        The problem data instance.
+    solution
+        The current solution.
+    size
+        The number of tasks to select.
+    rng
+        Random number generator.
+
+    Returns
+    -------
+    list[int]
+        The selected task indices.
+    """
+    if data.num_jobs == 0:
+        return rng.permutation(data.num_tasks)[:size].tolist()
+
+    tasks: list[int] = []
+    for job_idx in rng.permutation(data.num_jobs):
+        if len(tasks) >= size:
+            break
+
+        tasks.extend(data.jobs[job_idx].tasks)
+
+    return tasks
+
+
+def random_resources(
+    data: ProblemData,
+    solution: Solution,
+    size: int,
+    rng: np.random.Generator,
+) -> list[int]:
+    """
+    Returns the tasks that are scheduled on randomly selected resources,
+    until ``size`` tasks are selected. Of the last selected resource, only
+    the tasks that start first are selected.
+
+    Parameters
+    ----------
+    data
+        The problem data instance.
+    solution
+        The current solution.
+    size
+        The number of tasks to select.
+    rng
+        Random number generator.
+
+    Returns
+    -------
+    list[int]
+        The selected task indices.
+    """
+    res2tasks: dict[int, list[int]] = defaultdict(list)
+    for task_idx, task in enumerate(solution.tasks):
+        for res_idx in task.resources:
+            res2tasks[res_idx].append(task_idx)
+
+    def task_start(idx: int) -> int:
+        return solution.tasks[idx].start
+
+    tasks: dict[int, None] = {}  # ordered set
+    for res_idx in rng.permutation(data.num_resources):
+        if len(tasks) >= size:
+            break
+
+        res_tasks = sorted(res2tasks[res_idx], key=task_start)
+        tasks.update(dict.fromkeys(res_tasks))
+
+    return list(tasks)[:size]
+
+
+def time_window(
+    data: ProblemData,
+    solution: Solution,
+    size: int,
+    rng: np.random.Generator,
+) -> list[int]:
+    """
+    Returns ``size`` tasks that start consecutively in the schedule, from a
+    random point in time.
+
+    Parameters
+    ----------
+    data
+        The problem data instance.
+    solution
+        The current solution.
+    size
+        The number of tasks to select.
+    rng
+        Random number generator.
+
+    Returns
+    -------
+    list[int]
+        The selected task indices.
+    """
+    starts = np.array([task.start for task in solution.tasks], dtype=int)
+    order = np.argsort(starts, kind="stable")
+    first = rng.integers(max(data.num_tasks - size, 0) + 1)
+    return order[first : first + size].tolist()
+
+
+def critical_path(
+    data: ProblemData,
+    solution: Solution,
+    size: int,
+    rng: np.random.Generator,
+) -> list[int]:
+    """
+    Returns the tasks of a critical path, completed up to ``size`` tasks by
+    the tasks that start closest in time to the path. A critical path is a
+    chain of tasks that ends with a task that ends last, where each task ends
+    exactly when the next task starts, and both tasks share a resource or are
+    ordered by an end-before-start constraint. Ties are broken randomly.
+
+    Parameters
+    ----------
+    data
+        The problem data instance.
+    solution
+        The current solution.
+    size
+        The number of tasks to select.
+    rng
+        Random number generator.
+
+    Returns
+    -------
+    list[int]
+        The selected task indices.
+    """
+    tasks = solution.tasks
+    present = [idx for idx, task in enumerate(tasks) if task.present]
+    if not present:
+        return time_window(data, solution, size, rng)
+
+    end2tasks: dict[int, list[int]] = defaultdict(list)
+    for idx in present:
+        end2tasks[tasks[idx].end].append(idx)
+
+    preds: dict[int, set[int]] = defaultdict(set)
+    for pred, succ, _ in data.constraints.end_before_start:
+        preds[succ].add(pred)
+
+    last = end2tasks[max(end2tasks)]
+    path = [last[rng.integers(len(last))]]
+    on_path = set(path)
+
+    while True:
+        current = tasks[path[-1]]
+        resources = set(current.resources)
+        candidates = [
+            idx
+            for idx in end2tasks[current.start]
+            if idx not in on_path
+            and (
+                idx in preds[path[-1]]
+                or not resources.isdisjoint(tasks[idx].resources)
+            )
+        ]
+
+        if not candidates:
+            break
+
+        path.append(candidates[rng.integers(len(candidates))])
+        on_path.add(path[-1])
+
+    path = path[:size]
+
+    # Completes the path with the tasks that start closest in time to any
+    # task on the path.
+    starts = np.array([task.start for task in tasks], dtype=int)
+    path_starts = np.sort(starts[path])
+    pos = np.searchsorted(path_starts, starts).clip(1, len(path_starts) - 1)
+    dist = np.minimum(
+        np.abs(starts - path_starts[pos - 1]),
+        np.abs(starts - path_starts[pos]),
+    )
+
+    closest = (idx for idx in np.argsort(dist, kind="stable").tolist())
+    others = (idx for idx in closest if idx not in on_path)
+    return path + [next(others) for _ in range(size - len(path))]
+
+
+NEIGHBORHOODS: tuple[Neighborhood, ...] = (
+    random_jobs,
+    random_resources,
+    time_window,
+    critical_path,
+)
+
+
+def solve_lns(
+    data: ProblemData,
+    time_limit: float = float("inf"),
+    display: bool = False,
+    initial_solution: Solution | None = None,
+    neighborhoods: Sequence[Neighborhood] = NEIGHBORHOODS,
+    neighborhood_size: int = 100,
+    sub_time_limit: float = 1,
+    max_iterations: int | None = None,
+    num_parallel: int = 1,
+    num_workers: int = 1,
+    seed: int | None = None,
+    on_solution: Callable[[Result], bool | None] | None = None,
+    stop_event: threading.Event | None = None,
+    **kwargs,
+) -> Result:
+    """
+    Solves the given problem data instance with large neighborhood search
+    (LNS), using OR-Tools to solve the sub-problems. This finds good
+    solutions to instances that are too large to solve as a whole.
+
+    Each iteration selects a random neighborhood of the current solution,
+    which is a subset of the tasks. All other tasks are fixed to their
+    current schedule (see :meth:`~pyjobshop.solvers.ortools.CPModel.fix`),
+    and the resulting sub-problem is solved with a short time limit, starting
+    from the current solution. The new solution is accepted if it improves
+    the objective. The model is built only once, and reused for every
+    sub-problem.
+
+    Parameters
+    ----------
+    data
+        The problem data instance.
+    time_limit
+        The time limit in seconds. Default ``float('inf')``.
+    display
+        Whether to print the improving solutions. Default ``False``.
+    initial_solution
+        Solution to start from. If not given, the solution of the
+        :func:`~pyjobshop.heuristics.sgs` heuristic is used, or the first
+        solution found by OR-Tools if the heuristic cannot construct one.
+    neighborhoods
+        Functions that select the tasks of a neighborhood from the instance,
+        the current solution, the neighborhood size, and a random number
+        generator. Default :data:`NEIGHBORHOODS`, which contains
+        :func:`random_jobs`, :func:`random_resources`, :func:`time_window`
+        and :func:`critical_path`.
+    neighborhood_size
+        The number of tasks of each neighborhood. Default 100.
+    sub_time_limit
+        The time limit for solving each sub-problem, in seconds. Default 1.
+    max_iterations
+        The maximum number of sub-problems to solve. Default no maximum.
+    num_parallel
+        The number of sub-problems to solve in parallel processes. Each
+        process builds the model once. Default 1, which solves sub-problems
+        in this process. Processes are started with the ``'spawn'`` start
+        method, see :func:`~pyjobshop.solve.solve_many`.
+    num_workers
+        The number of workers to use for solving each sub-problem. Default 1.
+    seed
+        Seed of the random number generator. Default no seed.
+    on_solution
+        Optional function that is called with a Result object for each
+        improving solution. If it returns ``True``, the search is stopped.
+        Default is no callback.
+    stop_event
+        Optional event that stops the search when it is set. Sub-problems
+        that are being solved in parallel processes are finished first.
+        Default is no event.
+    kwargs
+        Additional parameters passed to the OR-Tools solver of the initial
+        solution and each sub-problem.
+
+    Returns
+    -------
+    Result
+        A Result object containing the best found solution. Its lower bound
+        is that of the initial OR-Tools run, if any, and its status is
+        ``OPTIMAL`` only if the solution reaches this bound.
+
+    Raises
+    ------
+    ValueError
+        If no neighborhoods are given, or the number of parallel processes or
+        workers is not positive.
+    """
+    if not neighborhoods:
+        raise ValueError("At least one neighborhood is needed.")
+
+    if num_parallel < 1 or num_workers < 1:
+        raise ValueError(
+            "Number of parallel processes and workers must be positive."
+        )
+
+    start = time.perf_counter()
+    deadline = start + time_limit
+    rng = np.random.default_rng(seed)
+    size = min(neighborhood_size, data.num_tasks)
+    timings: dict[str, float] = {}
+
+    lower_bound: float = 0
+
+    if initial_solution is None:
+        with timed(timings, "initial"):
+            try:
+                # The heuristic quickly constructs a solution, also for large
+                # instances where OR-Tools struggles to find one.
+                initial_solution = sgs(data)
+            except ValueError:  # not supported, or no solution found
+                initial = solve(
+                    data,
+                    "ortools",
+                    time_limit,
+                    num_workers=num_parallel * num_workers,
+                    stop_event=stop_event,
+                    stop_after_first_solution=True,
+                    **kwargs,
+                )
+
+                if initial.status != SolveStatus.FEASIBLE:  # optimal or none
+                    return initial
+
+                initial_solution = initial.best
+                lower_bound = initial.lower_bound
+
+    best = initial_solution
+    objective: float = initial_solution.objective
+
+    if display:
+        print(f"{'Iteration':>9s}  {'Time (s)':>8s}  {'Objective':>9s}")
+
+    num_iterations = 0
+    stopped = False
+
+    def select() -> list[int]:
+        nonlocal num_iterations
+        num_iterations += 1
+
+        neighborhood = neighborhoods[int(rng.integers(len(neighborhoods)))]
+        return neighborhood(data, best, size, rng)
+
+    def is_done() -> bool:
+        return (
+            stopped
+            or objective <= lower_bound
+            or time.perf_counter() >= deadline
+            or (stop_event is not None and stop_event.is_set())
+            or (
+                max_iterations is not None and num_iterations >= max_iterations
+            )
+        )
+
+    def accept(result: Result):
+        nonlocal best, objective, stopped
+        if result.objective >= objective:
+            return
+
+        best, objective = result.best, result.objective
+        runtime = time.perf_counter() - start
+
+        if display:
+            print(f"{num_iterations:>9d}  {runtime:>8.2f}  {objective:>9.0f}")
+
+        if on_solution is not None:
+            stats = ModelStats(solver="ortools")
+            status = SolveStatus.FEASIBLE
+            incumbent = Result(
+                objective, lower_bound, status, runtime, best, stats
+            )
+            stopped = bool(on_solution(incumbent))
+
+    def sub_time() -> float:
+        return max(min(sub_time_limit, deadline - time.perf_counter()), 0)
+
+    if num_parallel == 1:
+        with timed(timings, "build"):
+            cp_model = CPModel(data)
+
+        with timed(timings, "solve"):
+            while not is_done():
+                free = select()
+                result = _solve_neighborhood(
+                    data,
+                    cp_model,
+                    best.tasks,
+                    free,
+                    sub_time(),
+                    num_workers,
+                    stop_event,
+                    kwargs,
+                )
+                accept(result)
+    else:
+        with (
+            timed(timings, "solve"),
+            tempfile.TemporaryDirectory(dir=SHARED_MEMORY_DIR) as tmp_dir,
+        ):
+            # Workers build their own model from the instance, which is
+            # transferred as memory-mapped files rather than pickled.
+            loc = Path(tmp_dir) / "instance"
+            data.to_npy(loc)
+
+            with ProcessPoolExecutor(
+                num_parallel,
+                mp_context=MP_CONTEXT,
+                initializer=_init_worker,
+                initargs=(loc,),
+            ) as pool:
+                running: set[Future] = set()
+
+                while running or not is_done():
+                    while len(running) < num_parallel and not is_done():
+                        future = pool.submit(
+                            _solve_neighborhood_npy,
+                            best.tasks,
+                            select(),
+                            sub_time(),
+                            num_workers,
+                            kwargs,
+                        )
+                        running.add(future)
+
+                    done, running = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        accept(unpack(future.result(), data))
+
+    status = SolveStatus.FEASIBLE
+    if objective <= lower_bound:
+        status = SolveStatus.OPTIMAL
+
+    return Result(
+        objective,
+        lower_bound,
+        status,
+        time.perf_counter() - start,
+        best,
+        ModelStats(timings, solver="ortools"),
+    )
+
+
+def _solve_neighborhood(
+    data: ProblemData,
+    cp_model: CPModel,
+    tasks: list[ScheduledTask],
+    free: list[int],
+    time_limit: float,
+    num_workers: int,
+    stop_event: threading.Event | None,
+    kwargs: dict[str, Any],
+) -> Result:
+    """
+    Solves the sub-problem of the given model where all tasks other than the
+    free tasks are fixed to their schedule in the given solution tasks.
+    """
+    solution = Solution(data, tasks)
+    free_tasks = set(free)
+    fixed = (idx for idx in range(data.num_tasks) if idx not in free_tasks)
+
+    # The model stays fixed after solving, since the next sub-problem fixes
+    # mostly the same variables to the same values.
+    cp_model.fix(solution, fixed)
+    return cp_model.solve(
+        time_limit,
+        display=False,
+        num_workers=num_workers,
+        stop_event=stop_event,
+        **kwargs,
+    )
+
+
+# Instance and model of a worker process, see _init_worker.
+_WORKER_MODEL: tuple[ProblemData, CPModel] | None = None
+
+
+def _init_worker(loc: Path):
+    """
+    Builds the model of the instance in the given binary format directory,
+    once for each worker process of :func:`solve_lns`.
+    """
+    global _WORKER_MODEL
+    data = ProblemData.from_npy(loc, validate=False)
+    _WORKER_MODEL = (data, CPModel(data))
+
+
+def _solve_neighborhood_npy(
+    tasks: list[ScheduledTask],
+    free: list[int],
+    time_limit: float,
+    num_workers: int,
+    kwargs: dict[str, Any],
+) -> tuple:
+    """
+    Solves a sub-problem with the model of this worker process, and returns
+    the packed result.
+    """
+    assert _WORKER_MODEL is not None
+    data, cp_model = _WORKER_MODEL
+    result = _solve_neighborhood(
+        data, cp_model, tasks, free, time_limit, num_workers, None, kwargs
+    )
+    return pack(result)
@@ -19,6 +19,7 @@ class InstanceFormat(str, Enum):
     PATTERSON = "patterson"
     RCPSP_MAX = "rcpsp_max"
     ASLIB = "aslib"
+    NPY = "npy"
 
 
 def read(
@@ -31,6 +32,9 @@ def read(
     if instance_format == InstanceFormat.FJSPLIB:
         return _read_fjslib(loc)
 
+    if instance_format == InstanceFormat.NPY:
+        return ProblemData.from_npy(loc)
+
     if instance_format in [
         InstanceFormat.PSPLIB,
         InstanceFormat.MPLIB,
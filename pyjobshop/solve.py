@@ -1,20 +1,50 @@
+import asyncio
+import contextlib
+import multiprocessing
+import os
+import queue
+import shutil
+import tempfile
 import textwrap
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sized
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from dataclasses import replace
+from functools import partial
 from importlib.metadata import version
-from typing import Literal
+from itertools import islice
+from multiprocessing.synchronize import Event as ProcessEvent
+from pathlib import Path
+from typing import Any, Literal
 
+from pyjobshop._transfer import MP_CONTEXT, SHARED_MEMORY_DIR, pack, unpack
+from pyjobshop.heuristics import sgs
 from pyjobshop.ProblemData import ProblemData
-from pyjobshop.Result import Result
-from pyjobshop.Solution import Solution
+from pyjobshop.Result import Result, SolveStatus
+from pyjobshop.ResultCache import ResultCache
+from pyjobshop.Solution import ScheduledTask, Solution
 from pyjobshop.solvers.ortools import CPModel as ORToolsModel
+from pyjobshop.solvers.utils import stop_when_set, timed
 
 
 def solve(
     data: ProblemData,
-    solver: Literal["ortools", "cpoptimizer"] = "ortools",
+    solver: Literal["ortools", "cpoptimizer", "portfolio"] = "ortools",
     time_limit: float = float("inf"),
     display: bool = False,
     num_workers: int | None = None,
     initial_solution: Solution | None = None,
+    cache_dir: str | Path | ResultCache | None = None,
+    on_solution: Callable[[Result], bool | None] | None = None,
+    stop_event: threading.Event | None = None,
+    fallback: bool = False,
     **kwargs,
 ) -> Result:
     """
@@ -25,7 +55,14 @@ def solve(
     data
         The problem data instance.
     solver
-        The solver to use. Either ``'ortools'`` (default) or ``'cpoptimizer'``.
+        The solver to use. Either ``'ortools'`` (default), ``'cpoptimizer'``,
+        or ``'portfolio'``. The portfolio solves the instance with OR-Tools
+        and CP Optimizer at the same time, each in its own process, and
+        returns the best result of both. The search stops as soon as either
+        solver proves optimality or infeasibility. The solver that produced
+        the result is given by ``Result.stats.solver``. Like
+        :func:`solve_many`, the portfolio starts its processes with the
+        ``'spawn'`` start method.
     time_limit
         The time limit for the solver in seconds. Default ``float('inf')``.
     display
@@ -33,11 +70,38 @@ def solve(
     num_workers
         The number of workers to use for parallel solving. If not specified,
         the default of the selected solver is used, which is typically the
-        number of available CPU cores.
+        number of available CPU cores. The portfolio divides the workers over
+        both solvers, giving each solver at least one worker.
     initial_solution
         An initial solution to start the solver from. Default is no solution.
+        The portfolio starts both solvers from this solution.
+    cache_dir
+        Optional directory of a :class:`~pyjobshop.ResultCache.ResultCache`,
+        or the cache itself, for example to set its maximum size. If given,
+        the result of solving the same instance with the same
+        parameters before is returned from the cache without building or
+        solving the model. Otherwise, the new result is stored in the cache.
+        Default is no caching.
+    on_solution
+        Optional function that is called with a Result object for each
+        improving solution found during the search. If it returns ``True``,
+        the search is stopped and the result is not cached. Default is no
+        callback. See also :func:`solve_iter`.
+    stop_event
+        Optional event that stops the search when it is set, for example from
+        another thread. The result then contains the best solution found so
+        far, and is not cached. Default is no event. See also
+        :func:`solve_async`.
+    fallback
+        Whether to return the solution of the
+        :func:`~pyjobshop.heuristics.sgs` heuristic if the solver finds no
+        solution, for example because it reaches the time limit first. The
+        result then has status ``FEASIBLE``, and keeps the lower bound of the
+        solver. Default ``False``.
     kwargs
-        Additional parameters passed to the solver.
+        Additional parameters passed to the solver. Since the parameters of
+        both solvers differ, the portfolio takes the parameters of each solver
+        as a dictionary under the ``'ortools'`` and ``'cpoptimizer'`` keys.
 
     Returns
     -------
@@ -50,33 +114,626 @@ def solve(
     ModuleNotFoundError
         If CP Optimizer is chosen but its dependencies are not installed.
     """
-    if solver not in ["ortools", "cpoptimizer"]:
+    if solver not in ["ortools", "cpoptimizer", "portfolio"]:
         raise ValueError(f"Unknown solver choice: {solver}.")
 
+    if solver == "portfolio" and (unknown := set(kwargs) - set(_PORTFOLIO)):
+        msg = f"Portfolio parameters must be given per solver, got {unknown}."
+        raise ValueError(msg)
+
+    if cache_dir is not None:
+        if isinstance(cache_dir, ResultCache):
+            cache = cache_dir
+        else:
+            cache = ResultCache(cache_dir)
+
+        key = cache.key(
+            data, solver, time_limit, num_workers, initial_solution, **kwargs
+        )
+
+        if (result := cache.get(key, data)) is not None:
+            if display:
+                print(f"Loaded result from cache in {cache.loc}.")
+
+            return _fallback(data, result) if fallback else result
+
     if display:
         print(f"PyJobShop v{version('pyjobshop')}\n")
         print("Solving an instance with:")
         print(textwrap.indent(str(data), "    ") + "\n")
         print(" START SOLVER LOG ".center(79, "="))
 
-    if solver == "ortools":
-        cp_model = ORToolsModel(data)
+    stopped = False
+
+    def callback(result: Result) -> bool:
+        nonlocal stopped
+        stopped = bool(on_solution(result))  # type: ignore
+        return stopped
+
+    if solver == "portfolio":
+        result = _solve_portfolio(
+            data,
+            time_limit,
+            display,
+            num_workers,
+            initial_solution,
+            callback if on_solution is not None else None,
+            stop_event,
+            **kwargs,
+        )
     else:
-        from pyjobshop.solvers.cpoptimizer import (
-            CPModel as CPOptimizerModel,
+        result = _model(data, solver).solve(
+            time_limit,
+            display,
+            num_workers,
+            initial_solution,
+            callback if on_solution is not None else None,
+            stop_event,
+            **kwargs,
         )
 
-        cp_model = CPOptimizerModel(data)  # type: ignore
+    if display:
+        print(" END SOLVER LOG ".center(79, "="))
+
+    if stop_event is not None and stop_event.is_set():
+        stopped = True
+
+    if cache_dir is not None and not stopped:
+        cache.put(key, result)
+
+    return _fallback(data, result) if fallback else result
+
+
+def solve_iter(
+    data: ProblemData,
+    solver: Literal["ortools", "cpoptimizer", "portfolio"] = "ortools",
+    time_limit: float = float("inf"),
+    display: bool = False,
+    num_workers: int | None = None,
+    initial_solution: Solution | None = None,
+    **kwargs,
+) -> Iterator[Result]:
+    """
+    Solves the given problem data instance, and yields each improving
+    solution as soon as it is found. The solver runs in a background thread.
+
+    Each yielded Result object has status ``FEASIBLE`` and contains the
+    incumbent solution, its objective value, the lower bound and the elapsed
+    time at the moment it was found. The last yielded Result object is the
+    final result, as returned by :func:`solve`.
 
-    result = cp_model.solve(
+    Closing the iterator early, for example by breaking out of a loop over
+    it, stops the search.
+
+    Parameters
+    ----------
+    data
+        The problem data instance.
+    solver
+        The solver to use. Either ``'ortools'`` (default), ``'cpoptimizer'``,
+        or ``'portfolio'``. See :func:`solve`.
+    time_limit
+        The time limit for the solver in seconds. Default ``float('inf')``.
+    display
+        Whether to display the solver output. Default ``False``.
+    num_workers
+        The number of workers to use for parallel solving. If not specified,
+        the default of the selected solver is used.
+    initial_solution
+        An initial solution to start the solver from. Default is no solution.
+    kwargs
+        Additional parameters passed to the solver.
+
+    Yields
+    ------
+    Result
+        A Result object for each improving solution, followed by the final
+        result.
+    """
+    events: queue.Queue[tuple[str, Result | BaseException]] = queue.Queue()
+    stop = threading.Event()
+
+    def on_solution(result: Result):
+        events.put(("solution", result))
+
+    def run():
+        try:
+            result = solve(
+                data,
+                solver,
+                time_limit,
+                display,
+                num_workers,
+                initial_solution,
+                on_solution=on_solution,
+                stop_event=stop,
+                **kwargs,
+            )
+            events.put(("result", result))
+        except BaseException as exc:  # re-raised by the iterator
+            events.put(("error", exc))
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            kind, value = events.get()
+
+            if isinstance(value, BaseException):
+                raise value
+
+            yield value
+
+            if kind == "result":
+                return
+    finally:
+        stop.set()
+
+
+async def solve_async(
+    data: ProblemData,
+    solver: Literal["ortools", "cpoptimizer", "portfolio"] = "ortools",
+    time_limit: float = float("inf"),
+    display: bool = False,
+    num_workers: int | None = None,
+    initial_solution: Solution | None = None,
+    **kwargs,
+) -> Result:
+    """
+    Solves the given problem data instance without blocking the event loop.
+    Building the model and solving it both run in the default executor of
+    the running event loop, so that multiple instances can be solved
+    concurrently.
+
+    If the awaiting task is cancelled, the search is stopped and the best
+    result found so far is returned, rather than raising
+    :class:`asyncio.CancelledError`.
+
+    Parameters
+    ----------
+    data
+        The problem data instance.
+    solver
+        The solver to use. Either ``'ortools'`` (default), ``'cpoptimizer'``,
+        or ``'portfolio'``. See :func:`solve`.
+    time_limit
+        The time limit for the solver in seconds. Default ``float('inf')``.
+    display
+        Whether to display the solver output. Default ``False``.
+    num_workers
+        The number of workers to use for parallel solving. If not specified,
+        the default of the selected solver is used.
+    initial_solution
+        An initial solution to start the solver from. Default is no solution.
+    kwargs
+        Additional parameters passed to :func:`solve`.
+
+    Returns
+    -------
+    Result
+        A Result object containing the best found solution and additional
+        information about the solver run.
+    """
+    loop = asyncio.get_running_loop()
+    stop_event = threading.Event()
+    func = partial(
+        solve,
+        data,
+        solver,
         time_limit,
         display,
         num_workers,
         initial_solution,
+        stop_event=stop_event,
         **kwargs,
     )
+    future = loop.run_in_executor(None, func)
 
-    if display:
-        print(" END SOLVER LOG ".center(79, "="))
+    try:
+        # Shielded, so that cancelling the task does not cancel the future
+        # of the result that is still being computed.
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        stop_event.set()
+        return await future
+
+
+def solve_many(
+    instances: Iterable[ProblemData],
+    num_parallel: int | None = None,
+    workers_per_instance: int | None = None,
+    solver: Literal["ortools", "cpoptimizer", "portfolio"] = "ortools",
+    time_limit: float = float("inf"),
+    display: bool = False,
+    **kwargs,
+) -> Iterator[tuple[int, Result]]:
+    """
+    Solves the given problem data instances in parallel processes, and
+    yields the results as they complete.
+
+    Instances are sent to the worker processes in the binary columnar format
+    of :meth:`~pyjobshop.ProblemData.ProblemData.to_npy`, which the workers
+    memory-map rather than unpickle. The files are stored in shared memory
+    where available. Results are sent back without their problem data.
+
+    Closing the iterator early, for example by breaking out of a loop over
+    it, stops the solves that are still running.
+
+    The worker processes are started with the ``'spawn'`` start method, so
+    scripts that call this function must guard their entry point with
+    ``if __name__ == "__main__":``.
+
+    Parameters
+    ----------
+    instances
+        The problem data instances to solve. These are read on demand, so a
+        generator can be passed to only keep the instances that are being
+        solved in memory.
+    num_parallel
+        Number of instances to solve in parallel. Default is the number of
+        instances or available CPU cores, whichever is smaller. If the number
+        of instances is unknown because they are given by an iterator, the
+        default is the number of available CPU cores. If this is 1, the
+        instances are solved one after the other in this process.
+    workers_per_instance
+        Number of workers to use for solving a single instance. If not
+        specified, the available CPU cores are divided evenly over the
+        instances that are solved in parallel.
+    solver
+        The solver to use. Either ``'ortools'`` (default), ``'cpoptimizer'``,
+        or ``'portfolio'``. See :func:`solve`.
+    time_limit
+        The time limit for solving each instance in seconds. Default
+        ``float('inf')``.
+    display
+        Whether to display the solver output. Default ``False``.
+    kwargs
+        Additional parameters passed to :func:`solve`.
+
+    Yields
+    ------
+    tuple[int, Result]
+        The index of an instance and its Result object, in order of
+        completion.
+
+    Raises
+    ------
+    ValueError
+        If the number of parallel instances or workers is not positive.
+    """
+    num_cpus = os.cpu_count() or 1
+
+    if num_parallel is None:
+        # The number of instances is only known if they are not given lazily.
+        num_instances = len(instances) if isinstance(instances, Sized) else 0
+        num_parallel = max(min(num_instances or num_cpus, num_cpus), 1)
+
+    if num_parallel < 1:
+        raise ValueError("Number of parallel instances must be positive.")
+
+    if workers_per_instance is not None and workers_per_instance < 1:
+        raise ValueError("Number of workers per instance must be positive.")
+
+    if num_parallel == 1:
+        for idx, data in enumerate(instances):
+            result = solve(
+                data,
+                solver,
+                time_limit,
+                display,
+                workers_per_instance,
+                **kwargs,
+            )
+            yield idx, result
+
+        return
+
+    # Instances are read on demand, so that only the instances that are
+    # being solved are kept in memory.
+    remaining = enumerate(instances)
+    pending: deque[tuple[int, ProblemData]] = deque()
+    running: dict[Future, tuple[int, int]] = {}  # index and no. of workers
+    running_data: dict[int, ProblemData] = {}
+
+    # Stops the solves that are still running when the caller stops reading
+    # results early. The event is inherited by the worker processes.
+    stop = MP_CONTEXT.Event()
+
+    with (
+        tempfile.TemporaryDirectory(dir=SHARED_MEMORY_DIR) as tmp_dir,
+        ProcessPoolExecutor(
+            num_parallel,
+            mp_context=MP_CONTEXT,
+            initializer=_init_worker,
+            initargs=(stop,),
+        ) as pool,
+    ):
+        try:
+            while True:
+                idle = num_parallel - len(running)
+                pending.extend(islice(remaining, idle))
+
+                if not pending and not running:
+                    break
+
+                while pending:
+                    idx, data = pending.popleft()
+
+                    if workers_per_instance is not None:
+                        num_workers = workers_per_instance
+                    else:
+                        # Divides the idle cores over the instances that start
+                        # now, so that cores are balanced over all instances.
+                        busy = sum(workers for _, workers in running.values())
+                        slots = len(pending) + 1
+                        num_workers = max((num_cpus - busy) // slots, 1)
+
+                    loc = Path(tmp_dir) / str(idx)
+                    data.to_npy(loc)
+                    future = pool.submit(
+                        _solve_npy,
+                        loc,
+                        solver,
+                        time_limit,
+                        display,
+                        num_workers,
+                        kwargs,
+                    )
+                    running[future] = (idx, num_workers)
+                    running_data[idx] = data
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    idx, _ = running.pop(future)
+                    data = running_data.pop(idx)
+                    shutil.rmtree(Path(tmp_dir) / str(idx), ignore_errors=True)
+
+                    yield idx, unpack(future.result(), data)
+        finally:
+            # Stops the running solves and cancels those that have not yet
+            # started, so that exiting the pool does not wait for them.
+            stop.set()
+            pool.shutdown(cancel_futures=True)
+
+
+# Event that stops the solves of a solve_many worker process once it is set.
+_worker_stop: ProcessEvent | None = None
+
+
+def _init_worker(stop: ProcessEvent):
+    """
+    Initializes a worker process of :func:`solve_many`. The stop event cannot
+    be sent along with each instance, so it is passed to the workers here.
+    """
+    global _worker_stop
+    _worker_stop = stop
+
+
+def _solve_npy(
+    loc: Path,
+    solver: Literal["ortools", "cpoptimizer", "portfolio"],
+    time_limit: float,
+    display: bool,
+    num_workers: int,
+    kwargs: dict[str, Any],
+) -> tuple:
+    """
+    Solves the instance in the given binary format directory. Used by the
+    worker processes of :func:`solve_many`. Returns the packed result, see
+    :func:`~pyjobshop._transfer.pack`.
+    """
+    data = ProblemData.from_npy(loc, validate=False)
+
+    # The solvers take a thread event, which is set once the process event
+    # is set.
+    stop_event = threading.Event()
+    with stop_when_set(_worker_stop, stop_event.set):
+        result = solve(
+            data,
+            solver,
+            time_limit,
+            display,
+            num_workers,
+            stop_event=stop_event,
+            **kwargs,
+        )
+
+    return pack(result)
+
+
+def _fallback(data: ProblemData, result: Result) -> Result:
+    """
+    Returns the given result with the solution of the heuristic if the result
+    has no solution, and the heuristic constructs one. Results of proven
+    infeasible instances are returned as is.
+    """
+    if result.status not in [SolveStatus.TIME_LIMIT, SolveStatus.UNKNOWN]:
+        return result
+
+    timings = dict(result.stats.timings)
+    try:
+        with timed(timings, "fallback"):
+            solution = sgs(data)
+    except ValueError:  # not supported, or no solution found
+        return result
+
+    return replace(
+        result,
+        objective=solution.objective,
+        status=SolveStatus.FEASIBLE,
+        runtime=result.runtime + timings["fallback"],
+        best=solution,
+        stats=replace(result.stats, timings=timings),
+    )
+
+
+def _model(data: ProblemData, solver: Literal["ortools", "cpoptimizer"]):
+    """
+    Returns the model of the given instance for the given solver.
+    """
+    if solver == "ortools":
+        return ORToolsModel(data)
+
+    from pyjobshop.solvers.cpoptimizer import CPModel as CPOptimizerModel
+
+    return CPOptimizerModel(data)
+
+
+# Solvers that are raced by the portfolio.
+_PORTFOLIO: tuple[Literal["ortools", "cpoptimizer"], ...] = (
+    "ortools",
+    "cpoptimizer",
+)
+
+
+def _solve_portfolio(
+    data: ProblemData,
+    time_limit: float,
+    display: bool,
+    num_workers: int | None,
+    initial_solution: Solution | None,
+    on_solution: Callable[[Result], bool | None] | None,
+    stop_event: threading.Event | None,
+    **kwargs,
+) -> Result:
+    """
+    Solves the given instance with all solvers of the portfolio in parallel
+    processes, and returns the best result. See :func:`solve`.
+    """
+    start = time.perf_counter()
+    deadline = time.time() + time_limit  # shared by all solver processes
+    num_cpus = num_workers if num_workers is not None else os.cpu_count() or 1
+    initial_tasks = initial_solution.tasks if initial_solution else None
+
+    stop = MP_CONTEXT.Event()
+    messages: multiprocessing.Queue = MP_CONTEXT.Queue()
+    processes = {}
+    results: dict[str, Result] = {}
+    best_objective = float("inf")
+
+    with (
+        tempfile.TemporaryDirectory(dir=SHARED_MEMORY_DIR) as tmp_dir,
+        stop_when_set(stop_event, stop.set),
+    ):
+        loc = Path(tmp_dir) / "instance"
+        data.to_npy(loc)
+
+        for idx, solver in enumerate(_PORTFOLIO):
+            # Divides the workers evenly, giving any remainder to the first
+            # solvers of the portfolio.
+            workers = num_cpus // len(_PORTFOLIO)
+            workers += idx < num_cpus % len(_PORTFOLIO)
+
+            process = MP_CONTEXT.Process(
+                target=_portfolio_worker,
+                args=(
+                    loc,
+                    solver,
+                    deadline,
+                    display,
+                    max(workers, 1),
+                    initial_tasks,
+                    on_solution is not None,
+                    kwargs.get(solver, {}),
+                    stop,
+                    messages,
+                ),
+                daemon=True,
+            )
+            process.start()
+            processes[solver] = process
+
+        try:
+            while len(results) < len(processes):
+                try:
+                    solver, kind, payload = messages.get(timeout=0.1)
+                except queue.Empty:
+                    for solver, process in processes.items():
+                        if solver not in results and not process.is_alive():
+                            msg = f"Portfolio solver {solver} exited early."
+                            raise RuntimeError(msg) from None
+
+                    continue
+
+                if kind == "error":
+                    raise payload
+
+                result = unpack(payload, data)
+                if kind == "result":
+                    results[solver] = result
+                elif result.objective < best_objective:  # improving incumbent
+                    best_objective = result.objective
+                    if on_solution(result):  # type: ignore
+                        stop.set()
+        finally:
+            # Stops any solver that is still running, and drains the queue so
+            # that the solver processes can exit.
+            stop.set()
+            while any(proc.is_alive() for proc in processes.values()):
+                with contextlib.suppress(queue.Empty):
+                    messages.get(timeout=0.1)
+
+            for process in processes.values():
+                process.join()
+
+    proven = [SolveStatus.OPTIMAL, SolveStatus.INFEASIBLE]
+    best = min(
+        results.values(),
+        key=lambda res: (res.status not in proven, res.objective),
+    )
+
+    return replace(
+        best,
+        lower_bound=max(res.lower_bound for res in results.values()),
+        runtime=time.perf_counter() - start,
+    )
+
+
+def _portfolio_worker(
+    loc: Path,
+    solver: Literal["ortools", "cpoptimizer"],
+    deadline: float,
+    display: bool,
+    num_workers: int,
+    initial_tasks: list[ScheduledTask] | None,
+    stream: bool,
+    kwargs: dict[str, Any],
+    stop: ProcessEvent,
+    messages: multiprocessing.Queue,
+):
+    """
+    Solves the instance in the given binary format directory with the given
+    solver, as part of the portfolio. Sends the packed incumbents (if
+    ``stream``) and the final result or exception over the message queue,
+    and stops the other solvers when the solver proves optimality or
+    infeasibility.
+    """
+    try:
+        data = ProblemData.from_npy(loc, validate=False)
+        initial = Solution(data, initial_tasks) if initial_tasks else None
+
+        def on_solution(result: Result):
+            messages.put((solver, "incumbent", pack(result)))
+
+        # The solvers take a thread event, which is set once the process
+        # event is set.
+        stop_search = threading.Event()
+        with stop_when_set(stop, stop_search.set):
+            result = _model(data, solver).solve(
+                max(deadline - time.time(), 0),
+                display,
+                num_workers,
+                initial,
+                on_solution if stream else None,
+                stop_search,
+                **kwargs,
+            )
+    except Exception as exc:
+        messages.put((solver, "error", exc))
+        return
+
+    if result.status in [SolveStatus.OPTIMAL, SolveStatus.INFEASIBLE]:
+        stop.set()
 
-    return result
+    messages.put((solver, "result", pack(result)))
@@ -1,9 +1,14 @@
+import threading
+from collections.abc import Callable
+
 from docplex.cp.model import CpoModel
 from docplex.cp.solution import CpoSolveResult
+from docplex.cp.solver.cpo_callback import EVENT_SOLUTION, CpoCallback
 
 from pyjobshop.ProblemData import ProblemData
-from pyjobshop.Result import Result, SolveStatus
+from pyjobshop.Result import ModelStats, Result, SolveStatus
 from pyjobshop.Solution import ScheduledTask, Solution
+from pyjobshop.solvers.utils import stop_when_set, timed
 
 from .Constraints import Constraints
 from .Objective import Objective
@@ -26,12 +31,17 @@ class CPModel:
         self._data = data
 
         self._model = model if model is not None else CpoModel()
-        self._variables = Variables(self._model, data)
+        self._timings: dict[str, float] = {}  # wall times of build phases
+
+        with timed(self._timings, "variables"):
+            self._variables = Variables(self._model, data)
+
         self._constraints = Constraints(self._model, data, self._variables)
         self._objective = Objective(self._model, data, self._variables)
 
-        self._constraints.add_constraints()
-        self._objective.add_objective()
+        self._constraints.add_constraints(self._timings)
+        with timed(self._timings, "objective"):
+            self._objective.add_objective()
 
     @property
     def model(self) -> CpoModel:
@@ -97,6 +107,8 @@ class CPModel:
         display: bool = False,
         num_workers: int | None = None,
         initial_solution: Solution | None = None,
+        on_solution: Callable[[Result], bool | None] | None = None,
+        stop_event: threading.Event | None = None,
         **kwargs,
     ) -> Result:
         """
@@ -113,6 +125,14 @@ class CPModel:
             available CPU cores are used.
         initial_solution
             Initial solution to start the solver from. Default is no solution.
+        on_solution
+            Optional function that is called with a Result object for each
+            improving solution found during the search. If it returns
+            ``True``, the search is stopped. Default is no callback.
+        stop_event
+            Optional event that stops the search when it is set, for example
+            from another thread. The result then contains the best solution
+            found so far. Default is no event.
         kwargs
             Additional parameters passed to the solver.
 
@@ -122,8 +142,11 @@ class CPModel:
             A Result object containing the best found solution and additional
             information about the solver run.
         """
+        timings = dict(self._timings)
+
         if initial_solution is not None:
-            self._variables.warmstart(initial_solution)
+            with timed(timings, "warmstart"):
+                self._variables.warmstart(initial_solution)
 
         params = {
             "TimeLimit": time_limit,
@@ -132,11 +155,24 @@ class CPModel:
         }
         params.update(kwargs)  # this will override existing parameters!
 
-        cp_result: CpoSolveResult = self._model.solve(**params)  # type: ignore
+        with timed(timings, "solve"):
+            solver = self._model.create_solver(**params)
+            if on_solution is not None:
+                callback = _SolutionCallback(
+                    self._convert_to_solution, on_solution
+                )
+                solver.add_callback(callback)
+
+            with stop_when_set(stop_event, solver.abort_search):
+                cp_result: CpoSolveResult = solver.solve()  # type: ignore
+            solver.end()
+
         status = cp_result.get_solve_status()
 
         if status in ["Optimal", "Feasible"]:
-            solution = self._convert_to_solution(cp_result)
+            with timed(timings, "convert"):
+                solution = self._convert_to_solution(cp_result)
+
             objective: float = cp_result.get_objective_value()  # type: ignore
             lower_bound = cp_result.get_objective_bound()
         else:
@@ -145,10 +181,48 @@ class CPModel:
             objective = float("inf")
             lower_bound = 0
 
+        stats = self._model.get_statistics()
         return Result(
             objective=objective,
             lower_bound=lower_bound,
             status=self._get_solve_status(status),
             runtime=cp_result.get_solve_time(),
             best=solution,
+            stats=ModelStats(
+                timings,
+                num_variables=stats.get_number_of_variables(),
+                num_constraints=stats.get_number_of_constraints(),
+                solver="cpoptimizer",
+            ),
         )
+
+
+class _SolutionCallback(CpoCallback):
+    """
+    Calls the given function with a Result object for each solution found by
+    the solver, and stops the search when the function returns ``True``.
+    """
+
+    def __init__(
+        self,
+        convert: Callable[[CpoSolveResult], Solution],
+        on_solution: Callable[[Result], bool | None],
+    ):
+        self._convert = convert
+        self._on_solution = on_solution
+
+    def invoke(self, solver, event, sres):
+        if event != EVENT_SOLUTION:
+            return
+
+        result = Result(
+            objective=sres.get_objective_value(),
+            lower_bound=sres.get_objective_bound(),
+            status=SolveStatus.FEASIBLE,
+            runtime=sres.get_solve_time(),
+            best=self._convert(sres),
+            stats=ModelStats(solver="cpoptimizer"),
+        )
+
+        if self._on_solution(result):
+            solver.abort_search()
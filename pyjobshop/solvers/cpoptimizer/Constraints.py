@@ -1,7 +1,6 @@
 from itertools import pairwise
 
 import docplex.cp.modeler as cpo
-import numpy as np
 from docplex.cp.function import CpoStepFunction
 from docplex.cp.model import CpoModel
 
@@ -56,6 +55,7 @@ class Constraints:
         available, the setup times are enforced as well.
         """
         model, data, variables = self._model, self._data, self._variables
+        setup_times = data.setup_times_index
 
         for idx in data.machine_idcs:
             if not data.resource2modes(idx):
@@ -63,13 +63,15 @@ class Constraints:
 
             machine = data.resources[idx]
             seq_var = variables.sequence_vars[idx]
+            task_idcs = [data.modes[m].task for m in data.resource2modes(idx)]
+            res_tasks = sorted(set(task_idcs))
+            task2type = {task: pos for pos, task in enumerate(res_tasks)}
             matrix = None
-            setup_times = utils.setup_times_matrix(data)
 
-            if setup_times is not None and np.any(setup_times[idx, :, :] > 0):
-                # The indexing of setup times is correctly handled by the
-                # interval variable's task index "type".
-                matrix = setup_times[idx, :, :]
+            if setup_times.has_setup_times(idx):
+                # The setup times matrix is restricted to the tasks on this
+                # machine, which are indexed by the interval variable's type.
+                matrix = setup_times.matrix(idx, res_tasks)
 
             # ``is_direct`` enforces setup times between direct successors.
             # See ICAPS 2017 presentation for details.
@@ -83,25 +85,25 @@ class Constraints:
             # This applies to all task pairs except the last task in sequence.
             # The last task is determined dynamically by the solver sequencing.
             intervals = seq_var.get_interval_variables()
-            task_idcs = [data.modes[m].task for m in data.resource2modes(idx)]
+            num_types = len(res_tasks)
 
             for task_idx, interval in zip(task_idcs, intervals):
                 next_type = cpo.type_of_next(
                     seq_var,
                     interval,
-                    # The returned value ``data.num_tasks`` is used to
-                    # deactivate the precedence constraint.
-                    lastValue=data.num_tasks,
-                    absentValue=data.num_tasks,
+                    # The returned value ``num_types`` is used to deactivate
+                    # the precedence constraint.
+                    lastValue=num_types,
+                    absentValue=num_types,
                 )
 
                 setup = 0
-                if setup_times is not None:
-                    setup_array = setup_times[idx, task_idx, :].tolist()
+                if matrix is not None:
+                    setup_array = matrix[task2type[task_idx]].tolist()
                     setup_array.append(0)  # padding for last or absent
                     setup = cpo.element(setup_array, next_type)
 
-                not_absent_or_last = next_type != data.num_tasks
+                not_absent_or_last = next_type != num_types
                 end1 = cpo.end_of(interval)
                 start2 = cpo.start_of_next(seq_var, interval)
                 expr = end1 + setup == start2
@@ -372,19 +374,33 @@ class Constraints:
             presences = [presence_of(variables.task_vars[idx]) for idx in idcs]
             model.add(cpo.if_then(condition, sum(presences) == 1))
 
-    def add_constraints(self):
+    def add_constraints(self, timings: dict[str, float] | None = None):
         """
         Adds all the constraints to the CP model.
+
+        Parameters
+        ----------
+        timings
+            Optional wall times in seconds, keyed by phase name. If given,
+            the wall time of adding each type of constraint is added to it.
         """
-        self._job_spans_tasks()
-        self._select_one_mode()
-        self._machines_no_overlap_and_setup_times()
-        self._renewable_capacity()
-        self._consumable_capacity()
-        self._resource_breaks_constraints()
-        self._timing_constraints()
-        self._identical_and_different_resource_constraints()
-        self._consecutive_constraints()
-        self._same_sequence_constraints()
-        self._mode_dependencies()
-        self._task_selection_constraints()
+        timings = timings if timings is not None else {}
+        add_constraints = [
+            self._job_spans_tasks,
+            self._select_one_mode,
+            self._machines_no_overlap_and_setup_times,
+            self._renewable_capacity,
+            self._consumable_capacity,
+            self._resource_breaks_constraints,
+            self._timing_constraints,
+            self._identical_and_different_resource_constraints,
+            self._consecutive_constraints,
+            self._same_sequence_constraints,
+            self._mode_dependencies,
+            self._task_selection_constraints,
+        ]
+
+        for add_constraint in add_constraints:
+            name = add_constraint.__name__.lstrip("_")
+            with utils.timed(timings, name):
+                add_constraint()
@@ -1,7 +1,6 @@
 import docplex.cp.modeler as cpo
 from docplex.cp.model import CpoExpr, CpoModel
 
-import pyjobshop.solvers.utils as utils
 from pyjobshop.ProblemData import Objective as ObjectiveData
 from pyjobshop.ProblemData import ProblemData
 
@@ -90,32 +89,36 @@ class Objective:
         Returns an expression representing the total setup times.
         """
         data = self._data
+        setup_times = data.setup_times_index
         total = []
 
         for res_idx in data.machine_idcs:
             if not data.resource2modes(res_idx):
                 continue
 
-            if (setup_times := utils.setup_times_matrix(data)) is None:
+            if not setup_times.has_setup_times(res_idx):
                 continue
 
             seq_var = self._sequence_vars[res_idx]
             intervals = seq_var.get_interval_variables()
             resource_modes = data.resource2modes(res_idx)
             task_idcs = [data.modes[m].task for m in resource_modes]
+            res_tasks = sorted(set(task_idcs))
+            task2type = {task: pos for pos, task in enumerate(res_tasks)}
+            matrix = setup_times.matrix(res_idx, res_tasks)
 
             for idx, interval in enumerate(intervals):
                 # The setup time for the current interval is a variable that
                 # depends on the next interval's task in the sequence. If the
                 # interval is last or absent, we set the setup time to 0.
                 task_idx = task_idcs[idx]
-                setup_array = setup_times[res_idx, task_idx, :].tolist()
+                setup_array = matrix[task2type[task_idx]].tolist()
                 setup_array.append(0)  # padding for last or absent
                 next_idx = cpo.type_of_next(
                     seq_var,
                     interval,
-                    lastValue=data.num_tasks,
-                    absentValue=data.num_tasks,
+                    lastValue=len(res_tasks),
+                    absentValue=len(res_tasks),
                 )
                 setup_time = cpo.element(setup_array, next_idx)
                 total.append(setup_time)
@@ -140,11 +140,16 @@ class Variables:
                 # about unused sequence variables.
                 continue
 
+            # Interval types are the positions of the tasks in the sorted
+            # list of unique tasks on this machine. These are used to index
+            # the machine's setup times matrix.
             intervals = [self.mode_vars[mode] for mode in modes]
             tasks = [data.modes[mode].task for mode in modes]
+            res_tasks = sorted(set(tasks))
+            task2type = {task: pos for pos, task in enumerate(res_tasks)}
             seq_var = sequence_var(
                 name=f"S{idx}",
-                types=tasks,  # needed for total setup time objective
+                types=[task2type[task] for task in tasks],
                 vars=intervals,
             )
             self._model.add(seq_var)
@@ -1,12 +1,29 @@
-from ortools.sat.python.cp_model import CpModel, CpSolver
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from collections.abc import Callable, Iterable
+from importlib.metadata import version
+from pathlib import Path
+
+import numpy as np
+from ortools.sat.python.cp_model import (
+    CpModel,
+    CpSolver,
+    CpSolverSolutionCallback,
+    IntVar,
+)
 
 from pyjobshop.ProblemData import ProblemData
-from pyjobshop.Result import Result, SolveStatus
+from pyjobshop.Result import ModelStats, Result, SolveStatus
 from pyjobshop.Solution import ScheduledTask, Solution
+from pyjobshop.solvers.utils import stop_when_set, timed
 
 from .Constraints import Constraints
 from .Objective import Objective
-from .Variables import Variables
+from .Variables import TaskVar, Variables
 
 
 class CPModel:
@@ -19,18 +36,189 @@ class CPModel:
         The problem data instance.
     model
         CpModel instance to use. If None (default), a new one is created.
+    prune_arcs
+        Whether to leave out sequence arcs between tasks that can never
+        directly succeed each other, for example because of precedence
+        constraints, time windows, or forbidden setup times. This reduces the
+        size of the circuit constraints. Default ``False``.
     """
 
-    def __init__(self, data: ProblemData, model: CpModel | None = None):
+    def __init__(
+        self,
+        data: ProblemData,
+        model: CpModel | None = None,
+        prune_arcs: bool = False,
+    ):
         self._data = data
 
         self._model = model if model is not None else CpModel()
-        self._variables = Variables(self._model, data)
-        self._constraints = Constraints(self._model, data, self._variables)
-        self._objective = Objective(self._model, data, self._variables)
+        self._timings: dict[str, float] = {}  # wall times of build phases
+
+        with timed(self._timings, "variables"):
+            variables = Variables(self._model, data, prune_arcs)
+
+        self._variables: Variables | None = variables
+        self._constraints = Constraints(self._model, data, variables)
+        self._objective = Objective(self._model, data, variables)
 
-        self._constraints.add_constraints()
-        self._objective.add_objective()
+        self._constraints.add_constraints(self._timings)
+        with timed(self._timings, "objective"):
+            self._objective.add_objective()
+
+        self._num_arcs = variables.num_arcs
+        self._num_break_vars = variables.num_break_vars
+
+        # Proto indices of the variables that are needed to convert a solver
+        # result to a solution, which allows doing so for loaded models.
+        self._task_idcs = np.array(
+            [_task_indices(var) for var in variables.task_vars],
+            dtype=np.int64,
+        ).reshape(-1, 5)
+        self._mode_idcs = np.array(
+            [_index(var) for var in variables.mode_vars], dtype=np.int64
+        )
+
+        # Original domains and fixed values of the variables fixed by ``fix``.
+        self._fixed: dict[int, tuple[list[int], int]] = {}
+
+    def save(self, loc: str | Path):
+        """
+        Writes the built model to a directory, so that it can be loaded again
+        with :meth:`load` without building it. The model is stored as a text
+        protocol buffer, together with the variable indices needed to convert
+        solver results to solutions.
+
+        Parameters
+        ----------
+        loc
+            Directory to write the model to. Created if it does not exist.
+        """
+        loc = Path(loc)
+        loc.mkdir(parents=True, exist_ok=True)
+
+        # Hints and fixed variables belong to a single solve, so they are
+        # not stored.
+        model = self._model.clone()
+        model.clear_hints()
+
+        for idx, (domain, _) in self._fixed.items():
+            model.proto.variables[idx].domain.clear()
+            model.proto.variables[idx].domain.extend(domain)
+
+        # OR-Tools can only read models back from the text format.
+        model.export_to_file(str(loc / "model.pbtxt"))
+        np.save(loc / "task_vars.npy", self._task_idcs)
+        np.save(loc / "mode_vars.npy", self._mode_idcs)
+
+        meta = {
+            "fingerprint": self._data.fingerprint(),
+            "pyjobshop": version("pyjobshop"),
+            "num_arcs": self._num_arcs,
+            "num_break_vars": self._num_break_vars,
+        }
+        with open(loc / "meta.json", "w") as fh:
+            json.dump(meta, fh)
+
+    @classmethod
+    def load(cls, data: ProblemData, loc: str | Path) -> "CPModel":
+        """
+        Loads a model that was written by :meth:`save`. Loaded models do not
+        have :attr:`variables`, and warmstarting a loaded model only hints
+        the task and mode variables.
+
+        Parameters
+        ----------
+        data
+            The problem data instance that the model was built for.
+        loc
+            Directory to read the model from.
+
+        Returns
+        -------
+        CPModel
+            The loaded model.
+
+        Raises
+        ------
+        ValueError
+            If the model was built for a different instance, or by a
+            different version of PyJobShop.
+        """
+        loc = Path(loc)
+        with open(loc / "meta.json") as fh:
+            meta = json.load(fh)
+
+        if meta["fingerprint"] != data.fingerprint():
+            raise ValueError("Model was built for a different instance.")
+
+        if meta["pyjobshop"] != version("pyjobshop"):
+            msg = f"Model was built by PyJobShop v{meta['pyjobshop']}."
+            raise ValueError(msg)
+
+        timings: dict[str, float] = {}
+        with timed(timings, "load"):
+            model = CpModel()
+            model.proto.parse_text_format((loc / "model.pbtxt").read_text())
+            model.rebuild_constant_map()
+
+        cp_model: CPModel = cls.__new__(cls)
+        cp_model._data = data
+        cp_model._model = model
+        cp_model._timings = timings
+        cp_model._variables = None
+        cp_model._num_arcs = meta["num_arcs"]
+        cp_model._num_break_vars = meta["num_break_vars"]
+        cp_model._task_idcs = np.load(loc / "task_vars.npy")
+        cp_model._mode_idcs = np.load(loc / "mode_vars.npy")
+        cp_model._fixed = {}
+        return cp_model
+
+    @classmethod
+    def cached(
+        cls,
+        data: ProblemData,
+        cache_dir: str | Path,
+        prune_arcs: bool = False,
+    ) -> "CPModel":
+        """
+        Returns the model of the given instance from a directory of saved
+        models, keyed by the fingerprint of the instance. If there is no such
+        model yet, it is built and saved to the directory first.
+
+        Parameters
+        ----------
+        data
+            The problem data instance.
+        cache_dir
+            Directory of saved models. Created if it does not exist.
+        prune_arcs
+            Whether to prune sequence arcs, see :class:`CPModel`.
+
+        Returns
+        -------
+        CPModel
+            The loaded or newly built model.
+        """
+        key = f"{data.fingerprint()}-{prune_arcs}-{version('pyjobshop')}"
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        loc = Path(cache_dir) / digest
+
+        if loc.exists():
+            return cls.load(data, loc)
+
+        cp_model = cls(data, prune_arcs=prune_arcs)
+
+        # Saves to a temporary directory first, so that other processes
+        # never load partially written models.
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        tmp = tempfile.mkdtemp(dir=cache_dir)
+        try:
+            cp_model.save(tmp)
+            os.rename(tmp, loc)
+        except OSError:  # saved by another process in the meantime
+            shutil.rmtree(tmp, ignore_errors=True)
+
+        return cp_model
 
     @property
     def model(self) -> CpModel:
@@ -43,9 +231,97 @@ class CPModel:
     def variables(self) -> Variables:
         """
         Returns the Variables object containing all model variables.
+
+        Raises
+        ------
+        ValueError
+            If this model was loaded with :meth:`load`.
         """
+        if self._variables is None:
+            raise ValueError("Variables are not available for loaded models.")
+
         return self._variables
 
+    def fix(self, solution: Solution, tasks: Iterable[int]):
+        """
+        Fixes the presence, start, end, idle, breaks and mode variables of
+        the given tasks to their values in the given solution, by tightening
+        the variable domains, and hints the task and mode variables of all
+        other tasks based on the solution. Solving the model then only
+        optimizes the other tasks, starting from the given solution. This is
+        used to solve sub-problems, for example in large neighborhood search.
+
+        Tasks that were fixed before but are not given are released again.
+        Only the variables whose fixed value changes are updated, so that
+        solving a sequence of sub-problems of a large model is cheap.
+
+        Parameters
+        ----------
+        solution
+            The solution to take the variable values from.
+        tasks
+            Indices of the tasks to fix.
+        """
+        data = self._data
+        task_idcs = self._task_idcs.tolist()
+        mode_idcs = self._mode_idcs.tolist()
+        fixed_tasks = set(tasks)
+        values: dict[int, int] = {}
+
+        for task_idx in fixed_tasks:
+            sol_task = solution.tasks[task_idx]
+            present, start, end, idle, breaks = task_idcs[task_idx]
+            values[present] = sol_task.present
+
+            if sol_task.present:
+                # Absent tasks can take any start and end values.
+                values[start] = sol_task.start
+                values[end] = sol_task.end
+                values[idle] = sol_task.idle
+                values[breaks] = sol_task.breaks
+
+            for mode_idx in data.task2modes(task_idx):
+                selected = sol_task.present and mode_idx == sol_task.mode
+                values[mode_idcs[mode_idx]] = selected
+
+        variables = self._model.proto.variables
+        released = [idx for idx in self._fixed if idx not in values]
+        for idx in released:
+            domain, _ = self._fixed.pop(idx)
+            variables[idx].domain.clear()
+            variables[idx].domain.extend(domain)
+
+        for idx, value in values.items():
+            if idx in self._fixed:
+                domain, fixed_value = self._fixed[idx]
+                if fixed_value == value:
+                    continue
+            else:
+                domain = list(variables[idx].domain)
+
+            self._fixed[idx] = (domain, value)
+            variables[idx].domain.clear()
+            variables[idx].domain.extend([value, value])
+
+        others = [
+            idx for idx in range(data.num_tasks) if idx not in fixed_tasks
+        ]
+        self._warmstart(solution, others)
+
+    def unfix(self):
+        """
+        Restores the domains of all variables that were fixed by :meth:`fix`,
+        and clears the hints.
+        """
+        variables = self._model.proto.variables
+
+        for idx, (domain, _) in self._fixed.items():
+            variables[idx].domain.clear()
+            variables[idx].domain.extend(domain)
+
+        self._fixed.clear()
+        self._model.clear_hints()
+
     def _get_solve_status(self, status: str):
         if status == "OPTIMAL":
             return SolveStatus.OPTIMAL
@@ -61,32 +337,33 @@ class CPModel:
 
         return SolveStatus.TIME_LIMIT
 
-    def _convert_to_solution(self, cp_solver: CpSolver) -> Solution:
+    def _convert_to_solution(self, values: np.ndarray) -> Solution:
         """
-        Converts a result from OR-Tools to a Solution object.
+        Converts the values of all variables of an OR-Tools solution, indexed
+        by proto index, to a Solution object.
         """
-        data, variables = self._data, self._variables
+        data = self._data
+        task_values = values[self._task_idcs].tolist()
+        mode_values = values[self._mode_idcs].tolist()
 
         tasks = []
-        for task_idx in range(data.num_tasks):
-            task_var = variables.task_vars[task_idx]
+        for task_idx, task_value in enumerate(task_values):
+            present, start, end, idle, breaks = task_value
 
-            if not cp_solver.value(task_var.present):
+            if not present:
                 task = ScheduledTask(0, [], 0, 0, 0, 0, False)
                 tasks.append(task)
                 continue
 
             for mode_idx in data.task2modes(task_idx):
-                mode_var = variables.mode_vars[mode_idx]
-
-                if cp_solver.value(mode_var):  # selected mode
+                if mode_values[mode_idx]:  # selected mode
                     task = ScheduledTask(
                         mode_idx,
                         data.modes[mode_idx].resources,
-                        cp_solver.value(task_var.start),
-                        cp_solver.value(task_var.end),
-                        cp_solver.value(task_var.idle),
-                        cp_solver.value(task_var.breaks),
+                        start,
+                        end,
+                        idle,
+                        breaks,
                         present=True,
                     )
                     tasks.append(task)
@@ -94,12 +371,44 @@ class CPModel:
 
         return Solution(data, tasks)
 
+    def _warmstart(
+        self, solution: Solution, tasks: Iterable[int] | None = None
+    ):
+        """
+        Hints the task and mode variables of the given tasks (default all),
+        based on the given solution. Used to warmstart loaded models.
+        """
+        model, data = self._model, self._data
+        model.clear_hints()
+
+        def hint(idx: int, value: int):
+            model.add_hint(model.get_int_var_from_proto_index(idx), value)
+
+        if tasks is None:
+            tasks = range(data.num_tasks)
+
+        for task_idx in tasks:
+            sol_task = solution.tasks[task_idx]
+            present, start, end, idle, breaks = self._task_idcs[task_idx]
+            hint(start, sol_task.start)
+            hint(end, sol_task.end)
+            hint(idle, sol_task.idle)
+            hint(breaks, sol_task.breaks)
+
+            if data.tasks[task_idx].optional:
+                hint(present, sol_task.present)
+
+            for mode_idx in data.task2modes(task_idx):
+                hint(self._mode_idcs[mode_idx], mode_idx == sol_task.mode)
+
     def solve(
         self,
         time_limit: float = float("inf"),
         display: bool = False,
         num_workers: int | None = None,
         initial_solution: Solution | None = None,
+        on_solution: Callable[[Result], bool | None] | None = None,
+        stop_event: threading.Event | None = None,
         **kwargs,
     ) -> Result:
         """
@@ -116,6 +425,14 @@ class CPModel:
             available CPU cores are used.
         initial_solution
             Initial solution to start the solver from. Default is no solution.
+        on_solution
+            Optional function that is called with a Result object for each
+            improving solution found during the search. If it returns
+            ``True``, the search is stopped. Default is no callback.
+        stop_event
+            Optional event that stops the search when it is set, for example
+            from another thread. The result then contains the best solution
+            found so far. Default is no event.
         kwargs
             Additional parameters passed to the solver.
 
@@ -125,8 +442,14 @@ class CPModel:
             A Result object containing the best found solution and additional
             information about the solver run.
         """
+        timings = dict(self._timings)
+
         if initial_solution is not None:
-            self._variables.warmstart(initial_solution)
+            with timed(timings, "warmstart"):
+                if self._variables is not None:
+                    self._variables.warmstart(initial_solution)
+                else:
+                    self._warmstart(initial_solution)
 
         params = {
             "max_time_in_seconds": time_limit,
@@ -140,11 +463,25 @@ class CPModel:
         for key, value in params.items():
             setattr(solver.parameters, key, value)
 
-        status_code = solver.solve(self._model)
+        with (
+            timed(timings, "solve"),
+            stop_when_set(stop_event, solver.stop_search),
+        ):
+            if on_solution is not None:
+                callback = _SolutionCallback(
+                    self._convert_to_solution, on_solution
+                )
+                status_code = solver.solve(self._model, callback)
+            else:
+                status_code = solver.solve(self._model)
+
         status = solver.status_name(status_code)
 
         if status in ["OPTIMAL", "FEASIBLE"]:
-            solution = self._convert_to_solution(solver)
+            with timed(timings, "convert"):
+                values = np.asarray(solver.response_proto.solution)
+                solution = self._convert_to_solution(values)
+
             objective_value = solver.objective_value
             lower_bound = solver.best_objective_bound
         else:
@@ -159,4 +496,59 @@ class CPModel:
             status=self._get_solve_status(status),
             runtime=solver.wall_time,
             best=solution,
+            stats=ModelStats(
+                timings,
+                num_variables=len(self._model.proto.variables),
+                num_constraints=len(self._model.proto.constraints),
+                num_arcs=self._num_arcs,
+                num_break_vars=self._num_break_vars,
+                solver="ortools",
+            ),
+        )
+
+
+class _SolutionCallback(CpSolverSolutionCallback):
+    """
+    Calls the given function with a Result object for each solution found by
+    the solver, and stops the search when the function returns ``True``.
+    """
+
+    def __init__(
+        self,
+        convert: Callable[[np.ndarray], Solution],
+        on_solution: Callable[[Result], bool | None],
+    ):
+        super().__init__()
+        self._convert = convert
+        self._on_solution = on_solution
+
+    def on_solution_callback(self):
+        values = np.asarray(self.response_proto.solution)
+        result = Result(
+            objective=self.objective_value,
+            lower_bound=self.best_objective_bound,
+            status=SolveStatus.FEASIBLE,
+            runtime=self.wall_time,
+            best=self._convert(values),
+            stats=ModelStats(solver="ortools"),
         )
+
+        if self._on_solution(result):
+            self.stop_search()
+
+
+def _task_indices(var: TaskVar) -> list[int]:
+    """
+    Returns the proto indices of the present, start, end, idle and breaks
+    variables of the given task variable.
+    """
+    exprs = [var.present, var.start, var.end, var.idle, var.breaks]
+    return [_index(expr) for expr in exprs]
+
+
+def _index(expr) -> int:
+    """
+    Returns the proto index of the given variable expression.
+    """
+    assert isinstance(expr, IntVar)
+    return expr.index
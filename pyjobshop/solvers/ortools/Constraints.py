@@ -1,12 +1,11 @@
 from collections import defaultdict
 from itertools import pairwise, product
 
-import numpy as np
 from ortools.sat.python.cp_model import BoolVarT, CpModel, LinearExpr
 
-import pyjobshop.solvers.utils as utils
 from pyjobshop.ProblemData import ProblemData
 from pyjobshop.solvers.ortools.Variables import Variables
+from pyjobshop.solvers.utils import timed
 
 
 class Constraints:
@@ -242,10 +241,14 @@ class Constraints:
                 seq_var = variables.sequence_vars[res_idx]
                 seq_var.activate(model)
 
-                arc = seq_var.arcs[task_idx1, task_idx2]
+                arc = seq_var.arcs.get((task_idx1, task_idx2))
                 both_present = [var1.present, var2.present]
 
-                model.add(arc == 1).only_enforce_if(both_present)
+                if arc is None:
+                    # The arc is pruned, so the tasks cannot both be present.
+                    model.add_bool_or([~var1.present, ~var2.present])
+                else:
+                    model.add(arc == 1).only_enforce_if(both_present)
 
     def _same_sequence_constraints(self):
         """
@@ -275,9 +278,15 @@ class Constraints:
             for (i, j), (u, v) in zip(pairs1, pairs2):
                 # This ensures that task i -> j on machine 1 if and only if
                 # u -> v on machine 2.
-                arc1 = seq_var1.arcs[i, j]
-                arc2 = seq_var2.arcs[u, v]
-                model.add(arc1 == arc2)
+                arc1 = seq_var1.arcs.get((i, j))
+                arc2 = seq_var2.arcs.get((u, v))
+
+                if arc1 is not None and arc2 is not None:
+                    model.add(arc1 == arc2)
+                elif arc1 is not None:  # u -> v is pruned
+                    model.add(arc1 == 0)
+                elif arc2 is not None:  # i -> j is pruned
+                    model.add(arc2 == 0)
 
     def _circuit_constraints(self):
         """
@@ -285,13 +294,13 @@ class Constraints:
         sequencing constraints.
         """
         model, data, variables = self._model, self._data, self._variables
-        setup_times = utils.setup_times_matrix(data)
+        setup_times = data.setup_times_index
 
         for res_idx in data.machine_idcs:
             machine = data.resources[res_idx]
             seq_var = variables.sequence_vars[res_idx]
 
-            if setup_times is not None and np.any(setup_times[res_idx]):
+            if setup_times.has_setup_times(res_idx):
                 seq_var.activate(model)
 
             if machine.no_idle:
@@ -311,6 +320,7 @@ class Constraints:
 
             for task_idx1 in res_tasks:
                 var1 = variables.assign_vars[task_idx1, res_idx]
+                successors = setup_times.successors(res_idx, task_idx1)
 
                 # Absent intervals require selecting loops (self-arcs).
                 loop = arcs[task_idx1, task_idx1]
@@ -326,16 +336,14 @@ class Constraints:
                     if task_idx1 == task_idx2:
                         continue
 
+                    if (arc := arcs.get((task_idx1, task_idx2))) is None:
+                        continue  # pruned arc
+
                     var2 = variables.assign_vars[task_idx2, res_idx]
-                    arc = arcs[task_idx1, task_idx2]
                     model.add(arc <= var1.present)
                     model.add(arc <= var2.present)
 
-                    setup = (
-                        setup_times[res_idx, task_idx1, task_idx2]
-                        if setup_times is not None
-                        else 0
-                    )
+                    setup = successors.get(task_idx2, 0)
 
                     if machine.no_idle:
                         expr = var1.end + setup == var2.start
@@ -391,20 +399,33 @@ class Constraints:
             presences = [variables.task_vars[idx].present for idx in idcs]
             model.add(sum(presences) == 1).only_enforce_if(condition)
 
-    def add_constraints(self):
+    def add_constraints(self, timings: dict[str, float] | None = None):
         """
         Adds all the constraints to the CP model.
+
+        Parameters
+        ----------
+        timings
+            Optional wall times in seconds, keyed by phase name. If given,
+            the wall time of adding each type of constraint is added to it.
         """
-        self._job_spans_tasks()
-        self._select_one_mode()
-        self._machines_no_overlap()
-        self._renewable_capacity()
-        self._consumable_capacity()
-        self._resource_breaks_constraints()
-        self._timing_constraints()
-        self._identical_and_different_resource_constraints()
-        self._consecutive_constraints()
-        self._same_sequence_constraints()
-        self._circuit_constraints()  # must be after sequencing constraints!
-        self._mode_dependencies()
-        self._task_selection_constraints()
+        timings = timings if timings is not None else {}
+        add_constraints = [
+            self._job_spans_tasks,
+            self._select_one_mode,
+            self._machines_no_overlap,
+            self._renewable_capacity,
+            self._consumable_capacity,
+            self._resource_breaks_constraints,
+            self._timing_constraints,
+            self._identical_and_different_resource_constraints,
+            self._consecutive_constraints,
+            self._same_sequence_constraints,
+            self._circuit_constraints,  # must be after sequencing constraints!
+            self._mode_dependencies,
+            self._task_selection_constraints,
+        ]
+
+        for add_constraint in add_constraints:
+            with timed(timings, add_constraint.__name__.lstrip("_")):
+                add_constraint()
@@ -1,6 +1,5 @@
 from ortools.sat.python.cp_model import CpModel, LinearExpr
 
-import pyjobshop.solvers.utils as utils
 from pyjobshop.ProblemData import ProblemData
 
 from .Variables import Variables
@@ -56,8 +55,7 @@ class Objective:
             expr += obj_weight * variables.max_tardiness_var
 
         if (obj_weight := objective.weight_total_setup_time) > 0:
-            data = self._data
-            setup_times = utils.setup_times_matrix(data)
+            setup_times = data.setup_times_index
             setup_time_vars = []
 
             for res_idx in data.machine_idcs:
@@ -65,16 +63,17 @@ class Objective:
                 if not seq_var.is_active:
                     continue
 
+                setups: dict[int, dict[int, int]] = {}
+
                 for (idx1, idx2), arc in seq_var.arcs.items():
                     if idx1 == seq_var.DUMMY or idx2 == seq_var.DUMMY:
                         continue
 
-                    setup = (
-                        setup_times[res_idx, idx1, idx2]
-                        if setup_times is not None
-                        else 0
-                    )
-                    setup_time_vars.append(arc * setup)
+                    if idx1 not in setups:
+                        setups[idx1] = setup_times.successors(res_idx, idx1)
+
+                    if (setup := setups[idx1].get(idx2, 0)) > 0:
+                        setup_time_vars.append(arc * setup)
 
             expr += obj_weight * LinearExpr.sum(setup_time_vars)
 
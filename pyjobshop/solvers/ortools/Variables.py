@@ -1,6 +1,8 @@
 from dataclasses import dataclass
-from typing import TypeAlias
+from functools import partial
+from typing import Callable, TypeAlias
 
+import numpy as np
 from ortools.sat.python.cp_model import (
     BoolVarT,
     CpModel,
@@ -14,6 +16,7 @@ from pyjobshop.constants import MAX_VALUE
 from pyjobshop.ProblemData import Break, ProblemData
 from pyjobshop.Solution import Solution
 from pyjobshop.solvers.ortools.utils import (
+    feasible_arcs,
     partition_task_start_by_break_overlap,
 )
 from pyjobshop.solvers.utils import merge
@@ -142,6 +145,10 @@ class SequenceVar:
     tasks
         The list of task indices that can be assigned to this resource. Tasks
         combined with a dummy node represent the graph of this variable.
+    feasible_arcs
+        Optional function that returns a Boolean matrix indicating which arcs
+        between the tasks may be selected. Infeasible arcs are not created.
+        If None (default), arcs between all pairs of tasks are created.
 
     Attributes
     ----------
@@ -162,12 +169,19 @@ class SequenceVar:
     ``activate()`` method. This avoids creating arcs when it's not used in the
     model, because creating them is very expensive (takes quadratic time).
 
+    Arcs that are pruned by ``feasible_arcs`` are not present in ``arcs``.
+    Arcs to and from the dummy node and loops are never pruned.
     """
 
     DUMMY = -1
 
-    def __init__(self, tasks: list[int]):
+    def __init__(
+        self,
+        tasks: list[int],
+        feasible_arcs: Callable[[], np.ndarray] | None = None,
+    ):
         self._tasks = tasks
+        self._feasible_arcs = feasible_arcs
         self._arcs: dict[tuple[TaskIdx, TaskIdx], BoolVarT] = {}
         self._is_active = False
 
@@ -195,10 +209,17 @@ class SequenceVar:
         self._is_active = True
 
         nodes = [*self._tasks, self.DUMMY]
+        mask = np.ones((len(nodes), len(nodes)), dtype=bool)
+        if self._feasible_arcs is not None:
+            mask[:-1, :-1] = self._feasible_arcs()
+            np.fill_diagonal(mask, True)
+
+        feasible = mask.tolist()
         self._arcs = {
             (i, j): model.new_bool_var(f"{i}->{j}")
-            for i in nodes
-            for j in nodes
+            for pos1, i in enumerate(nodes)
+            for pos2, j in enumerate(nodes)
+            if feasible[pos1][pos2]
         }
 
 
@@ -247,11 +268,31 @@ class BreakVar:
 class Variables:
     """
     Manages the core variables of the OR-Tools model.
+
+    Parameters
+    ----------
+    model
+        The OR-Tools CP model.
+    data
+        The problem data instance.
+    prune_arcs
+        Whether to leave out sequence arcs between tasks that can never
+        directly succeed each other. Default ``False``.
     """
 
-    def __init__(self, model: CpModel, data: ProblemData):
+    def __init__(
+        self, model: CpModel, data: ProblemData, prune_arcs: bool = False
+    ):
         self._model = model
         self._data = data
+        self._prune_arcs = prune_arcs
+
+        # Per-resource indices of the assignment and demand variables. These
+        # are filled when the corresponding variables are created.
+        self._res2assign: list[list[OptionalIntervalVar]] = [
+            [] for _ in data.resources
+        ]
+        self._res2demand: list[list[IntVar]] = [[] for _ in data.resources]
 
         self._job_vars = self._make_job_variables()
         self._task_vars = self._make_task_variables()
@@ -311,6 +352,28 @@ class Variables:
         """
         return self._sequence_vars
 
+    @property
+    def num_arcs(self) -> int:
+        """
+        Returns the total number of arcs of all active sequence variables.
+        """
+        return sum(
+            len(seq_var.arcs)
+            for seq_var in self._sequence_vars.values()
+            if seq_var.is_active
+        )
+
+    @property
+    def num_break_vars(self) -> int:
+        """
+        Returns the total number of break variables. Break variables are
+        created lazily, so this is zero if they have not been created.
+        """
+        if self._break_vars is None:
+            return 0
+
+        return sum(len(mode_vars) for mode_vars in self._break_vars)
+
     @property
     def break_vars(self) -> list[list[BreakVar]]:
         """
@@ -397,15 +460,13 @@ class Variables:
         """
         Returns all assignment variables for the given resource.
         """
-        items = self.assign_vars.items()
-        return [var for (_, res_idx), var in items if res_idx == idx]
+        return self._res2assign[idx]
 
     def res2demand(self, idx: int) -> list[IntVar]:
         """
         Returns all demand variables for the given resource.
         """
-        items = self.demand_vars.items()
-        return [var for (_, res_idx), var in items if res_idx == idx]
+        return self._res2demand[idx]
 
     def _make_job_variables(self) -> list[JobVar]:
         """
@@ -512,6 +573,7 @@ class Variables:
                 )
                 var = OptionalIntervalVar(interval, present)
                 variables[task_idx, res_idx] = var
+                self._res2assign[res_idx].append(var)
 
         return variables
 
@@ -527,6 +589,7 @@ class Variables:
                 name = f"{task_idx}_{res_idx}"
                 demand = model.new_int_var(0, MAX_VALUE, f"{name}_demand")
                 variables[task_idx, res_idx] = demand
+                self._res2demand[res_idx].append(demand)
 
         return variables
 
@@ -538,8 +601,14 @@ class Variables:
         variables: dict[ResourceIdx, SequenceVar] = {}
 
         for idx in data.machine_idcs:
-            tasks = {data.modes[m].task for m in data.resource2modes(idx)}
-            variables[idx] = SequenceVar(sorted(tasks))
+            modes = data.resource2modes(idx)
+            tasks = sorted({data.modes[m].task for m in modes})
+            func = None
+
+            if self._prune_arcs:  # arcs are only pruned when activated
+                func = partial(feasible_arcs, data, idx, tasks)
+
+            variables[idx] = SequenceVar(tasks, func)
 
         return variables
 
@@ -550,19 +619,33 @@ class Variables:
         model, data = self._model, self._data
         variables: list[list[BreakVar]] = []
 
+        # Many modes share the same resources and durations, so we cache the
+        # merged breaks per resource set, and the start time partitions per
+        # merged breaks and duration. Identical partitions are computed once.
+        res2breaks: dict[tuple[int, ...], tuple[Break, ...]] = {}
+        partitions: dict[tuple[tuple[Break, ...], int], dict[int, Domain]] = {}
+
         for mode in data.modes:
             # A mode's breaks are the union of all its required resources'
             # breaks, merged to handle overlapping intervals. This means
             # a task is interrupted whenever any of its resources is on
             # break.
-            all_breaks: list[Break] = []
-            for res_idx in mode.resources:
-                all_breaks.extend(data.resources[res_idx].breaks)
+            resources = tuple(mode.resources)
+            if resources not in res2breaks:
+                all_breaks: list[Break] = []
+                for res_idx in resources:
+                    all_breaks.extend(data.resources[res_idx].breaks)
+
+                res2breaks[resources] = tuple(merge(all_breaks))
+
+            breaks = res2breaks[resources]
+            key = (breaks, mode.duration)
+            if key not in partitions:
+                partitions[key] = partition_task_start_by_break_overlap(
+                    list(breaks), mode.duration
+                )
 
-            breaks = merge(all_breaks)
-            partition = partition_task_start_by_break_overlap(
-                breaks, mode.duration
-            )
+            partition = partitions[key]
 
             break_vars = []
             for duration, start_domain in partition.items():
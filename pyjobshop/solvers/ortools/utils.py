@@ -1,9 +1,25 @@
+from bisect import bisect_right
 from collections import defaultdict
-from itertools import pairwise
+from itertools import accumulate, pairwise
 
+import numpy as np
 from ortools.sat.python.cp_model import Domain
 
 from pyjobshop.constants import MAX_VALUE
+from pyjobshop.ProblemData import ProblemData
+
+# Timing constraints as (constraint field, point of task 1, point of task 2,
+# whether the constraint is an equality).
+_TIMING_CONSTRAINTS = [
+    ("start_before_start", "start", "start", False),
+    ("start_before_end", "start", "end", False),
+    ("end_before_start", "end", "start", False),
+    ("end_before_end", "end", "end", False),
+    ("start_at_start", "start", "start", True),
+    ("start_at_end", "start", "end", True),
+    ("end_at_start", "end", "start", True),
+    ("end_at_end", "end", "end", True),
+]
 
 
 def partition_task_start_by_break_overlap(
@@ -35,6 +51,10 @@ def partition_task_start_by_break_overlap(
        critical interval have zero overlap. Finally, exclude start times
        that fall inside breaks themselves.
 
+    The first two steps run in :math:`O(B \\log B)` time for :math:`B`
+    breaks, using binary search for the critical intervals and a sweep over
+    the sorted breakpoints for the partitioning.
+
     Example
     -------
     Consider breaks ``[(5, 8), (12, 14)]`` and ``task_duration = 10``.
@@ -57,47 +77,55 @@ def partition_task_start_by_break_overlap(
         Mapping from break_overlap_duration -> valid_start_time_domain.
         Each domain contains all start times that result in the given overlap.
     """
-    # For each break, compute the critical interval: the range of start
-    # times for which the task would overlap with that break. We process
-    # breaks in reverse order to account for earlier breaks that extend
-    # the task's span (a task that overlaps an earlier break takes longer,
-    # making it more likely to also overlap later breaks).
-    reversed_breaks = list(reversed(breaks))
+    # For each break k, compute the critical interval: the range of start
+    # times for which the task would overlap with that break. A task that
+    # starts at s_k - duration + 1 just overlaps break k. If that point lies
+    # before the end of the previous break, the task also overlaps that
+    # break, which extends its span, so the point moves back by the previous
+    # break's duration. This repeats for earlier breaks until the point no
+    # longer lies before the end of a previous break.
+    #
+    # Let C_k be the total duration of breaks before break k. The point moves
+    # back past break j < k if s_k - duration + 1 - C_k < s_j - C_j. Because
+    # s_j - C_j is non-decreasing in j, the breaks passed form a suffix of
+    # the earlier breaks, which we find using binary search.
+    cumulative = [0, *accumulate(end - start for start, end in breaks)]
+    thresholds = [start - cumulative[j] for j, (start, _) in enumerate(breaks)]
     critical_intervals = []
 
-    for idx, (start, _) in enumerate(reversed_breaks):
-        point = max(0, start - task_duration + 1)
-        for prev_start, prev_end in reversed_breaks[idx + 1 :]:
-            if point < prev_end:
-                # This previous break overlaps with the current critical point
-                # so we need to move the critical point back by the duration.
-                prev_duration = prev_end - prev_start
-                point = max(0, point - prev_duration)
-            else:
-                break
-
-        # If a task starts in this interval, it will overlap with this break.
-        critical_intervals.append((point, start))
+    for k, (start, _) in enumerate(breaks):
+        point = start - task_duration + 1 - cumulative[k]
+        first = bisect_right(thresholds, point, 0, k)
+        critical_intervals.append((max(0, point + cumulative[first]), start))
 
     # Partition the start times. The boundaries of all critical intervals
     # form a sorted set of breakpoints that divide the timeline into
-    # sub-intervals. For each sub-interval, we check which breaks' critical
-    # intervals fully contain it, and sum their durations to get the total
-    # overlap.
+    # sub-intervals. We sweep over the breakpoints, and track the breaks
+    # whose critical intervals contain the current sub-interval, and the sum
+    # of their durations, which is the total overlap.
+    count_delta: dict[int, int] = defaultdict(int)
+    duration_delta: dict[int, int] = defaultdict(int)
+
+    for (start, end), (crit_start, crit_end) in zip(
+        breaks, critical_intervals
+    ):
+        if crit_start < crit_end:  # empty if the task duration is zero
+            count_delta[crit_start] += 1
+            count_delta[crit_end] -= 1
+            duration_delta[crit_start] += end - start
+            duration_delta[crit_end] -= end - start
+
     partition = defaultdict(list)
     breakpoints = sorted(
         set(point for points in critical_intervals for point in points)
     )
+    num_overlapping = total_duration = 0
 
     for interval in pairwise(breakpoints):
-        overlapping = []
+        num_overlapping += count_delta.get(interval[0], 0)
+        total_duration += duration_delta.get(interval[0], 0)
 
-        for brk, crit in zip(reversed_breaks, critical_intervals):
-            if crit[0] <= interval[0] and interval[1] <= crit[1]:
-                overlapping.append(brk)
-
-        if overlapping:
-            total_duration = sum(end - start for (start, end) in overlapping)
+        if num_overlapping > 0:
             partition[total_duration].append(interval)
 
     # Now convert each partition to a Domain object, which is equivalent to
@@ -108,9 +136,9 @@ def partition_task_start_by_break_overlap(
     }
 
     # Include the zero-overlap domain as the complement of all others.
-    domain = Domain.from_intervals([])
-    for other in domains.values():
-        domain = Domain.union_with(domain, other)
+    domain = Domain.from_intervals(
+        [[s, e - 1] for intervals in partition.values() for s, e in intervals]
+    )
     domain = domain.complement()
     domains[0] = domain.intersection_with(Domain(0, MAX_VALUE))
 
@@ -120,3 +148,89 @@ def partition_task_start_by_break_overlap(
         dur: domain.intersection_with(breaks_domain.complement())  # \setminus
         for dur, domain in domains.items()
     }
+
+
+def feasible_arcs(
+    data: ProblemData, machine: int, tasks: list[int]
+) -> np.ndarray:
+    """
+    Determines which tasks can directly succeed each other on the given
+    machine. An arc from task ``i`` to task ``j`` is infeasible if scheduling
+    ``j`` directly after ``i`` on this machine always violates a constraint:
+
+    1. The setup time between ``i`` and ``j`` is at least ``MAX_VALUE``.
+    2. The time windows of ``i`` and ``j`` do not allow ``j`` to start after
+       ``i`` ends plus the setup time.
+    3. A timing constraint between ``i`` and ``j`` requires the order of the
+       tasks to be reversed, or requires a smaller distance between the tasks
+       than the processing and setup times allow.
+
+    These checks only use lower bounds on the processing times and setup
+    times, so pruned arcs can never be selected in a feasible solution.
+
+    Parameters
+    ----------
+    data
+        The problem data instance.
+    machine
+        The machine index.
+    tasks
+        List of unique task indices that can be assigned to the machine.
+
+    Returns
+    -------
+    np.ndarray
+        Boolean matrix of shape ``(len(tasks), len(tasks))``, where entry
+        ``(i, j)`` is ``False`` if ``tasks[j]`` can never directly succeed
+        ``tasks[i]``. The diagonal is always ``True``.
+    """
+    num_tasks = len(tasks)
+    task2pos = {task: pos for pos, task in enumerate(tasks)}
+
+    # Minimum processing time of each task when processed on this machine.
+    proc = np.full(num_tasks, MAX_VALUE, dtype=np.int64)
+    for mode_idx in data.resource2modes(machine):
+        mode = data.modes[mode_idx]
+        pos = task2pos[mode.task]
+        proc[pos] = min(proc[pos], mode.duration)
+
+    setups = data.setup_times_index.matrix(machine, tasks)
+    infeasible = setups >= MAX_VALUE
+
+    # Task j must start after task i ends plus the setup time.
+    task_data = [data.tasks[idx] for idx in tasks]
+    earliest_start = np.array([t.earliest_start for t in task_data], np.int64)
+    latest_start = np.array([t.latest_start for t in task_data], np.int64)
+    earliest_end = np.array([t.earliest_end for t in task_data], np.int64)
+    latest_end = np.array([t.latest_end for t in task_data], np.int64)
+
+    earliest_end = np.maximum(earliest_end, earliest_start + proc)
+    latest_start = np.minimum(latest_start, latest_end - proc)
+    infeasible |= earliest_end[:, None] + setups > latest_start[None, :]
+
+    # Minimum distance between a point of task i and a point of task j, if
+    # task j directly succeeds task i.
+    def gap(first: int, point1: str, second: int, point2: str) -> int:
+        dist = setups[first, second]
+        dist += proc[first] if point1 == "start" else 0
+        dist += proc[second] if point2 == "end" else 0
+        return dist
+
+    for name, point1, point2, is_equality in _TIMING_CONSTRAINTS:
+        for task1, task2, delay in getattr(data.constraints, name):
+            pos1, pos2 = task2pos.get(task1), task2pos.get(task2)
+            if pos1 is None or pos2 is None or pos1 == pos2:
+                continue
+
+            # The constraint point1(task1) + delay <= point2(task2) cannot be
+            # satisfied if task1 directly succeeds task2 and the distance from
+            # point2(task2) to point1(task1) is larger than -delay.
+            if delay + gap(pos2, point2, pos1, point1) > 0:
+                infeasible[pos2, pos1] = True
+
+            # Equalities also imply point2(task2) - delay <= point1(task1).
+            if is_equality and gap(pos1, point1, pos2, point2) - delay > 0:
+                infeasible[pos1, pos2] = True
+
+    np.fill_diagonal(infeasible, False)
+    return ~infeasible
@@ -1,6 +1,9 @@
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from itertools import product
-
-import numpy as np
+from multiprocessing.synchronize import Event as ProcessEvent
+from time import perf_counter
 
 from pyjobshop.ProblemData import ProblemData
 
@@ -116,24 +119,6 @@ def intersecting_modes(
     return result
 
 
-def setup_times_matrix(data: ProblemData) -> np.ndarray | None:
-    """
-    Transforms the setup times constraints to a setup times matrix if there
-    are setup times, otherwise return None.
-    """
-    if not data.constraints.setup_times:
-        return None
-
-    num_res = len(data.resources)
-    num_tasks = len(data.tasks)
-    setup = np.zeros((num_res, num_tasks, num_tasks), dtype=int)
-
-    for res, task1, task2, duration in data.constraints.setup_times:
-        setup[res, task1, task2] = duration
-
-    return setup
-
-
 def merge(intervals: list[tuple[int, int]]) -> list[tuple[int, int]]:
     """
     Merges overlapping or touching intervals.
@@ -160,3 +145,68 @@ def merge(intervals: list[tuple[int, int]]) -> list[tuple[int, int]]:
             merged[-1] = (merged[-1][0], new_end)
 
     return merged
+
+
+@contextmanager
+def timed(timings: dict[str, float], name: str) -> Iterator[None]:
+    """
+    Context manager that adds the wall time of its body to the given timings,
+    under the given phase name.
+
+    Parameters
+    ----------
+    timings
+        Wall times in seconds, keyed by phase name.
+    name
+        Name of the timed phase.
+    """
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = perf_counter() - start
+        timings[name] = timings.get(name, 0) + elapsed
+
+
+@contextmanager
+def stop_when_set(
+    event: threading.Event | ProcessEvent | None,
+    stop: Callable[[], None],
+    interval: float = 0.05,
+) -> Iterator[None]:
+    """
+    Context manager that calls ``stop`` once the given event is set, while
+    the context is active. The event is polled from a background thread, and
+    ``stop`` is called again at every poll afterwards, so that a search that
+    starts after the event was set is stopped as well.
+
+    Parameters
+    ----------
+    event
+        The event to watch, which may be shared between processes. If
+        ``None``, this context manager does nothing.
+    stop
+        Function that stops the search, for example
+        ``CpSolver.stop_search``.
+    interval
+        Polling interval in seconds. Default 0.05.
+    """
+    if event is None:
+        yield
+        return
+
+    done = threading.Event()
+
+    def watch():
+        while not done.wait(interval):
+            if event.is_set():
+                stop()
+
+    watcher = threading.Thread(target=watch, daemon=True)
+    watcher.start()
+
+    try:
+        yield
+    finally:
+        done.set()
+        watcher.join()
@@ -90,3 +90,22 @@ def test_no_warning_for_machine_without_modes(require_cpoptimizer, capfd):
     captured = capfd.readouterr()
     output = captured.out + captured.err
     assert_("Unused sequence variable" not in output)
+
+
+def test_model_stats(require_cpoptimizer, complete_data, complete_sol):
+    """
+    Tests that the result contains the timings of all phases and the model
+    size statistics.
+    """
+    from pyjobshop.solvers.cpoptimizer.CPModel import CPModel
+
+    result = CPModel(complete_data).solve(initial_solution=complete_sol)
+    stats = result.stats
+
+    for phase in ["variables", "timing_constraints", "objective", "solve"]:
+        assert_(phase in stats.timings)
+
+    assert_("warmstart" in stats.timings)
+    assert_(stats.num_variables > 0)
+    assert_(stats.num_constraints > 0)
+    assert_equal(stats.solver, "cpoptimizer")
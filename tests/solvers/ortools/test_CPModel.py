@@ -1,6 +1,7 @@
-from numpy.testing import assert_, assert_equal
+from numpy.testing import assert_, assert_equal, assert_raises
 from ortools.sat.python.cp_model import CpModel
 
+from pyjobshop.constants import MAX_VALUE
 from pyjobshop.Model import Model
 from pyjobshop.Solution import ScheduledTask, Solution
 from pyjobshop.solvers.ortools.CPModel import CPModel
@@ -108,3 +109,239 @@ def test_variables_property(small):
     assert_equal(len(variables.assign_vars), 2)
     assert_equal(len(variables.demand_vars), 2)
     assert_equal(len(variables.sequence_vars), 1)
+
+
+def test_variables_per_resource_index():
+    """
+    Tests that the assignment and demand variables are correctly indexed per
+    resource.
+    """
+    model = Model()
+    machine, renewable = model.add_machine(), model.add_renewable(1)
+    tasks = [model.add_task() for _ in range(3)]
+    model.add_mode(tasks[0], machine, 1)
+    model.add_mode(tasks[1], [machine, renewable], 1, [0, 1])
+    model.add_mode(tasks[2], renewable, 1, 1)
+
+    variables = CPModel(model.data()).variables
+    assign_vars, demand_vars = variables.assign_vars, variables.demand_vars
+
+    # Resource 0 (machine) is used by tasks 0 and 1, and resource 1
+    # (renewable) is used by tasks 1 and 2.
+    for res_idx, task_idcs in [(0, [0, 1]), (1, [1, 2])]:
+        res_assign = variables.res2assign(res_idx)
+        res_demand = variables.res2demand(res_idx)
+        assert_equal(len(res_assign), len(task_idcs))
+        assert_equal(len(res_demand), len(task_idcs))
+
+        for idx, task_idx in enumerate(task_idcs):
+            assert_(res_assign[idx] is assign_vars[task_idx, res_idx])
+            assert_(res_demand[idx] is demand_vars[task_idx, res_idx])
+
+
+def test_prune_arcs():
+    """
+    Tests that pruning arcs removes arcs that can never be selected, while
+    the optimal solution remains the same.
+    """
+    model = Model()
+    machine = model.add_machine()
+    tasks = [model.add_task() for _ in range(3)]
+
+    for task in tasks:
+        model.add_mode(task, machine, duration=2)
+
+    model.add_end_before_start(tasks[0], tasks[1])
+    model.add_end_before_start(tasks[1], tasks[2])
+    model.add_setup_time(machine, tasks[2], tasks[0], MAX_VALUE)
+
+    data = model.data()
+    cp_model = CPModel(data)
+    pruned = CPModel(data, prune_arcs=True)
+
+    # Without pruning, there are 16 arcs between the three tasks and the
+    # dummy node. The arcs 1 -> 0 and 2 -> 1 contradict the precedence
+    # constraints, and the setup time of arc 2 -> 0 is forbidden.
+    assert_equal(cp_model.variables.num_arcs, 16)
+    assert_equal(pruned.variables.num_arcs, 13)
+
+    arcs = pruned.variables.sequence_vars[0].arcs
+    assert_((1, 0) not in arcs)
+    assert_((2, 0) not in arcs)
+    assert_((2, 1) not in arcs)
+
+    result1 = cp_model.solve(display=False)
+    result2 = pruned.solve(display=False)
+    assert_equal(result1.objective, result2.objective)
+    assert_equal(result2.objective, 6)
+
+
+def test_break_variables_share_partitions():
+    """
+    Tests that modes with the same breaks and duration reuse the same start
+    time partition.
+    """
+    model = Model()
+    machine1 = model.add_machine(breaks=[(2, 4), (6, 8)])
+    machine2 = model.add_machine(breaks=[(2, 4), (6, 8)])
+    tasks = [model.add_task(allow_breaks=True) for _ in range(3)]
+
+    model.add_mode(tasks[0], machine1, duration=3)
+    model.add_mode(tasks[1], machine2, duration=3)  # same breaks and duration
+    model.add_mode(tasks[2], machine1, duration=1)  # different duration
+
+    break_vars = CPModel(model.data()).variables.break_vars
+    domains = [[var.start_domain for var in vars] for vars in break_vars]
+    assert_equal(len(domains[0]), len(domains[1]))
+    assert_(all(d1 is d2 for d1, d2 in zip(domains[0], domains[1])))
+    assert_(all(d1 is not d2 for d1, d2 in zip(domains[0], domains[2])))
+
+
+def test_save_and_load(complete_data, complete_sol, tmp_path):
+    """
+    Tests that a saved model can be loaded and solved without building it,
+    and that the loaded model finds the same result.
+    """
+    cp_model = CPModel(complete_data)
+    cp_model.save(tmp_path)
+    loaded = CPModel.load(complete_data, tmp_path)
+
+    result = cp_model.solve(display=False)
+    loaded_result = loaded.solve(display=False, num_workers=1)
+    assert_equal(loaded_result.objective, result.objective)
+    assert_equal(loaded_result.best.tasks, result.best.tasks)
+
+    # Warmstarting a loaded model only hints the task and mode variables.
+    warmstarted = loaded.solve(display=False, initial_solution=complete_sol)
+    assert_equal(warmstarted.objective, result.objective)
+
+    with assert_raises(ValueError):
+        loaded.variables
+
+
+def test_load_raises_different_instance(small, complete_data, tmp_path):
+    """
+    Tests that loading a model for a different instance raises.
+    """
+    CPModel(small).save(tmp_path)
+
+    with assert_raises(ValueError):
+        CPModel.load(complete_data, tmp_path)
+
+
+def test_cached(small, tmp_path):
+    """
+    Tests that cached models are built once and then loaded from the cache
+    directory, separately for each ``prune_arcs`` setting.
+    """
+    built = CPModel.cached(small, tmp_path)
+    assert_equal(len(list(tmp_path.iterdir())), 1)
+
+    loaded = CPModel.cached(small, tmp_path)
+    with assert_raises(ValueError):  # loaded models do not have variables
+        loaded.variables
+
+    result = loaded.solve(display=False)
+    assert_equal(result.objective, built.solve(display=False).objective)
+
+    CPModel.cached(small, tmp_path, prune_arcs=True)
+    assert_equal(len(list(tmp_path.iterdir())), 2)
+
+
+def test_model_stats(complete_data, complete_sol, tmp_path):
+    """
+    Tests that the result contains the timings of all phases and the model
+    size statistics.
+    """
+    cp_model = CPModel(complete_data)
+    result = cp_model.solve(display=False)
+    stats = result.stats
+
+    phases = ["variables", "timing_constraints", "circuit_constraints"]
+    phases += ["objective", "solve", "convert"]
+    for phase in phases:
+        assert_(phase in stats.timings)
+
+    assert_("warmstart" not in stats.timings)
+    assert_(stats.build_time < sum(stats.timings.values()))
+
+    proto = cp_model.model.proto
+    assert_equal(stats.num_variables, len(proto.variables))
+    assert_equal(stats.num_constraints, len(proto.constraints))
+    assert_equal(stats.num_arcs, cp_model.variables.num_arcs)
+    assert_equal(stats.num_break_vars, cp_model.variables.num_break_vars)
+    assert_(stats.num_arcs > 0)
+    assert_(stats.num_break_vars > 0)
+    assert_equal(stats.solver, "ortools")
+
+    # Loaded models report the load time instead of the build phases, but
+    # the same model size statistics.
+    cp_model.save(tmp_path)
+    loaded = CPModel.load(complete_data, tmp_path)
+    loaded_stats = loaded.solve(initial_solution=complete_sol).stats
+    assert_("load" in loaded_stats.timings)
+    assert_("warmstart" in loaded_stats.timings)
+    assert_("variables" not in loaded_stats.timings)
+    assert_equal(loaded_stats.num_arcs, stats.num_arcs)
+    assert_equal(loaded_stats.num_break_vars, stats.num_break_vars)
+
+
+def test_fix(complete_data, complete_sol):
+    """
+    Tests that fixing all tasks to a solution yields that solution, and that
+    unfixing restores the original variable domains.
+    """
+    cp_model = CPModel(complete_data)
+    proto = cp_model.model.proto
+    domains = [list(var.domain) for var in proto.variables]
+
+    cp_model.fix(complete_sol, range(complete_data.num_tasks))
+    result = cp_model.solve(display=False)
+    assert_equal(result.status.value, "Optimal")
+    assert_equal(result.objective, complete_sol.objective)
+
+    for task, sol_task in zip(result.best.tasks, complete_sol.tasks):
+        assert_equal(task.present, sol_task.present)
+        if task.present:
+            assert_equal(task, sol_task)
+
+    cp_model.unfix()
+    assert_equal([list(var.domain) for var in proto.variables], domains)
+
+
+def test_fix_subset(small):
+    """
+    Tests that fixing a subset of the tasks only optimizes the other tasks.
+    """
+    cp_model = CPModel(small)
+    bad = Solution(
+        small, [ScheduledTask(0, [0], 1, 2), ScheduledTask(0, [0], 5, 7)]
+    )
+
+    # Only the second task can move. It does not fit before the first task,
+    # so it is scheduled directly after it.
+    cp_model.fix(bad, [0])
+    result = cp_model.solve(display=False)
+    assert_equal(result.best.tasks[0], bad.tasks[0])
+    assert_equal(result.best.tasks[1].start, 2)
+    assert_equal(result.objective, 4)
+    cp_model.unfix()
+
+    # Unfixed, the tasks are scheduled from time 0 again.
+    result = cp_model.solve(display=False)
+    assert_equal(result.objective, 3)
+
+
+def test_save_does_not_store_fixed_domains(small, tmp_path):
+    """
+    Tests that saving a model with fixed tasks stores the original domains.
+    """
+    cp_model = CPModel(small)
+    bad = Solution(
+        small, [ScheduledTask(0, [0], 2, 3), ScheduledTask(0, [0], 5, 7)]
+    )
+    cp_model.fix(bad, [0, 1])
+    cp_model.save(tmp_path)
+
+    loaded = CPModel.load(small, tmp_path)
+    assert_equal(loaded.solve(display=False).objective, 3)
@@ -1,8 +1,15 @@
+from collections import defaultdict
+from itertools import pairwise
+
+import numpy as np
 import pytest
 from numpy.testing import assert_, assert_equal
+from ortools.sat.python.cp_model import Domain
 
 from pyjobshop.constants import MAX_VALUE
+from pyjobshop.Model import Model
 from pyjobshop.solvers.ortools.utils import (
+    feasible_arcs,
     partition_task_start_by_break_overlap,
 )
 
@@ -126,3 +133,120 @@ def test_partition_no_start_during_breaks(breaks, task_duration):
             for t in range(start, end):
                 # Should not be able to start during any break
                 assert_(not domain.contains(t))
+
+
+def _partition_reference(breaks, task_duration):
+    """
+    Straightforward quadratic implementation of
+    ``partition_task_start_by_break_overlap``, used to verify that the
+    efficient implementation computes the same partition.
+    """
+    reversed_breaks = list(reversed(breaks))
+    critical_intervals = []
+
+    for idx, (start, _) in enumerate(reversed_breaks):
+        point = max(0, start - task_duration + 1)
+        for prev_start, prev_end in reversed_breaks[idx + 1 :]:
+            if point < prev_end:
+                point = max(0, point - (prev_end - prev_start))
+            else:
+                break
+
+        critical_intervals.append((point, start))
+
+    partition = defaultdict(list)
+    breakpoints = sorted(
+        set(point for points in critical_intervals for point in points)
+    )
+
+    for interval in pairwise(breakpoints):
+        overlapping = []
+
+        for brk, crit in zip(reversed_breaks, critical_intervals):
+            if crit[0] <= interval[0] and interval[1] <= crit[1]:
+                overlapping.append(brk)
+
+        if overlapping:
+            total_duration = sum(end - start for (start, end) in overlapping)
+            partition[total_duration].append(interval)
+
+    domains = {
+        dur: Domain.from_intervals([[s, e - 1] for s, e in intervals])
+        for dur, intervals in partition.items()
+    }
+
+    domain = Domain.from_intervals([])
+    for other in domains.values():
+        domain = Domain.union_with(domain, other)
+    domain = domain.complement()
+    domains[0] = domain.intersection_with(Domain(0, MAX_VALUE))
+
+    breaks_domain = Domain.from_intervals([[s, e - 1] for s, e in breaks])
+    return {
+        dur: domain.intersection_with(breaks_domain.complement())
+        for dur, domain in domains.items()
+    }
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_partition_matches_reference(seed: int):
+    """
+    Tests that the partition is the same as the one computed by the reference
+    implementation, for random breaks and task durations.
+    """
+    rng = np.random.default_rng(seed)
+    num_breaks = int(rng.integers(0, 40))
+    max_gap, max_duration = rng.integers(2, 20, size=2)
+
+    # Random sorted, non-overlapping breaks, which may touch each other.
+    gaps = rng.integers(0, max_gap, size=num_breaks)
+    durations = rng.integers(1, max_duration, size=num_breaks)
+    starts = np.cumsum(gaps) + np.cumsum(np.r_[0, durations[:-1]])
+    breaks = [
+        (int(start), int(start + dur)) for start, dur in zip(starts, durations)
+    ]
+
+    for task_duration in [0, 1, *rng.integers(1, 100, size=5).tolist()]:
+        actual = partition_task_start_by_break_overlap(breaks, task_duration)
+        expected = _partition_reference(breaks, task_duration)
+
+        assert_equal(list(actual), list(expected))
+        for dur, domain in expected.items():
+            assert_equal(
+                actual[dur].flattened_intervals(),
+                domain.flattened_intervals(),
+            )
+
+
+def test_feasible_arcs():
+    """
+    Tests that arcs are pruned because of forbidden setup times, time windows
+    and timing constraints.
+    """
+    model = Model()
+    machine = model.add_machine()
+    tasks = [model.add_task() for _ in range(3)]
+    tasks.append(model.add_task(latest_start=4))
+
+    for task in tasks:
+        model.add_mode(task, machine, duration=5)
+
+    model.add_setup_time(machine, tasks[0], tasks[1], MAX_VALUE)
+    model.add_end_before_start(tasks[1], tasks[2])
+    model.add_start_at_start(tasks[0], tasks[2], 3)
+
+    data = model.data()
+    feasible = feasible_arcs(data, 0, [0, 1, 2, 3])
+
+    # Task 3 must start before time 4, so it cannot succeed any other task.
+    # Task 2 starts after task 1 ends, so task 2 cannot precede task 1. Task 2
+    # also starts 3 time units after task 0, which is less than the processing
+    # time, so task 0 and task 2 cannot directly succeed each other. Finally,
+    # task 0 cannot precede task 1 because of the forbidden setup time.
+    expected = [
+        [True, False, False, False],
+        [True, True, True, False],
+        [False, False, True, False],
+        [True, True, True, True],
+    ]
+    assert_equal(feasible, expected)
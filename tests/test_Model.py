@@ -1,4 +1,5 @@
-from numpy.testing import assert_equal
+import numpy as np
+from numpy.testing import assert_, assert_equal, assert_raises
 
 from pyjobshop.Model import Model
 from pyjobshop.ProblemData import (
@@ -8,9 +9,11 @@ from pyjobshop.ProblemData import (
     EndBeforeEnd,
     EndBeforeStart,
     IdenticalResources,
+    Machine,
     Mode,
     ModeDependency,
     Objective,
+    ProblemData,
     SameSequence,
     SelectAllOrNone,
     SelectAtLeastOne,
@@ -18,6 +21,7 @@ from pyjobshop.ProblemData import (
     SetupTime,
     StartBeforeEnd,
     StartBeforeStart,
+    Task,
 )
 from pyjobshop.Solution import ScheduledTask, Solution
 
@@ -102,6 +106,100 @@ def test_from_data(complete_data):
     assert_equal(m_data.objective, data.objective)
 
 
+def test_from_data_aliased_objects():
+    """
+    Tests that a model created from a data instance that holds the same task
+    or resource object at multiple indices distinguishes these indices.
+    """
+    task, machine = Task(), Machine()
+    data = ProblemData(
+        [],
+        [machine, machine],
+        [task, task],
+        [Mode(0, [0], 1), Mode(1, [1], 1)],
+    )
+    model = Model.from_data(data)
+    tasks, resources = model.tasks, model.resources
+
+    mode = model.add_mode(tasks[0], resources[1], duration=2)
+    assert_equal((mode.task, mode.resources), (0, [1]))
+
+    constraint = model.add_end_before_start(tasks[0], tasks[1])
+    assert_equal((constraint.task1, constraint.task2), (0, 1))
+
+    # Modifying the model's objects does not modify the data instance.
+    fingerprint = data.fingerprint()
+    tasks[0].earliest_start = 5
+    assert_equal(data.tasks[0].earliest_start, 0)
+    assert_equal(data.fingerprint(), fingerprint)
+
+
+def test_from_data_does_not_modify_data(complete_data):
+    """
+    Tests that modifying a model created from a data instance does not
+    modify that data instance.
+    """
+    data = complete_data
+    num_constraints = len(data.constraints)
+    job_tasks = [list(job.tasks) for job in data.jobs]
+
+    model = Model.from_data(data)
+    assert_equal(model.data(), data)
+
+    machine = model.add_machine()
+    task = model.add_task(job=model.jobs[0])
+    model.add_mode(task, machine, duration=1)
+    model.add_end_before_start(model.tasks[0], task)
+    model.add_setup_time(machine, model.tasks[0], task, 1)
+
+    assert_equal(model.data().num_tasks, data.num_tasks + 1)
+    assert_equal(len(data.constraints), num_constraints)
+    assert_equal([job.tasks for job in data.jobs], job_tasks)
+
+
+def test_data_is_cached_until_model_is_modified():
+    """
+    Tests that ``Model.data()`` returns the same instance until the model is
+    modified.
+    """
+    model = Model()
+    machine = model.add_machine()
+    task = model.add_task()
+    model.add_mode(task, machine, duration=1)
+
+    data = model.data()
+    assert_(model.data() is data)
+
+    model.add_mode(task, machine, duration=2)
+    new = model.data()
+    assert_(new is not data)
+    assert_equal(new.num_modes, 2)
+    assert_(model.data() is new)
+
+    model.set_objective(weight_total_flow_time=1)
+    assert_(model.data() is not new)
+    assert_equal(model.data().objective.weight_total_flow_time, 1)
+
+
+def test_data_does_not_change_when_adding_tasks():
+    """
+    Tests that adding tasks to a job of the model does not change the jobs
+    of a data instance that was created before.
+    """
+    model = Model()
+    job = model.add_job()
+    machine = model.add_machine()
+    model.add_mode(model.add_task(job=job), machine, duration=1)
+
+    data = model.data()
+    fingerprint = data.fingerprint()
+    model.add_mode(model.add_task(job=job), machine, duration=1)
+
+    assert_equal(data.jobs[0].tasks, [0])
+    assert_equal(data.fingerprint(), fingerprint)
+    assert_equal(model.data().jobs[0].tasks, [0, 1])
+
+
 def test_model_to_data_default_values():
     """
     Tests ``Model.data()`` uses the correct default values.
@@ -264,6 +362,124 @@ def test_add_mode_single_resource():
     assert_equal(mode.name, "")
 
 
+def test_bulk_adders_match_single_adders():
+    """
+    Tests that the bulk adders, given either lists of objects or arrays of
+    indices, result in the same data as the single adders.
+    """
+    single = Model()
+    jobs = [single.add_job(weight=idx, due_date=5) for idx in range(2)]
+    machines = [single.add_machine() for _ in range(2)]
+    renewable = single.add_renewable(3)
+    consumable = single.add_consumable(4)
+    tasks = [single.add_task(jobs[idx % 2], latest_end=9) for idx in range(4)]
+
+    for idx, task in enumerate(tasks):
+        single.add_mode(task, machines[idx % 2], idx + 1)
+        single.add_mode(task, [renewable, consumable], 2, [1, 2])
+
+    single.add_end_before_start(tasks[0], tasks[1], 2)
+    single.add_end_before_start(tasks[2], tasks[3], 3)
+    single.add_start_at_end(tasks[1], tasks[2])
+    single.add_identical_resources(tasks[0], tasks[1])
+    single.add_different_resources(tasks[1], tasks[2])
+    single.add_consecutive(tasks[2], tasks[3])
+    single.add_setup_time(machines[0], tasks[0], tasks[2], 5)
+
+    # Bulk adders using lists of objects.
+    bulk = Model()
+    jobs = bulk.add_jobs(2, weight=np.arange(2), due_date=5)
+    machines = bulk.add_machines(2)
+    [renewable] = bulk.add_renewables([3])
+    [consumable] = bulk.add_consumables(4)
+    tasks = bulk.add_tasks(4, [jobs[0], jobs[1]] * 2, latest_end=9)
+    bulk.add_modes(
+        [task for task in tasks for _ in range(2)],
+        [
+            resources
+            for idx in range(4)
+            for resources in [machines[idx % 2], [renewable, consumable]]
+        ],
+        [duration for idx in range(4) for duration in [idx + 1, 2]],
+        [demands for _ in range(4) for demands in [0, [1, 2]]],
+    )
+    bulk.add_end_before_start_many(tasks[::2], tasks[1::2], [2, 3])
+    bulk.add_start_at_end_many([tasks[1]], [tasks[2]])
+    bulk.add_identical_resources_many([tasks[0]], [tasks[1]])
+    bulk.add_different_resources_many([tasks[1]], [tasks[2]])
+    bulk.add_consecutive_many([tasks[2]], [tasks[3]])
+    bulk.add_setup_time_many([machines[0]], [tasks[0]], [tasks[2]], 5)
+
+    assert_equal(bulk.data(), single.data())
+
+    # Bulk adders using arrays of indices.
+    arrays = Model()
+    arrays.add_jobs(2, weight=np.arange(2), due_date=np.array([5, 5]))
+    arrays.add_machines(2)
+    arrays.add_renewables(np.array([3]))
+    arrays.add_consumables(np.array([4]))
+    arrays.add_tasks(4, np.array([0, 1, 0, 1]), latest_end=9)
+
+    for idx in range(4):  # modes are added per task to retain the order
+        arrays.add_modes(np.array([idx]), np.array([idx % 2]), idx + 1)
+        arrays.add_modes(np.array([idx]), np.array([[2, 3]]), 2, [[1, 2]])
+
+    arrays.add_end_before_start_many(np.array([0, 2]), np.array([1, 3]), 2)
+    arrays.add_end_before_start_many(np.array([]), np.array([]))
+    arrays.add_start_at_end_many(np.array([1]), np.array([2]))
+    arrays.add_identical_resources_many(np.array([0]), np.array([1]))
+    arrays.add_different_resources_many(np.array([1]), np.array([2]))
+    arrays.add_consecutive_many(np.array([2]), np.array([3]))
+    arrays.add_setup_time_many(
+        np.array([0]), np.array([0]), np.array([2]), np.array([5])
+    )
+
+    data = arrays.data()
+    delays = [delay for *_, delay in data.constraints.end_before_start]
+    assert_equal(delays, [2, 2])
+    assert_equal(data.replace(constraints=single.constraints), single.data())
+
+
+def test_add_modes_numpy_scalar_demands():
+    """
+    Tests that ``Model.add_modes`` accepts NumPy scalars and 0-d arrays as
+    demands, which are used for all resources of all modes.
+    """
+    model = Model()
+    resources = model.add_renewables([2, 2])
+    tasks = model.add_tasks(2)
+
+    for demands in [np.int64(2), np.array(2)]:
+        modes = model.add_modes(tasks, [resources, resources], 1, demands)
+        assert_equal([mode.demands for mode in modes], [[2, 2], [2, 2]])
+
+    # NumPy scalars are also accepted as the demand of a single mode.
+    modes = model.add_modes(tasks, resources, 1, [[1], np.int64(2)])
+    assert_equal([mode.demands for mode in modes], [[1], [2]])
+    assert_(type(modes[1].demands[0]) is int)
+
+
+def test_bulk_adders_raise_length_mismatch():
+    """
+    Tests that the bulk adders raise when the given arrays do not have
+    matching lengths.
+    """
+    model = Model()
+    tasks = model.add_tasks(3)
+
+    with assert_raises(ValueError):
+        model.add_jobs(2, weight=[1, 2, 3])
+
+    with assert_raises(ValueError):
+        model.add_tasks(2, jobs=[None])
+
+    with assert_raises(ValueError):
+        model.add_end_before_start_many(tasks[:2], tasks[:1])
+
+    with assert_raises(ValueError):
+        model.add_consecutive_many(tasks[:2], tasks[:1])
+
+
 def test_model_attributes():
     """
     Tests that the model attributes are correctly.
@@ -1,3 +1,9 @@
+import importlib
+import io
+import json
+import pickle
+
+import numpy as np
 import pytest
 from numpy.testing import assert_, assert_equal, assert_raises
 
@@ -16,6 +22,7 @@ from pyjobshop.ProblemData import (
     Mode,
     ModeDependency,
     Objective,
+    ProblemArrays,
     ProblemData,
     Renewable,
     SameSequence,
@@ -23,9 +30,11 @@ from pyjobshop.ProblemData import (
     SelectAtLeastOne,
     SelectExactlyOne,
     SetupTime,
+    SetupTimesIndex,
     StartBeforeEnd,
     StartBeforeStart,
     Task,
+    TimingConstraints,
 )
 from pyjobshop.Solution import ScheduledJob, ScheduledTask
 from pyjobshop.solve import solve
@@ -326,6 +335,146 @@ def test_mode_dependency_must_have_at_least_one_successor_mode():
         ModeDependency(0, [])
 
 
+@pytest.mark.parametrize(
+    "record",
+    [
+        Job(tasks=[0]),
+        Task(job=0),
+        Mode(0, [0], 1),
+        EndBeforeStart(0, 1, 2),
+        SetupTime(0, 1, 2, 3),
+        ScheduledTask(0, [0], 0, 1),
+    ],
+)
+def test_records_are_slotted(record):
+    """
+    Tests that the data records are slotted, so they do not carry a
+    per-instance dictionary, and that they can still be pickled.
+    """
+    assert_(not hasattr(record, "__dict__"))
+    assert_equal(pickle.loads(pickle.dumps(record)), record)
+
+    with assert_raises(AttributeError):
+        record.unknown = 1
+
+
+def test_constraint_records_are_unpackable():
+    """
+    Tests that constraint records can be unpacked into their fields.
+    """
+    task1, task2, delay = EndBeforeStart(0, 1, 2)
+    assert_equal((task1, task2, delay), (0, 1, 2))
+
+    machine, task1, task2, duration = SetupTime(0, 1, 2, 3)
+    assert_equal((machine, task1, task2, duration), (0, 1, 2, 3))
+
+
+def test_timing_constraints_behaves_like_list():
+    """
+    Tests that the array-backed timing constraints container supports the
+    list operations of a list of timing constraints.
+    """
+    timing = TimingConstraints(EndBeforeStart)
+    assert_equal(len(timing), 0)
+    assert_equal(timing, [])
+
+    for idx in range(10):
+        timing.append(EndBeforeStart(idx, idx + 1, idx))
+
+    assert_equal(len(timing), 10)
+    assert_equal(timing[0], EndBeforeStart(0, 1, 0))
+    assert_equal(timing[-1], EndBeforeStart(9, 10, 9))
+    assert_equal(
+        timing[1:3], [EndBeforeStart(1, 2, 1), EndBeforeStart(2, 3, 2)]
+    )
+    assert_equal(
+        timing, [EndBeforeStart(idx, idx + 1, idx) for idx in range(10)]
+    )
+
+    assert_(EndBeforeStart(3, 4, 3) in timing)
+    assert_(EndBeforeStart(3, 4, 0) not in timing)
+    assert_(StartBeforeStart(3, 4, 3) not in timing)
+
+    with assert_raises(IndexError):
+        timing[10]
+
+    # Iteration yields constraint objects that can be unpacked.
+    for idx, (task1, task2, delay) in enumerate(timing):
+        assert_equal((task1, task2, delay), (idx, idx + 1, idx))
+
+
+def test_timing_constraints_extend():
+    """
+    Tests that timing constraints can be extended in bulk from NumPy arrays,
+    from iterables of constraints, and from other containers.
+    """
+    timing = TimingConstraints(StartBeforeStart)
+    timing.extend(np.array([[0, 1], [1, 2]]))
+    timing.extend(np.array([[2, 3, -4]]))
+    timing.extend([StartBeforeStart(3, 4, 5)])
+    timing.extend(timing)
+
+    assert_equal(timing.task1, [0, 1, 2, 3, 0, 1, 2, 3])
+    assert_equal(timing.task2, [1, 2, 3, 4, 1, 2, 3, 4])
+    assert_equal(timing.delay, [0, 0, -4, 5, 0, 0, -4, 5])
+    assert_equal(timing.task1.dtype, np.int32)
+    assert_equal(timing.delay.dtype, np.int64)
+
+    # The column views are read-only.
+    with assert_raises(ValueError):
+        timing.task1[0] = 1
+
+    with assert_raises(ValueError):
+        timing.extend(np.array([0, 1]))
+
+    new = pickle.loads(pickle.dumps(timing))
+    assert_equal(new, timing)
+    assert_(new.constraint_cls is StartBeforeStart)
+
+
+def test_timing_constraints_task_index_out_of_range():
+    """
+    Tests that task indices that do not fit the compact task storage raise
+    instead of being silently wrapped around.
+    """
+    timing = TimingConstraints(EndBeforeStart)
+
+    with assert_raises(ValueError):
+        timing.append(EndBeforeStart(2**32, 1))
+
+    with assert_raises(ValueError):
+        timing.extend(np.array([[0, 2**32]]))
+
+    with assert_raises(ValueError):
+        Constraints(end_before_start=[EndBeforeStart(2**32, 1)])
+
+    assert_equal(len(timing), 0)
+
+
+def test_constraints_converts_timing_lists():
+    """
+    Tests that timing constraints passed as lists to ``Constraints`` are
+    stored in array-backed containers, and that other constraints are not.
+    """
+    constraints = Constraints(
+        end_before_start=[EndBeforeStart(0, 1)],
+        setup_times=[SetupTime(0, 0, 1, 2)],
+    )
+    assert_(isinstance(constraints.end_before_start, TimingConstraints))
+    assert_(isinstance(constraints.start_at_start, TimingConstraints))
+    assert_(isinstance(constraints.setup_times, list))
+    assert_equal(constraints.end_before_start, [EndBeforeStart(0, 1)])
+    assert_equal(
+        constraints,
+        Constraints(
+            end_before_start=TimingConstraints(
+                EndBeforeStart, np.array([[0, 1]])
+            ),
+            setup_times=[SetupTime(0, 0, 1, 2)],
+        ),
+    )
+
+
 @pytest.mark.parametrize(
     "tasks1, tasks2",
     [
@@ -668,6 +817,61 @@ def test_problem_data_all_modes_demand_infeasible():
         )
 
 
+@pytest.mark.parametrize(
+    "jobs, tasks, modes, msg",
+    [
+        (
+            [Job(tasks=[0]), Job(tasks=[])],
+            [Task(job=0)],
+            [Mode(0, [0], 1)],
+            "Job 1 does not reference any task.",
+        ),
+        (
+            [Job(tasks=[]), Job(tasks=[0])],
+            [Task(job=1)],
+            [Mode(0, [0], 1)],
+            "Job 0 does not reference any task.",
+        ),
+        (
+            [Job(tasks=[0, 1])],
+            [Task(job=0), Task()],
+            [Mode(0, [0], 1), Mode(1, [0], 1)],
+            "Job 0 contains task 1, but task belongs to job None.",
+        ),
+        (
+            [Job(tasks=[0])],
+            [Task(job=0), Task(job=-1)],
+            [Mode(0, [0], 1), Mode(1, [0], 1)],
+            "Task 1 references to unknown job index.",
+        ),
+        (
+            [],
+            [Task(), Task()],
+            [Mode(0, [0], 1), Mode(1, [0, 2], 1), Mode(2, [0], 1)],
+            "Mode 1 references unknown resource index.",
+        ),
+        (
+            [],
+            [Task(), Task(), Task()],
+            [Mode(2, [0], 1), Mode(0, [0], 1)],
+            "Processing modes missing for task 1.",
+        ),
+        (
+            [],
+            [Task(), Task()],
+            [Mode(1, [1], 1, [2]), Mode(0, [1], 1, [2])],
+            "All modes for task 1 have infeasible demands.",
+        ),
+    ],
+)
+def test_problem_data_raises_error_messages(jobs, tasks, modes, msg):
+    """
+    Tests that the first invalid data is reported with the correct message.
+    """
+    with pytest.raises(ValueError, match=msg):
+        ProblemData(jobs, [Machine(), Renewable(1)], tasks, modes)
+
+
 @pytest.mark.parametrize(
     "name, cls, idcs_list",
     [
@@ -891,37 +1095,130 @@ def make_replace_data():
 def test_problem_data_replace_no_changes():
     """
     Tests that when using ``ProblemData.replace()`` without any arguments
-    returns a new instance with different objects but with the same values.
+    returns a new instance with the same values, which cannot be modified in
+    a way that changes the original instance.
     """
-
     data = make_replace_data()
+    fingerprint = data.fingerprint()
     new = data.replace()
     assert_(new is not data)
+    assert_equal(new, data)
 
-    for idx in range(data.num_jobs):
-        assert_(new.jobs[idx] is not data.jobs[idx])
-        assert_equal(new.jobs[idx].deadline, data.jobs[idx].deadline)
-        assert_equal(new.jobs[idx].due_date, data.jobs[idx].due_date)
+    # The data is shared, so it must not be possible to modify it in place.
+    with assert_raises(TypeError):
+        new.constraints.end_before_start.append(EndBeforeStart(1, 0))
 
-    for idx in range(data.num_resources):
-        assert_(new.resources[idx] is not data.resources[idx])
-        assert_equal(new.resources[idx].name, data.resources[idx].name)
+    with assert_raises(TypeError):
+        new.jobs.append(Job())
 
-    for idx in range(data.num_tasks):
-        assert_(new.tasks[idx] is not data.tasks[idx])
-        assert_equal(
-            new.tasks[idx].earliest_start,
-            data.tasks[idx].earliest_start,
-        )
+    with assert_raises(TypeError):
+        new.tasks[0] = Task()
 
-    for idx in range(data.num_modes):
-        assert_(new.modes[idx] is not data.modes[idx])
-        assert_equal(new.modes[idx].task, data.modes[idx].task)
-        assert_equal(new.modes[idx].resources, data.modes[idx].resources)
-        assert_equal(new.modes[idx].duration, data.modes[idx].duration)
+    with assert_raises(TypeError):
+        del new.modes[0]
+
+    with assert_raises(AttributeError):  # FrozenInstanceError
+        new.objective.weight_makespan = 2
+
+    with assert_raises(AttributeError):
+        new.constraints.consecutive = [Consecutive(0, 1)]
 
-    assert_equal(new.constraints, data.constraints)
-    assert_equal(new.objective, data.objective)
+    assert_equal(data, make_replace_data())
+    assert_equal(data.fingerprint(), fingerprint)
+    assert_equal(data.replace().fingerprint(), fingerprint)
+
+
+def test_problem_data_does_not_share_mutable_data():
+    """
+    Tests that ProblemData stores read-only copies of the given data, so
+    that modifying the original lists and constraints afterwards does not
+    modify the instance.
+    """
+    jobs = [Job(tasks=[0])]
+    tasks = [Task(job=0), Task()]
+    constraints = Constraints(end_before_start=[EndBeforeStart(0, 1)])
+    data = ProblemData(
+        jobs,
+        [Machine()],
+        tasks,
+        [Mode(0, [0], 1), Mode(1, [0], 1)],
+        constraints,
+    )
+    fingerprint = data.fingerprint()
+
+    jobs.append(Job())
+    tasks.pop()
+    constraints.end_before_start.append(EndBeforeStart(1, 0))
+
+    assert_equal(data.num_jobs, 1)
+    assert_equal(data.num_tasks, 2)
+    assert_equal(data.constraints.end_before_start, [EndBeforeStart(0, 1)])
+    assert_equal(len(constraints.end_before_start), 2)
+    assert_equal(data.fingerprint(), fingerprint)
+
+    # Read-only containers survive pickling.
+    unpickled = pickle.loads(pickle.dumps(data))
+    assert_equal(unpickled, data)
+    with assert_raises(TypeError):
+        unpickled.constraints.end_before_start.append(EndBeforeStart(1, 0))
+
+
+def test_problem_data_does_not_copy_items():
+    """
+    Tests that ProblemData and ``ProblemData.replace()`` share the jobs,
+    resources, tasks and modes rather than copying them.
+    """
+    job, machine, task = Job(tasks=[0]), Machine(), Task(job=0)
+    mode = Mode(0, [0], 1)
+    data = ProblemData([job], [machine], [task], [mode])
+    new = data.replace(objective=Objective(weight_makespan=2))
+
+    for instance in [data, new]:
+        assert_(instance.jobs[0] is job)
+        assert_(instance.resources[0] is machine)
+        assert_(instance.tasks[0] is task)
+        assert_(instance.modes[0] is mode)
+
+
+def test_problem_data_replace_shares_unchanged_indexes():
+    """
+    Tests that ``ProblemData.replace()`` reuses derived indexes and arrays
+    that do not depend on the replaced data, and recomputes those that do.
+    """
+    data = ProblemData(
+        [Job(tasks=[0, 1])],
+        [Renewable(capacity=1), Machine()],
+        [Task(job=0), Task(job=0)],
+        [Mode(0, [0], 1), Mode(1, [1], 2)],
+        Constraints(setup_times=[SetupTime(1, 0, 1, 2)]),
+    )
+    arrays = data.arrays
+    index = data.setup_times_index
+
+    new = data.replace(objective=Objective(weight_total_flow_time=1))
+    assert_(new.arrays is not arrays)
+    assert_(new.arrays.task_earliest_start is arrays.task_earliest_start)
+    assert_(new.arrays.setup_times is arrays.setup_times)
+    assert_(new.setup_times_index is index)
+    assert_(new.task2modes(0) is data.task2modes(0))
+
+    # Replacing the modes recomputes the mode arrays and mode indexes, but
+    # still shares the task arrays and setup times.
+    modes = [Mode(0, [0, 1], 3), Mode(1, [1], 4)]
+    new = data.replace(modes=modes)
+    assert_equal(new.arrays.mode_duration, [3, 4])
+    assert_(new.arrays.task_earliest_start is arrays.task_earliest_start)
+    assert_(new.setup_times_index is index)
+    assert_equal(new.task2modes(0), [0])
+    assert_equal(new.task2resources(0), [0, 1])
+    assert_equal(data.task2resources(0), [0])
+
+    # Replacing the constraints recomputes the setup times.
+    constraints = Constraints(setup_times=[SetupTime(1, 0, 1, 5)])
+    new = data.replace(constraints=constraints)
+    assert_equal(new.setup_times_index.get(1, 0, 1), 5)
+    assert_equal(new.arrays.setup_times, [[1, 0, 1, 5]])
+    assert_equal(data.setup_times_index.get(1, 0, 1), 2)
 
 
 def test_problem_data_replace_with_changes():
@@ -972,6 +1269,63 @@ def test_problem_data_replace_with_changes():
     assert_(new.objective != data.objective)
 
 
+def test_problem_data_skip_validation():
+    """
+    Tests that validation is skipped when passing ``validate=False``, and
+    that the data can be validated explicitly later.
+    """
+    # Job 0 does not reference any task, which is invalid.
+    args = ([Job()], [Machine()], [Task()], [Mode(0, [0], 1)])
+
+    with assert_raises(ValueError):
+        ProblemData(*args)
+
+    data = ProblemData(*args, validate=False)
+    assert_equal(data.task2modes(0), [0])
+
+    with assert_raises(ValueError):
+        data.validate()
+
+    with assert_raises(ValueError):
+        data.replace()
+
+    data.replace(validate=False)
+
+    valid = ProblemData([], [Machine()], [Task()], [Mode(0, [0], 1)])
+    valid.validate()  # does not raise
+
+
+def test_problem_data_pickle_restores_indexes(monkeypatch):
+    """
+    Tests that unpickling a ProblemData instance restores the derived indexes
+    directly, without validating the data or recomputing the indexes.
+    """
+    data = make_replace_data()
+    data.setup_times_index  # ensure that the lazy index is computed
+
+    def raise_error(*args, **kwargs):
+        raise AssertionError("Should not be called.")
+
+    monkeypatch.setattr(ProblemData, "validate", raise_error)
+    monkeypatch.setattr(ProblemData, "__init__", raise_error)
+    monkeypatch.setattr(ProblemArrays, "__init__", raise_error)
+    monkeypatch.setattr(SetupTimesIndex, "__init__", raise_error)
+    new = pickle.loads(pickle.dumps(data))
+    assert_equal(new, data)
+
+    for idx in range(data.num_tasks):
+        assert_equal(new.task2modes(idx), data.task2modes(idx))
+        assert_equal(new.task2resources(idx), data.task2resources(idx))
+
+    for idx in range(data.num_resources):
+        assert_equal(new.resource2modes(idx), data.resource2modes(idx))
+
+    assert_equal(new.machine_idcs, data.machine_idcs)
+    assert_equal(len(new.setup_times_index), len(data.setup_times_index))
+    assert_equal(new.arrays.mode_task, data.arrays.mode_task)
+    assert_(not new.arrays.mode_task.flags.writeable)
+
+
 def test_problem_data_resource2modes():
     """
     Tests that the mode indices corresponding to each resource are correctly
@@ -1050,6 +1404,116 @@ def test_problem_data_task2resources():
         data.task2resources(3)
 
 
+def test_problem_data_setup_times_index():
+    """
+    Tests that the sparse setup times index correctly stores the setup times
+    of each machine.
+    """
+    data = ProblemData(
+        [],
+        [Machine(), Machine(), Machine()],
+        [Task(), Task(), Task()],
+        [Mode(task, [0, 1, 2], 1) for task in range(3)],
+        constraints=Constraints(
+            setup_times=[
+                SetupTime(0, 0, 1, 3),
+                SetupTime(0, 2, 0, 5),
+                SetupTime(0, 0, 2, 4),
+                SetupTime(1, 1, 2, 0),
+                SetupTime(0, 0, 1, 7),  # duplicate; last one is used
+            ]
+        ),
+    )
+    index = data.setup_times_index
+    assert_(index is data.setup_times_index)  # cached
+    assert_equal(len(index), 4)
+
+    assert_(index.has_setup_times(0))
+    assert_(not index.has_setup_times(1))  # only zero setup times
+    assert_(not index.has_setup_times(2))  # no setup times at all
+
+    assert_equal(index.get(0, 0, 1), 7)
+    assert_equal(index.get(0, 0, 2), 4)
+    assert_equal(index.get(0, 2, 0), 5)
+    assert_equal(index.get(0, 1, 0), 0)
+    assert_equal(index.get(2, 0, 1), 0)
+
+    assert_equal(index.successors(0, 0), {1: 7, 2: 4})
+    assert_equal(index.successors(0, 1), {})
+    assert_equal(index.successors(1, 1), {2: 0})
+
+    # The dense matrix is restricted to the given tasks, in the given order.
+    assert_equal(index.matrix(0, [0, 1, 2]), [[0, 7, 4], [0, 0, 0], [5, 0, 0]])
+    assert_equal(index.matrix(0, [2, 0]), [[0, 5], [4, 0]])
+    assert_equal(index.matrix(2, [0, 1]), [[0, 0], [0, 0]])
+
+
+def test_problem_data_arrays():
+    """
+    Tests that the columnar view correctly stores the problem data attributes
+    in read-only arrays.
+    """
+    data = ProblemData(
+        [Job(weight=2, tasks=[0, 1]), Job(3, 3, due_date=-1, tasks=[2])],
+        [Machine(), Renewable(capacity=4)],
+        [
+            Task(job=0, earliest_start=1, latest_end=10),
+            Task(job=0, allow_idle=True, optional=True),
+            Task(job=1, latest_start=5, earliest_end=2, allow_breaks=True),
+        ],
+        [
+            Mode(0, [0], 2),
+            Mode(1, [0, 1], 3, [0, 2]),
+            Mode(2, [1], 4, [1]),
+        ],
+        constraints=Constraints(
+            end_before_start=[EndBeforeStart(0, 1, 2)],
+            start_before_end=[StartBeforeEnd(1, 2)],
+        ),
+    )
+    arrays = data.arrays
+    assert_(arrays is data.arrays)  # cached
+
+    assert_equal(arrays.job_weight, [2, 3])
+    assert_equal(arrays.job_release_date, [0, 3])
+    assert_equal(arrays.job_deadline, [MAX_VALUE, MAX_VALUE])
+    assert_equal(arrays.job_due_date, [0, -1])
+    assert_equal(arrays.job_has_due_date, [False, True])
+    assert_equal(arrays.job_indptr, [0, 2, 3])
+    assert_equal(arrays.job_tasks, [0, 1, 2])
+
+    assert_equal(arrays.resource_capacity, [0, 4])
+
+    assert_equal(arrays.task_job, [0, 0, 1])
+    assert_equal(arrays.task_has_job, [True, True, True])
+    assert_equal(arrays.task_earliest_start, [1, 0, 0])
+    assert_equal(arrays.task_latest_start, [MAX_VALUE, MAX_VALUE, 5])
+    assert_equal(arrays.task_earliest_end, [0, 0, 2])
+    assert_equal(arrays.task_latest_end, [10, MAX_VALUE, MAX_VALUE])
+    assert_equal(arrays.task_allow_idle, [False, True, False])
+    assert_equal(arrays.task_allow_breaks, [False, False, True])
+    assert_equal(arrays.task_optional, [False, True, False])
+
+    assert_equal(arrays.mode_task, [0, 1, 2])
+    assert_equal(arrays.mode_duration, [2, 3, 4])
+    assert_equal(arrays.mode_indptr, [0, 1, 3, 4])
+    assert_equal(arrays.mode_resources, [0, 0, 1, 1])
+    assert_equal(arrays.mode_demands, [0, 0, 2, 1])
+
+    assert_equal(arrays.precedences["end_before_start"], [[0, 1, 2]])
+    assert_equal(arrays.precedences["start_before_end"], [[1, 2, 0]])
+    assert_equal(arrays.precedences["end_at_end"].shape, (0, 3))
+
+    # The arrays are read-only.
+    with assert_raises(ValueError):
+        arrays.mode_duration[0] = 1
+
+    # Tasks without a job have job index -1.
+    data = ProblemData([], [Machine()], [Task()], [Mode(0, [0], 1)])
+    assert_equal(data.arrays.task_job, [-1])
+    assert_equal(data.arrays.task_has_job, [False])
+
+
 # --- Tests that involve checking solver correctness of problem data. ---
 
 
@@ -2655,3 +3119,274 @@ def test_json_round_trip(complete_data):
     json_str = complete_data.to_json()
     new = ProblemData.from_json(json_str)
     assert_equal(complete_data, new)
+
+    # Trusted data can skip validation.
+    new = ProblemData.from_json(json_str, validate=False)
+    assert_equal(complete_data, new)
+
+
+def test_npy_round_trip(complete_data, tmp_path):
+    """
+    Tests that writing and reading the binary format leaves the ProblemData
+    unaffected, and that the loaded columns back the arrays view.
+    """
+    complete_data.to_npy(tmp_path)
+    new = ProblemData.from_npy(tmp_path)
+    assert_equal(new, complete_data)
+
+    assert_(isinstance(new.arrays.task_earliest_start, np.memmap))
+    assert_equal(
+        new.arrays.task_earliest_start,
+        complete_data.arrays.task_earliest_start,
+    )
+    for name, value in complete_data.arrays.precedences.items():
+        assert_equal(new.arrays.precedences[name], value)
+
+    # Loading the columns into memory instead, and skipping validation.
+    new = ProblemData.from_npy(tmp_path, validate=False, mmap_mode=None)
+    assert_equal(new, complete_data)
+    assert_(not isinstance(new.arrays.task_earliest_start, np.memmap))
+
+
+def test_npy_loads_objects_lazily(complete_data, tmp_path, monkeypatch):
+    """
+    Tests that reading the binary format keeps the columns memory-mapped
+    without creating the jobs, tasks and modes until they are accessed, and
+    that unknown files in the directory are ignored.
+    """
+    complete_data.to_npy(tmp_path)
+    np.save(tmp_path / "stray.npy", np.arange(3))
+
+    module = importlib.import_module("pyjobshop.ProblemData")
+    created = []
+    for name in [
+        "_jobs_from_arrays",
+        "_tasks_from_arrays",
+        "_modes_from_arrays",
+    ]:
+        func = getattr(module, name)
+
+        def wrapper(*args, name=name, func=func):
+            created.append(name)
+            return func(*args)
+
+        monkeypatch.setattr(module, name, wrapper)
+
+    new = ProblemData.from_npy(tmp_path)
+
+    # The timing constraints use the memory-mapped columns as storage.
+    timing = new.constraints.end_before_start
+    column = new.arrays.precedences["end_before_start"]
+    assert_(np.shares_memory(timing.task1, column))
+
+    # Counts, indexes and the fingerprint do not need the objects either.
+    assert_equal(new.num_tasks, complete_data.num_tasks)
+    assert_equal(new.task2modes(0), complete_data.task2modes(0))
+    assert_equal(new.fingerprint(), complete_data.fingerprint())
+    assert_equal(created, [])
+
+    # The objects are created once, on first access.
+    assert_equal(new.tasks, complete_data.tasks)
+    assert_equal(new.tasks, complete_data.tasks)
+    assert_equal(created, ["_tasks_from_arrays"])
+    assert_equal(new, complete_data)
+
+
+def test_timing_constraints_from_array():
+    """
+    Tests that timing constraints created from an array use it as storage
+    until they are modified, and that the array's shape is validated.
+    """
+    arr = np.array([[0, 1, 2], [1, 2, 0]])
+    timing = TimingConstraints.from_array(EndBeforeStart, arr)
+    assert_equal(list(timing), [EndBeforeStart(0, 1, 2), EndBeforeStart(1, 2)])
+    assert_(np.shares_memory(timing.task1, arr))
+
+    # Modifying the container copies the array, leaving it unchanged.
+    timing.append(EndBeforeStart(2, 0))
+    assert_equal(len(timing), 3)
+    assert_(not np.shares_memory(timing.task1, arr))
+    assert_equal(arr, [[0, 1, 2], [1, 2, 0]])
+
+    with assert_raises(ValueError):
+        TimingConstraints.from_array(EndBeforeStart, np.zeros((2, 2)))
+
+
+def test_npy_round_trip_names_and_due_dates(tmp_path):
+    """
+    Tests that the binary format stores names and optional values such as
+    missing due dates and jobs.
+    """
+    data = ProblemData(
+        [Job(due_date=3, tasks=[0], name="job"), Job(tasks=[1])],
+        [Machine(name="machine"), Renewable(2, breaks=[(1, 2)])],
+        [Task(job=0, name="task"), Task(job=1), Task()],
+        [Mode(0, [0], 1, name="mode"), Mode(1, [1], 2, [1]), Mode(2, [0], 3)],
+    )
+    data.to_npy(tmp_path)
+    assert_equal(ProblemData.from_npy(tmp_path), data)
+
+
+def test_npy_raises_unsupported_version(complete_data, tmp_path):
+    """
+    Tests that reading the binary format raises when the directory was
+    written by an unsupported format version.
+    """
+    complete_data.to_npy(tmp_path)
+
+    meta = json.loads((tmp_path / "meta.json").read_text())
+    meta["version"] = -1
+    (tmp_path / "meta.json").write_text(json.dumps(meta))
+
+    with assert_raises(ValueError):
+        ProblemData.from_npy(tmp_path)
+
+
+def test_dump_and_load_json(complete_data):
+    """
+    Tests that the streaming JSON encoder and decoder round-trip the data,
+    and that their output is compatible with ``to_json`` and ``from_json``.
+    """
+    fh = io.StringIO()
+    complete_data.dump_json(fh)
+
+    fh.seek(0)
+    assert_equal(ProblemData.load_json(fh), complete_data)
+    assert_equal(ProblemData.from_json(fh.getvalue()), complete_data)
+    assert_equal(
+        json.loads(fh.getvalue()), json.loads(complete_data.to_json())
+    )
+
+    fh = io.StringIO(complete_data.to_json(indent=4))
+    assert_equal(ProblemData.load_json(fh, validate=False), complete_data)
+
+
+def test_json_ignores_unknown_constraints(complete_data):
+    """
+    Tests that both JSON decoders ignore unknown constraint types.
+    """
+    doc = json.loads(complete_data.to_json())
+    doc["constraints"]["foo"] = [{"task1": 0}]
+    json_str = json.dumps(doc)
+
+    assert_equal(ProblemData.from_json(json_str), complete_data)
+    assert_equal(ProblemData.load_json(io.StringIO(json_str)), complete_data)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7])
+def test_load_json_small_chunks(monkeypatch, complete_data, chunk_size: int):
+    """
+    Tests that the streaming JSON decoder handles values that are split over
+    multiple chunks, such as numbers and strings.
+    """
+    data = complete_data.replace(
+        tasks=[
+            Task(job=task.job, latest_end=123_456, name="a long task name")
+            for task in complete_data.tasks
+        ]
+    )
+    fh = io.StringIO()
+    data.dump_json(fh)
+    json_str = fh.getvalue()
+
+    class ChunkedReader(io.StringIO):
+        def read(self, size=-1):
+            return super().read(chunk_size)
+
+    assert_equal(ProblemData.load_json(ChunkedReader(json_str)), data)
+
+
+def test_load_json_large_value_reads(complete_data):
+    """
+    Tests that the streaming JSON decoder grows its reads geometrically for
+    values spanning many chunks, rather than reading one chunk at a time.
+    """
+    tasks = [Task(job=task.job) for task in complete_data.tasks]
+    tasks[0] = Task(job=tasks[0].job, name="x" * 4_000_000)
+    data = complete_data.replace(tasks=tasks)
+    fh = io.StringIO()
+    data.dump_json(fh)
+
+    sizes = []
+
+    class CountingReader(io.StringIO):
+        def read(self, size=-1):
+            sizes.append(size)
+            return super().read(size)
+
+    assert_equal(ProblemData.load_json(CountingReader(fh.getvalue())), data)
+
+    # The default chunk size is 64KiB, so reading the 4MB name one chunk at a
+    # time would take more than 60 reads.
+    assert_(len(sizes) < 15)
+
+
+@pytest.mark.parametrize("json_str", ["", "[]", '{"jobs": [}', '{"jobs" []}'])
+def test_load_json_raises_invalid_json(json_str: str):
+    """
+    Tests that the streaming JSON decoder raises on invalid JSON.
+    """
+    with assert_raises(ValueError):
+        ProblemData.load_json(io.StringIO(json_str))
+
+
+def test_fingerprint_equal_data(complete_data, tmp_path):
+    """
+    Tests that equal instances have the same fingerprint, regardless of how
+    they were created.
+    """
+    fingerprint = complete_data.fingerprint()
+    assert_equal(len(fingerprint), 64)
+
+    from_json = ProblemData.from_json(complete_data.to_json())
+    assert_equal(from_json.fingerprint(), fingerprint)
+
+    complete_data.to_npy(tmp_path)
+    from_npy = ProblemData.from_npy(tmp_path)
+    assert_equal(from_npy.fingerprint(), fingerprint)
+
+    unpickled = pickle.loads(pickle.dumps(complete_data))
+    assert_equal(unpickled.fingerprint(), fingerprint)
+
+
+@pytest.mark.parametrize(
+    "replace",
+    [
+        lambda data: data.replace(jobs=[Job(tasks=[2], due_date=2)]),
+        lambda data: data.replace(
+            resources=[*data.resources[:-1], Machine(breaks=[(1, 3)])]
+        ),
+        lambda data: data.replace(tasks=[*data.tasks[:-1], Task(name="t")]),
+        lambda data: data.replace(modes=[*data.modes[:-1], Mode(7, [5], 3)]),
+        lambda data: data.replace(
+            constraints=Constraints(setup_times=[SetupTime(0, 0, 1, 1)])
+        ),
+        lambda data: data.replace(
+            objective=Objective(weight_total_flow_time=1)
+        ),
+    ],
+)
+def test_fingerprint_changes_with_data(complete_data, replace):
+    """
+    Tests that the fingerprint changes when any part of the data changes.
+    """
+    new = replace(complete_data)
+    assert_(new.fingerprint() != complete_data.fingerprint())
+
+
+def test_fingerprint_is_stable():
+    """
+    Tests that the fingerprint of a fixed instance does not change, since
+    fingerprints are used as persistent cache keys.
+    """
+    data = ProblemData(
+        [Job(tasks=[0, 1])],
+        [Machine(), Renewable(2)],
+        [Task(job=0), Task(job=0, name="task")],
+        [Mode(0, [0], 2), Mode(1, [1], 3, [1])],
+        Constraints(end_before_start=[EndBeforeStart(0, 1, 1)]),
+    )
+    expected = (
+        "08ce7a696b9a849628183797c41371c7c5811a05708a372b5520efb90c16d80f"
+    )
+    assert_equal(data.fingerprint(), expected)
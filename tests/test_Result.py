@@ -1,6 +1,6 @@
 from numpy.testing import assert_equal
 
-from pyjobshop.Result import Result, SolveStatus
+from pyjobshop.Result import ModelStats, Result, SolveStatus
 from pyjobshop.Solution import Solution
 
 
@@ -46,3 +46,21 @@ def test_result_string_representation(small):
     )
 
     assert_equal(str(result), expected)
+
+
+def test_model_stats_build_time():
+    """
+    Tests that the build time of the model statistics includes all phases
+    other than solving.
+    """
+    stats = ModelStats({"variables": 1, "objective": 2, "solve": 4})
+    assert_equal(stats.build_time, 3)
+    assert_equal(ModelStats().build_time, 0)
+
+
+def test_result_default_stats(small):
+    """
+    Tests that results have empty model statistics by default.
+    """
+    result = Result(1, 1, SolveStatus.OPTIMAL, 1, Solution(small, []))
+    assert_equal(result.stats, ModelStats())
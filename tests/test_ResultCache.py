@@ -0,0 +1,138 @@
+import importlib
+import os
+
+from numpy.testing import assert_, assert_equal, assert_raises
+
+from pyjobshop.Result import ModelStats, Result, SolveStatus
+from pyjobshop.ResultCache import ResultCache
+from pyjobshop.show_versions import _version
+from pyjobshop.Solution import ScheduledTask, Solution
+
+
+def _result(data, objective: float = 3) -> Result:
+    tasks = [ScheduledTask(0, [0], 0, 1), ScheduledTask(0, [0], 1, 3)]
+    best = Solution(data, tasks)
+    stats = ModelStats({"variables": 0.1, "solve": 0.5}, 10, 20)
+    return Result(objective, 3, SolveStatus.OPTIMAL, 0.5, best, stats)
+
+
+def test_put_and_get(small, tmp_path):
+    """
+    Tests that a stored result is returned for the same key, and that
+    unknown keys are missing.
+    """
+    cache = ResultCache(tmp_path)
+    key = cache.key(small, "ortools", 10)
+    assert_(cache.get(key, small) is None)
+    assert_(key not in cache)
+
+    result = _result(small)
+    cache.put(key, result)
+    assert_(key in cache)
+    assert_equal(len(cache), 1)
+
+    cached = cache.get(key, small)
+    assert_(cached is not None)
+    assert_equal(cached, result)
+
+
+def test_key(small, complete_data):
+    """
+    Tests that the key depends on the instance and all solver parameters.
+    """
+    key = ResultCache.key(small, "ortools", 10, num_workers=2, a=1)
+    assert_equal(key, ResultCache.key(small, "ortools", 10, 2, a=1))
+
+    others = [
+        ResultCache.key(complete_data, "ortools", 10, 2, a=1),
+        ResultCache.key(small, "cpoptimizer", 10, 2, a=1),
+        ResultCache.key(small, "ortools", 20, 2, a=1),
+        ResultCache.key(small, "ortools", 10, 4, a=1),
+        ResultCache.key(small, "ortools", 10, 2, a=2),
+        ResultCache.key(small, "ortools", 10, 2),
+        ResultCache.key(small, "ortools", 10, 2, _result(small).best, a=1),
+    ]
+    assert_(key not in others)
+    assert_equal(len(set(others)), len(others))
+
+
+def test_key_depends_on_versions(small, monkeypatch):
+    """
+    Tests that the key changes when PyJobShop or a solver is upgraded.
+    """
+    key = ResultCache.key(small, "ortools", 10)
+
+    # The module is shadowed by the ResultCache class in the package.
+    module = importlib.import_module("pyjobshop.ResultCache")
+
+    for name in ["pyjobshop", "ortools"]:
+        with monkeypatch.context() as ctx:
+            ctx.setattr(
+                module,
+                "_version",
+                lambda package, name=name: (
+                    "0.0.0" if package == name else _version(package)
+                ),
+            )
+            assert_(ResultCache.key(small, "ortools", 10) != key)
+
+
+def test_key_raises_non_serializable_kwargs(small):
+    """
+    Tests that solver parameters that are not JSON-serializable raise, rather
+    than resulting in keys that depend on their representation.
+    """
+    with assert_raises(TypeError):
+        ResultCache.key(small, "ortools", 10, a=object())
+
+
+def test_evicts_least_recently_used(small, tmp_path):
+    """
+    Tests that the least recently used results are evicted when the cache
+    exceeds its maximum size.
+    """
+    cache = ResultCache(tmp_path)
+    for idx in range(3):
+        cache.put(str(idx), _result(small, idx))
+        os.utime(tmp_path / f"{idx}.pkl", ns=(idx, idx))
+
+    # Getting the oldest entry marks it as the most recently used one, so
+    # the next oldest entry should be evicted first.
+    cache.get("0", small)
+    size = sum(path.stat().st_size for path in tmp_path.glob("*.pkl"))
+
+    cache = ResultCache(tmp_path, max_size=size)
+    cache.put("3", _result(small, 3))
+    assert_equal(len(cache), 3)
+    assert_("1" not in cache)
+    assert_("0" in cache)
+
+
+def test_corrupt_entry_is_missing(small, tmp_path):
+    """
+    Tests that an entry that cannot be read is treated as missing, and is
+    removed from the cache.
+    """
+    cache = ResultCache(tmp_path)
+    (tmp_path / "key.pkl").write_bytes(b"not a pickle")
+
+    assert_(cache.get("key", small) is None)
+    assert_("key" not in cache)
+
+
+def test_clear(small, tmp_path):
+    """
+    Tests that clearing the cache removes all results.
+    """
+    cache = ResultCache(tmp_path)
+    cache.put("key", _result(small))
+    cache.clear()
+    assert_equal(len(cache), 0)
+
+
+def test_raises_negative_max_size(tmp_path):
+    """
+    Tests that a negative maximum size raises a ValueError.
+    """
+    with assert_raises(ValueError):
+        ResultCache(tmp_path, max_size=-1)
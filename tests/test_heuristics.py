@@ -0,0 +1,185 @@
+import pytest
+from numpy.testing import assert_, assert_equal, assert_raises
+
+from pyjobshop import Model
+from pyjobshop.heuristics import PRIORITY_RULES, sgs
+from pyjobshop.solvers.ortools import CPModel
+from tests.utils import read
+
+
+def assert_feasible(data, solution):
+    """
+    Asserts that the given solution is feasible, by fixing all tasks to their
+    schedule in the solution and solving the resulting model.
+    """
+    cp_model = CPModel(data)
+    cp_model.fix(solution, range(data.num_tasks))
+    result = cp_model.solve(time_limit=10, display=False, num_workers=1)
+
+    assert_(result.status.value in ["Optimal", "Feasible"])
+    assert_equal(result.objective, solution.objective)
+
+
+@pytest.mark.parametrize("rule", PRIORITY_RULES)
+@pytest.mark.parametrize("scheme", ["serial", "parallel"])
+def test_sgs_feasible(rule, scheme):
+    """
+    Tests that each priority rule and schedule generation scheme constructs a
+    feasible solution.
+    """
+    data = read("data/Mk01.fjs")
+    solution = sgs(data, rule, scheme)
+
+    assert_equal(len(solution.tasks), data.num_tasks)
+    assert_feasible(data, solution)
+
+
+@pytest.mark.parametrize(
+    ("loc", "instance_format"),
+    [
+        ("data/edata-car1.fjs", "fjsplib"),
+        ("data/aslib0_0.rcp", "aslib"),
+        ("data/c154_3.mm", "psplib"),
+    ],
+)
+def test_sgs_feasible_instances(loc, instance_format):
+    """
+    Tests that the heuristic constructs feasible solutions for instances with
+    renewable and consumable resources, and optional tasks.
+    """
+    data = read(loc, instance_format=instance_format)
+    assert_feasible(data, sgs(data))
+
+
+def test_sgs_small(small):
+    """
+    Tests that the heuristic finds the optimal solution of the small instance.
+    """
+    assert_equal(sgs(small).objective, 3)
+
+
+def test_sgs_breaks():
+    """
+    Tests that tasks do not start during breaks, and only overlap breaks if
+    they are allowed to.
+    """
+    model = Model()
+    machine = model.add_machine(breaks=[(1, 3), (6, 8)])
+    task1, task2 = model.add_task(), model.add_task(allow_breaks=True)
+    model.add_mode(task1, machine, duration=2)
+    model.add_mode(task2, machine, duration=2)
+    model.add_end_before_start(task1, task2)
+
+    data = model.data()
+    solution = sgs(data)
+
+    # The first task does not fit before the first break, so it starts after
+    # it. The second task is interrupted by the second break.
+    assert_equal(solution.tasks[0].start, 3)
+    assert_equal(solution.tasks[1].start, 5)
+    assert_equal(solution.tasks[1].end, 9)
+    assert_equal(solution.tasks[1].breaks, 2)
+    assert_feasible(data, solution)
+
+
+def test_sgs_timing_constraints():
+    """
+    Tests that the heuristic satisfies timing constraints with delays.
+    """
+    model = Model()
+    machine1, machine2 = model.add_machine(), model.add_machine()
+    task1, task2, task3 = [model.add_task() for _ in range(3)]
+    model.add_mode(task1, machine1, duration=2)
+    model.add_mode(task2, machine2, duration=2)
+    model.add_mode(task3, machine2, duration=1)
+
+    model.add_end_before_start(task1, task2, delay=3)
+    model.add_start_at_start(task1, task3)
+
+    data = model.data()
+    solution = sgs(data)
+    assert_equal(solution.tasks[1].start, 5)
+    assert_equal(solution.tasks[2].start, solution.tasks[0].start)
+    assert_feasible(data, solution)
+
+
+def test_sgs_select_constraints():
+    """
+    Tests that the heuristic selects optional tasks that are needed to satisfy
+    the task selection constraints.
+    """
+    model = Model()
+    machine = model.add_machine()
+    tasks = [model.add_task(optional=True) for _ in range(4)]
+    for task in tasks:
+        model.add_mode(task, machine, duration=1)
+
+    model.add_select_exactly_one(tasks[:2])
+    model.add_select_at_least_one(tasks[2:], condition_task=tasks[0])
+
+    data = model.data()
+    solution = sgs(data)
+    assert_equal([task.present for task in solution.tasks], [1, 0, 1, 0])
+    assert_feasible(data, solution)
+
+
+def test_sgs_consumables():
+    """
+    Tests that the heuristic selects modes whose total consumption does not
+    exceed the consumable capacities.
+    """
+    model = Model()
+    machine = model.add_machine()
+    consumable = model.add_consumable(capacity=2)
+    tasks = [model.add_task() for _ in range(2)]
+    for task in tasks:
+        model.add_mode(task, [machine, consumable], duration=1, demands=[0, 2])
+        model.add_mode(task, [machine, consumable], duration=5, demands=[0, 0])
+
+    data = model.data()
+    solution = sgs(data)
+    assert_equal(solution.objective, 6)
+    assert_feasible(data, solution)
+
+
+def test_sgs_raises_unknown_rule_or_scheme(small):
+    """
+    Tests that the heuristic raises when the priority rule or the schedule
+    generation scheme is unknown.
+    """
+    with assert_raises(ValueError):
+        sgs(small, "fifo")  # type: ignore
+
+    with assert_raises(ValueError):
+        sgs(small, scheme="random")  # type: ignore
+
+
+def test_sgs_raises_not_supported():
+    """
+    Tests that the heuristic raises for constraints that it does not support.
+    """
+    model = Model()
+    machine = model.add_machine()
+    task1, task2 = model.add_task(), model.add_task()
+    model.add_mode(task1, machine, duration=1)
+    model.add_mode(task2, machine, duration=1)
+    model.add_consecutive(task1, task2)
+
+    with assert_raises(ValueError):
+        sgs(model.data())
+
+
+def test_sgs_raises_cyclic():
+    """
+    Tests that the heuristic raises when the timing constraints are cyclic.
+    """
+    model = Model()
+    machine = model.add_machine()
+    task1, task2 = model.add_task(), model.add_task()
+    model.add_mode(task1, machine, duration=1)
+    model.add_mode(task2, machine, duration=1)
+    model.add_end_before_start(task1, task2)
+    model.add_end_before_start(task2, task1)
+
+    with assert_raises(ValueError):
+        sgs(model.data())
@@ -0,0 +1,259 @@
+import threading
+
+import numpy as np
+import pytest
+from numpy.testing import assert_, assert_equal, assert_raises
+
+from pyjobshop import Model, solve
+from pyjobshop.lns import (
+    NEIGHBORHOODS,
+    critical_path,
+    random_jobs,
+    random_resources,
+    solve_lns,
+    time_window,
+)
+from pyjobshop.Solution import ScheduledTask, Solution
+from tests.utils import read
+
+
+@pytest.fixture(scope="module")
+def mk01():
+    """
+    Flexible job shop instance, with its first found solution.
+    """
+    data = read("data/Mk01.fjs")
+    result = solve(data, num_workers=1, stop_after_first_solution=True)
+    return data, result.best
+
+
+@pytest.mark.parametrize("neighborhood", NEIGHBORHOODS)
+def test_neighborhood_size(mk01, neighborhood):
+    """
+    Tests that the neighborhoods select the requested number of distinct
+    tasks.
+    """
+    data, solution = mk01
+    rng = np.random.default_rng(1)
+
+    for size in [1, 10, data.num_tasks]:
+        tasks = neighborhood(data, solution, size, rng)
+        assert_equal(len(set(tasks)), len(tasks))
+        assert_(all(0 <= idx < data.num_tasks for idx in tasks))
+
+        if neighborhood is random_jobs:  # selects complete jobs
+            assert_(len(tasks) >= size)
+        else:
+            assert_equal(len(tasks), size)
+
+
+def test_random_jobs_selects_complete_jobs(mk01):
+    """
+    Tests that random_jobs selects all tasks of the selected jobs.
+    """
+    data, solution = mk01
+    tasks = set(random_jobs(data, solution, 10, np.random.default_rng(1)))
+
+    for job in data.jobs:
+        assert_(tasks.issuperset(job.tasks) or tasks.isdisjoint(job.tasks))
+
+
+def test_random_resources_selects_tasks_on_resource(mk01):
+    """
+    Tests that random_resources selects all tasks that are scheduled on the
+    selected resources, except on the last resource, where it selects the
+    tasks that start first.
+    """
+    data, solution = mk01
+    tasks = random_resources(data, solution, 20, np.random.default_rng(1))
+
+    # Each task of this instance is scheduled on a single machine.
+    res2tasks: dict[int, list[int]] = {}
+    for idx in tasks:
+        res2tasks.setdefault(solution.tasks[idx].resources[0], []).append(idx)
+
+    *complete, last = res2tasks
+    for res_idx in complete:
+        on_resource = [
+            idx
+            for idx, task in enumerate(solution.tasks)
+            if res_idx in task.resources
+        ]
+        assert_equal(sorted(res2tasks[res_idx]), on_resource)
+
+    starts = [solution.tasks[idx].start for idx in res2tasks[last]]
+    assert_equal(starts, sorted(starts))
+
+
+def test_time_window_selects_consecutive_tasks(mk01):
+    """
+    Tests that time_window selects the tasks that start consecutively.
+    """
+    data, solution = mk01
+    tasks = time_window(data, solution, 10, np.random.default_rng(1))
+
+    starts = sorted(task.start for task in solution.tasks)
+    selected = sorted(solution.tasks[idx].start for idx in tasks)
+    first = starts.index(selected[0])
+    assert_equal(selected, starts[first : first + 10])
+
+
+def test_critical_path():
+    """
+    Tests that critical_path selects the chain of tasks that determines the
+    makespan.
+    """
+    model = Model()
+    machine1, machine2 = model.add_machine(), model.add_machine()
+    tasks = [model.add_task() for _ in range(4)]
+
+    # Tasks 0 and 1 are on the first machine, and task 2 directly follows
+    # task 1 because of a precedence constraint. Task 3 is not critical.
+    for task, machine in zip(tasks, [machine1, machine1, machine2, machine2]):
+        model.add_mode(task, machine, duration=2)
+
+    model.add_end_before_start(tasks[1], tasks[2])
+    data = model.data()
+    solution = Solution(
+        data,
+        [
+            ScheduledTask(0, [0], 0, 2),
+            ScheduledTask(1, [0], 2, 4),
+            ScheduledTask(2, [1], 4, 6),
+            ScheduledTask(3, [1], 0, 2),
+        ],
+    )
+
+    rng = np.random.default_rng(1)
+    assert_equal(critical_path(data, solution, 3, rng), [2, 1, 0])
+    assert_equal(critical_path(data, solution, 2, rng), [2, 1])
+
+    # The remaining task is added once the whole path is selected.
+    assert_equal(critical_path(data, solution, 4, rng), [2, 1, 0, 3])
+
+
+def test_solve_lns_improves_solution(mk01):
+    """
+    Tests that LNS improves the initial solution, and returns a consistent
+    result.
+    """
+    data, initial = mk01
+    result = solve_lns(
+        data,
+        initial_solution=initial,
+        neighborhood_size=20,
+        max_iterations=20,
+        seed=1,
+    )
+
+    assert_equal(result.status.value, "Feasible")
+    assert_(result.objective < initial.objective)
+    assert_equal(result.objective, result.best.objective)
+    assert_equal(result.stats.solver, "ortools")
+    assert_("solve" in result.stats.timings)
+
+
+def test_solve_lns_initial_solution(small):
+    """
+    Tests that LNS constructs an initial solution with the heuristic if none
+    is given.
+    """
+    result = solve_lns(small, max_iterations=10, seed=1)
+    assert_equal(result.status.value, "Feasible")
+    assert_equal(result.objective, 3)
+    assert_("initial" in result.stats.timings)
+
+
+def test_solve_lns_initial_solution_not_supported():
+    """
+    Tests that LNS uses the first solution of OR-Tools as initial solution if
+    the heuristic does not support the instance, and returns an optimal
+    result when it reaches the lower bound of that run.
+    """
+    model = Model()
+    machine = model.add_machine()
+    tasks = [model.add_task() for _ in range(2)]
+    for task in tasks:
+        model.add_mode(task, machine, duration=1)
+
+    model.add_consecutive(tasks[0], tasks[1])
+    result = solve_lns(model.data(), max_iterations=10, seed=1)
+    assert_equal(result.status.value, "Optimal")
+    assert_equal(result.objective, 2)
+
+
+def test_solve_lns_on_solution(mk01):
+    """
+    Tests that LNS calls the solution callback with improving solutions, and
+    stops when the callback returns True.
+    """
+    data, initial = mk01
+    results = []
+    solve_lns(
+        data,
+        initial_solution=initial,
+        neighborhood_size=20,
+        max_iterations=20,
+        seed=1,
+        on_solution=results.append,
+    )
+
+    objectives = [result.objective for result in results]
+    assert_(len(objectives) > 1)
+    assert_equal(objectives, sorted(objectives, reverse=True))
+    assert_(all(res.status.value == "Feasible" for res in results))
+
+    result = solve_lns(
+        data,
+        initial_solution=initial,
+        neighborhood_size=20,
+        max_iterations=20,
+        seed=1,
+        on_solution=lambda result: True,
+    )
+    assert_equal(result.objective, objectives[0])
+
+
+def test_solve_lns_parallel(mk01):
+    """
+    Tests that LNS solves sub-problems in parallel processes.
+    """
+    data, initial = mk01
+    result = solve_lns(
+        data,
+        initial_solution=initial,
+        neighborhood_size=20,
+        max_iterations=10,
+        num_parallel=2,
+        seed=1,
+    )
+
+    assert_(result.objective < initial.objective)
+    assert_equal(result.objective, result.best.objective)
+
+
+def test_solve_lns_stop_event(mk01):
+    """
+    Tests that setting the stop event stops the search.
+    """
+    data, initial = mk01
+    stop_event = threading.Event()
+    stop_event.set()
+
+    result = solve_lns(data, initial_solution=initial, stop_event=stop_event)
+    assert_equal(result.best, initial)
+
+
+def test_solve_lns_raises_invalid_arguments(small):
+    """
+    Tests that LNS raises when no neighborhoods are given, or the number of
+    parallel processes or workers is not positive.
+    """
+    with assert_raises(ValueError):
+        solve_lns(small, neighborhoods=[])
+
+    with assert_raises(ValueError):
+        solve_lns(small, num_parallel=0)
+
+    with assert_raises(ValueError):
+        solve_lns(small, num_workers=0)
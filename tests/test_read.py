@@ -69,3 +69,13 @@ def test_aslib():
     for task1, tasks2 in groups:
         constraint = SelectAtLeastOne(tasks2, task1)
         assert_(constraint in data.constraints.select_at_least_one)
+
+
+def test_npy(tmp_path):
+    """
+    Tests that reading an instance in the binary format works correctly.
+    """
+    data = read("data/aslib0_0.rcp", instance_format="aslib")
+    data.to_npy(tmp_path)
+
+    assert_equal(read(str(tmp_path), instance_format="npy"), data)
@@ -1,8 +1,22 @@
+import asyncio
+import importlib
+import multiprocessing
+import os
+import threading
+import time
+from dataclasses import replace
+from itertools import pairwise
+
+import numpy as np
 import pytest
-from numpy.testing import assert_, assert_equal
+from numpy.testing import assert_, assert_equal, assert_raises
 
-from pyjobshop import Model, solve
+from pyjobshop import Model, solve, solve_async, solve_iter, solve_many
+from pyjobshop.heuristics import sgs
+from pyjobshop.Result import ModelStats, Result, SolveStatus
+from pyjobshop.ResultCache import ResultCache
 from pyjobshop.Solution import ScheduledTask, Solution
+from pyjobshop.solvers.ortools import CPModel
 from tests.utils import read
 
 
@@ -142,3 +156,516 @@ def test_solve_time_limit_no_solution(solver):
     assert_equal(result.objective, float("inf"))
     assert_equal(result.lower_bound, 0)
     assert_equal(result.best, Solution(data, []))
+
+
+def test_solve_fallback():
+    """
+    Tests that solve returns the solution of the heuristic when the time limit
+    is reached without finding a feasible solution, and the fallback is
+    enabled.
+    """
+    data = read("data/Mk01.fjs")
+    result = solve(data, time_limit=0, fallback=True)
+
+    assert_equal(result.status.value, "Feasible")
+    assert_equal(result.objective, result.best.objective)
+    assert_(result.objective < float("inf"))
+    assert_("fallback" in result.stats.timings)
+
+    # The heuristic cannot construct a solution for this instance, so the
+    # result is returned as is.
+    data = read("data/PSP1.sch", instance_format="rcpsp_max")
+    result = solve(data, time_limit=0, fallback=True)
+    assert_equal(result.status.value, "Time-limit")
+    assert_equal(result.best, Solution(data, []))
+
+
+def test_solve_cache_dir(small, tmp_path, monkeypatch):
+    """
+    Tests that a cached result is returned without building the model again.
+    """
+    result = solve(small, time_limit=10, cache_dir=tmp_path)
+
+    def raise_error(*args, **kwargs):
+        raise AssertionError("Model should not be built.")
+
+    # The solve module is shadowed by the solve function in the package.
+    module = importlib.import_module("pyjobshop.solve")
+    monkeypatch.setattr(module, "ORToolsModel", raise_error)
+    cached = solve(small, time_limit=10, cache_dir=tmp_path)
+    assert_equal(cached, result)
+
+    # Different parameters do not hit the cache.
+    with pytest.raises(AssertionError):
+        solve(small, time_limit=20, cache_dir=tmp_path)
+
+    # A cache instance can be given instead of its directory.
+    cache = ResultCache(tmp_path, max_size=2**20)
+    assert_equal(solve(small, time_limit=10, cache_dir=cache), result)
+
+
+def test_solve_on_solution(solver):
+    """
+    Tests that the solution callback is called with each improving solution,
+    and that the search stops when the callback returns ``True``.
+    """
+    data = read("data/edata-car1.fjs")
+    results = []
+    result = solve(data, solver, time_limit=10, on_solution=results.append)
+
+    assert_(len(results) > 0)
+    assert_(all(res.status.value == "Feasible" for res in results))
+    assert_equal(results[-1].objective, result.objective)
+
+    objectives = [res.objective for res in results]
+    assert_equal(objectives, sorted(objectives, reverse=True))
+
+    # Stopping at the first solution should not find the optimal solution.
+    result = solve(data, solver, time_limit=10, on_solution=lambda res: True)
+    assert_equal(result.status.value, "Feasible")
+    assert_(result.objective > 6176)
+
+
+def test_solve_iter(solver):
+    """
+    Tests that solve_iter yields the improving solutions, followed by the
+    final result.
+    """
+    data = read("data/edata-car1.fjs")
+    results = list(solve_iter(data, solver, time_limit=10))
+
+    assert_(len(results) > 1)
+    assert_(all(res.status.value == "Feasible" for res in results[:-1]))
+    assert_equal(results[-1].status.value, "Optimal")
+    assert_equal(results[-1].objective, 6176)
+
+    # The final result contains the objective of the last solution.
+    assert_equal(results[-2].objective, results[-1].objective)
+
+
+def test_solve_iter_close_stops_search(solver):
+    """
+    Tests that closing the iterator early stops the search.
+    """
+    data = read("data/edata-car1.fjs")
+    num_threads = threading.active_count()
+
+    results = solve_iter(data, solver, time_limit=10)
+    first = next(results)
+    results.close()
+
+    assert_equal(first.status.value, "Feasible")
+    assert_(first.best.tasks)
+
+    # The solver thread should finish well before the time limit.
+    start = time.perf_counter()
+    while threading.active_count() > num_threads:
+        assert_(time.perf_counter() - start < 5)
+        time.sleep(0.01)
+
+
+def test_solve_iter_raises_solver_errors():
+    """
+    Tests that errors raised while solving are raised by the iterator.
+    """
+    data = read("data/edata-car1.fjs")
+    with pytest.raises(ValueError):
+        list(solve_iter(data, "unknown"))
+
+
+def _job_shop(num_jobs: int = 14, num_machines: int = 9):
+    """
+    Returns a random job shop instance that is not solved to optimality
+    within a few seconds.
+    """
+    rng = np.random.default_rng(1)
+    model = Model()
+    machines = [model.add_machine() for _ in range(num_machines)]
+
+    for _ in range(num_jobs):
+        job = model.add_job()
+        tasks = [model.add_task(job=job) for _ in range(num_machines)]
+
+        for task, idx in zip(tasks, rng.permutation(num_machines)):
+            duration = int(rng.integers(1, 100))
+            model.add_mode(task, machines[idx], duration)
+
+        for task1, task2 in pairwise(tasks):
+            model.add_end_before_start(task1, task2)
+
+    return model.data()
+
+
+def test_solve_stop_event(solver, tmp_path):
+    """
+    Tests that setting the stop event stops the search, and that the result
+    of a stopped search is not cached.
+    """
+    stop_event = threading.Event()
+    stop_event.set()
+
+    start = time.perf_counter()
+    result = solve(
+        _job_shop(),
+        solver,
+        time_limit=60,
+        num_workers=1,
+        stop_event=stop_event,
+        cache_dir=tmp_path,
+    )
+
+    assert_(time.perf_counter() - start < 10)
+    assert_(result.status.value != "Optimal")
+    assert_equal(list(tmp_path.iterdir()), [])
+
+
+def test_solve_async(small, solver):
+    """
+    Tests that solve_async returns the same result as solve.
+    """
+    result = asyncio.run(solve_async(small, solver))
+    assert_equal(result.status.value, "Optimal")
+    assert_equal(result.objective, 3)
+
+
+def test_solve_async_cancel(solver):
+    """
+    Tests that cancelling solve_async stops the search promptly, and returns
+    the best solution found so far.
+    """
+
+    async def solve_and_cancel():
+        task = asyncio.create_task(
+            solve_async(_job_shop(), solver, time_limit=60, num_workers=1)
+        )
+        await asyncio.sleep(1)
+        task.cancel()
+        return await task
+
+    start = time.perf_counter()
+    result = asyncio.run(solve_and_cancel())
+
+    assert_(time.perf_counter() - start < 10)
+    assert_equal(result.status.value, "Feasible")
+    assert_(result.best.tasks)
+
+
+def test_solve_async_does_not_block_event_loop(solver):
+    """
+    Tests that multiple instances can be solved concurrently, without
+    blocking the event loop.
+    """
+
+    async def solve_concurrently():
+        data = _job_shop()
+        tasks = [
+            asyncio.create_task(
+                solve_async(data, solver, time_limit=1, num_workers=1)
+            )
+            for _ in range(2)
+        ]
+
+        num_ticks = 0
+        while not all(task.done() for task in tasks):
+            await asyncio.sleep(0.01)
+            num_ticks += 1
+
+        return num_ticks, [task.result() for task in tasks]
+
+    num_ticks, results = asyncio.run(solve_concurrently())
+    assert_(num_ticks > 10)
+    assert_(all(res.status.value == "Feasible" for res in results))
+
+
+@pytest.mark.parametrize("num_parallel", [1, 2])
+def test_solve_many(solver, num_parallel: int):
+    """
+    Tests that solve_many yields the result of each instance, and that these
+    results match those of solving the instances one by one.
+    """
+    instances = [
+        read("data/small.fjs"),
+        read("data/MFJS1.fjs"),
+        read("data/Mk01.fjs"),
+    ]
+    results = solve_many(
+        instances,
+        num_parallel=num_parallel,
+        workers_per_instance=1,
+        solver=solver,
+        time_limit=10,
+    )
+
+    found = dict(results)
+    assert_equal(sorted(found), [0, 1, 2])
+
+    for idx, data in enumerate(instances):
+        result = found[idx]
+        expected = solve(data, solver, time_limit=10, num_workers=1)
+
+        assert_equal(result.status.value, "Optimal")
+        assert_equal(result.objective, expected.objective)
+        assert_equal(len(result.best.tasks), data.num_tasks)
+        assert_(result.stats.num_variables > 0)
+
+
+def test_solve_many_additional_params(small, capfd):
+    """
+    Tests that solve_many passes additional parameters to the solver in the
+    worker processes.
+    """
+    results = dict(solve_many([small, small], num_parallel=2))
+    assert_equal(results[0].objective, 3)
+    assert_equal(results[1].objective, 3)
+    assert_equal(capfd.readouterr().out, "")
+
+    # The log parameter overrides the display setting, so the workers should
+    # now print the search progress.
+    list(solve_many([small, small], num_parallel=2, log_search_progress=True))
+    assert_(capfd.readouterr().out != "")
+
+
+def test_solve_many_reads_instances_on_demand(small):
+    """
+    Tests that solve_many reads instances from an iterator on demand, rather
+    than reading all instances before starting to solve them.
+    """
+    num_read = 0
+
+    def instances():
+        nonlocal num_read
+        for _ in range(4):
+            num_read += 1
+            yield small
+
+    results = solve_many(instances(), num_parallel=2, workers_per_instance=1)
+    next(results)
+    assert_(num_read < 4)
+
+    assert_equal(len(list(results)), 3)
+    assert_equal(num_read, 4)
+
+
+def test_solve_many_close_stops_running_solves():
+    """
+    Tests that closing solve_many early stops the solves that are still
+    running, instead of waiting for them to reach their time limit.
+    """
+    small = read("data/small.fjs")
+    hard = read("data/PSP1.sch", instance_format="rcpsp_max")  # not solved
+
+    start = time.perf_counter()
+    results = solve_many(
+        [small, hard, hard], num_parallel=2, workers_per_instance=1
+    )
+    for idx, _ in results:
+        assert_equal(idx, 0)
+        break
+
+    results.close()
+    assert_(time.perf_counter() - start < 10)
+
+
+def test_solve_many_empty():
+    """
+    Tests that solve_many yields nothing when there are no instances.
+    """
+    assert_equal(list(solve_many([])), [])
+
+
+def test_solve_many_raises_invalid_parallelism(small):
+    """
+    Tests that solve_many raises when the number of parallel instances or
+    workers per instance is not positive.
+    """
+    with pytest.raises(ValueError):
+        next(solve_many([small], num_parallel=0))
+
+    with pytest.raises(ValueError):
+        next(solve_many([small], workers_per_instance=0))
+
+
+def test_solve_portfolio(require_cpoptimizer):
+    """
+    Tests that the portfolio returns the optimal result, together with the
+    solver that produced it.
+    """
+    data = read("data/MFJS1.fjs")
+    result = solve(data, "portfolio", time_limit=10, num_workers=2)
+
+    assert_equal(result.status.value, "Optimal")
+    assert_equal(result.objective, 468)
+    assert_equal(result.lower_bound, 468)
+    assert_(result.stats.solver in ["ortools", "cpoptimizer"])
+    assert_equal(len(result.best.tasks), data.num_tasks)
+
+
+def test_solve_portfolio_infeasible(require_cpoptimizer):
+    """
+    Tests that the portfolio stops when either solver proves infeasibility.
+    """
+    model = Model()
+    machine = model.add_machine()
+    task = model.add_task(latest_end=1)
+    model.add_mode(task, machine, duration=2)
+
+    result = solve(model.data(), "portfolio", num_workers=2)
+    assert_equal(result.status.value, "Infeasible")
+
+
+def test_solve_portfolio_solver_params(small, require_cpoptimizer, capfd):
+    """
+    Tests that the portfolio passes the parameters of each solver to that
+    solver only, and raises when parameters are not given per solver.
+    """
+    result = solve(
+        small,
+        "portfolio",
+        ortools={"log_search_progress": True},
+        cpoptimizer={"LogVerbosity": "Quiet"},
+    )
+    assert_equal(result.objective, 3)
+    assert_("CP-SAT" in capfd.readouterr().out)
+
+    with assert_raises(ValueError):
+        solve(small, "portfolio", log_search_progress=True)
+
+
+def test_solve_portfolio_on_solution(require_cpoptimizer):
+    """
+    Tests that the portfolio passes only improving incumbents of both solvers
+    to the solution callback.
+    """
+    results = []
+    data = read("data/edata-car1.fjs")
+    solve(data, "portfolio", time_limit=10, on_solution=results.append)
+
+    objectives = [result.objective for result in results]
+    assert_(len(objectives) > 0)
+    assert_(all(obj1 > obj2 for obj1, obj2 in pairwise(objectives)))
+
+    for result in results:
+        assert_(result.stats.solver in ["ortools", "cpoptimizer"])
+
+
+def test_solve_portfolio_stop_event(require_cpoptimizer):
+    """
+    Tests that setting the stop event stops both solvers of the portfolio.
+    """
+    stop_event = threading.Event()
+    threading.Timer(1, stop_event.set).start()
+
+    start = time.perf_counter()
+    result = solve(
+        _job_shop(), "portfolio", time_limit=60, stop_event=stop_event
+    )
+
+    assert_(time.perf_counter() - start < 10)
+    assert_equal(result.status.value, "Feasible")
+    assert_(result.lower_bound < result.objective)
+
+
+def test_solve_portfolio_raises_solver_errors(small, require_cpoptimizer):
+    """
+    Tests that the portfolio raises the errors of its solvers.
+    """
+    with assert_raises(AttributeError):
+        solve(small, "portfolio", ortools={"unknown_parameter": 1})
+
+
+class _StubModel:
+    """
+    Stub of a portfolio solver, which returns the solution of the heuristic
+    with the given status, or exits its process without a result.
+    """
+
+    def __init__(self, data):
+        self.data = data
+
+    def solve(
+        self,
+        time_limit,
+        display,
+        num_workers,
+        initial_solution,
+        on_solution,
+        stop_event,
+        status="Feasible",
+        exit_early=False,
+    ):
+        if exit_early:
+            os._exit(1)
+
+        solution = sgs(self.data)
+        stats = ModelStats(solver="stub")
+        result = Result(
+            solution.objective, 0, SolveStatus(status), 0, solution, stats
+        )
+
+        if on_solution is not None:
+            on_solution(replace(result, status=SolveStatus.FEASIBLE))
+
+        return result
+
+
+@pytest.fixture
+def stub_portfolio(monkeypatch):
+    """
+    Replaces the second solver of the portfolio by a stub. The processes are
+    forked so that they inherit the stub.
+    """
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("Requires the fork start method.")
+
+    def stub_model(data, solver):
+        return CPModel(data) if solver == "ortools" else _StubModel(data)
+
+    module = importlib.import_module("pyjobshop.solve")
+
+    monkeypatch.setattr(
+        module, "MP_CONTEXT", multiprocessing.get_context("fork")
+    )
+    monkeypatch.setattr(module, "_PORTFOLIO", ("ortools", "stub"))
+    monkeypatch.setattr(module, "_model", stub_model)
+
+
+def test_solve_portfolio_merges_results(small, stub_portfolio):
+    """
+    Tests that the portfolio returns the best result of its solvers, with the
+    best lower bound, and passes only improving incumbents to the callback.
+    """
+    results = []
+    result = solve(small, "portfolio", on_solution=results.append)
+
+    assert_equal(result.status.value, "Optimal")
+    assert_equal(result.objective, 3)
+    assert_equal(result.lower_bound, 3)
+    assert_equal(result.stats.solver, "ortools")
+
+    objectives = [result.objective for result in results]
+    assert_(len(objectives) > 0)
+    assert_(all(obj1 > obj2 for obj1, obj2 in pairwise(objectives)))
+
+
+def test_solve_portfolio_stops_when_solver_proves_optimality(stub_portfolio):
+    """
+    Tests that the portfolio stops the other solvers once a solver proves
+    optimality, and prefers that solver's result.
+    """
+    start = time.perf_counter()
+    result = solve(
+        _job_shop(), "portfolio", time_limit=60, stub={"status": "Optimal"}
+    )
+
+    assert_(time.perf_counter() - start < 10)
+    assert_equal(result.status.value, "Optimal")
+    assert_equal(result.stats.solver, "stub")
+
+
+def test_solve_portfolio_raises_solver_exited_early(small, stub_portfolio):
+    """
+    Tests that the portfolio raises when a solver process exits without
+    sending its result.
+    """
+    with assert_raises(RuntimeError):
+        solve(small, "portfolio", stub={"exit_early": True})